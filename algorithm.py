@@ -6,4 +6,6 @@ class Algorithm(Enum):
     Dijkstra = 2
     AStar = 3
     BFS = 4
-    DFS = 5
\ No newline at end of file
+    DFS = 5
+    BiBFS = 6
+    BiAStar = 7
\ No newline at end of file
@@ -1,3 +1,4 @@
+from array import array
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -5,21 +6,46 @@ if TYPE_CHECKING:
 
 from cell import Cell
 from algorithm import Algorithm
-from ascii import ASCII
+from direction import DIR
+from maker import MakerSteps
+from wavefront import Wavefront, pack
+
+# per bit the byte values without it: len(plane.translate(None, UNSET[b]))
+# counts the cells with bit b set in one pass
+UNSET: list[bytes] = [bytes(value for value in range(256) if not value >> b & 1) for b in range(8)]
 
 class Analyzer:
+    # results are cached: the maze analysis until the walls, zones or end
+    # change, a path analysis until that algorithm solves again; pruned, both
+    # only count the cells in the corridor left by dead end filling
     def __init__(self, maze: 'Maze'):
         self.maze: 'Maze' = maze
+        self.maze_cache: tuple[tuple, dict[str, int]] = ((), {})
+        self.path_cache: dict[Algorithm, tuple[tuple, list[Cell], dict[str, int]]] = {}
 
-    def __call__(self, algorithm: Algorithm=Algorithm._NONE) -> dict[str, int]:
+    def __call__(self, algorithm: Algorithm=Algorithm._NONE, pruned: bool=False) -> dict[str, int]:
+        key: tuple = (*self.key(), pruned)
         if algorithm is Algorithm._NONE:
-            return self.analyze_maze()
+            if self.maze_cache[0] != key:
+                self.maze_cache = (key, self.analyze_maze(pruned))
+            return dict(self.maze_cache[1])
         else:
-            return self.analyze_path(algorithm)
+            path: list[Cell] = self.maze.paths[algorithm]
+            cached = self.path_cache.get(algorithm)
+            if cached is None or cached[0] != key or cached[1] is not path:
+                cached = (key, path, self.analyze_path(algorithm, pruned))
+                self.path_cache[algorithm] = cached
+            return dict(cached[2])
+
+    def key(self) -> tuple:
+        maze: 'Maze' = self.maze
+        return (maze.height, maze.width, maze.zobrist, tuple(maze.make.steps.values()), maze.end_pos, maze.contest_mode)
 
 
-    def analyze_path(self, algorithm: Algorithm) -> dict[str, int]:
+    def analyze_path(self, algorithm: Algorithm, pruned: bool=False) -> dict[str, int]:
         path: list[Cell] = self.maze.paths[algorithm]
+        corridor: bytes = self.maze.corridor() if pruned else b''
+        adjacency: array = self.maze.adjacency
 
         length: int = len(path)
 
@@ -32,10 +58,13 @@ class Analyzer:
         branches: int = 0
         for i in range(len(path)):
             cell: Cell = path[i]
-            if len(cell.neighbors(self.maze.maze)) > 2:
+            if pruned:
+                if sum([1 for slot in range(4*cell.index, 4*cell.index+4) if adjacency[slot] >= 0 and corridor[adjacency[slot]]]) > 2:
+                    branches += 1
+            elif self.maze.degree(cell.index) > 2:
                 branches += 1
 
-        visited: int = sum([1 for row in self.maze.maze for cell in row if cell.is_visited(algorithm)])
+        visited: int = len(self.maze.visited_bits.translate(None, UNSET[algorithm.value]))
 
         return {
             'length': length,
@@ -44,18 +73,70 @@ class Analyzer:
             'visited': visited
         }
 
-    def analyze_maze(self) -> dict[str, int]:
-        valid = sum([1 for row in self.maze.maze for cell in row if not cell.forbidden])
+    def analyze_maze(self, pruned: bool=False) -> dict[str, int]:
+        maze: 'Maze' = self.maze
+        height, width = maze.height, maze.width
+        walls: bytearray = maze.walls
 
-        branches = sum([1 for row in self.maze.maze for cell in row if len(cell.neighbors(self.maze.maze)) > 2])
+        valid = maze.forbidden.count(0)
 
-        walls_count: int = str(self.maze).count(ASCII.wall_v) + str(self.maze).count(ASCII.wall_h)
+        # cells with more than two open, allowed neighbors: at least three of
+        # the four direction boards are set
+        wavefront: Wavefront = Wavefront([maze])
+        if pruned:
+            wavefront.allowed &= pack(maze.corridor())
+        allowed: int = wavefront.allowed
+        up: int = wavefront.up & allowed << width
+        right: int = wavefront.right & allowed >> 1
+        down: int = wavefront.down & allowed >> width
+        left: int = wavefront.left & allowed << 1
+        branches: int = (up & right & (down | left) | (up | right) & down & left).bit_count()
 
-        poles_count: int = str(self.maze).count(ASCII.pole)
+        # the ascii render draws the DOWN and RIGHT walls of every cell, and
+        # again those of the last row and column as the top and left border
+        walls_count: int = (
+            len(walls.translate(None, UNSET[DIR.ALL.index(DIR.DOWN)])) +
+            len(walls[(height-1)*width:].translate(None, UNSET[DIR.ALL.index(DIR.DOWN)])) +
+            len(walls.translate(None, UNSET[DIR.ALL.index(DIR.RIGHT)])) +
+            len(walls[width-1::width].translate(None, UNSET[DIR.ALL.index(DIR.RIGHT)]))
+        )
 
-        return {
+        # every pole is drawn except where the ball, end and start zone markers go
+        markers: set[tuple] = set()
+        if maze.make.steps[MakerSteps.ZONES]:
+            markers = {maze.ball_marker, maze.ziel_marker} | {(py, px) for py, px in maze.start_zone-{(1,1)} if py > 0 and px > 0}
+        poles_count: int = (height+1)*(width+1) - len([1 for py, px in markers if py <= height and px <= width])
+
+        # the start to end traversal is shared with every other user of it,
+        # pruned it only has to cover the corridor
+        field: array = maze.distances().field if not pruned else wavefront([[maze.start_pos]])[0]
+        end: int = self.maze.cell(self.maze.end_pos).index
+        shortest: int = field[end] + 1 if field[end] >= 0 else 0
+        reachable: int = len(field) - field.count(-1)
+
+        __: dict[str, int] = {
             'valid': valid,
             'branches': branches,
             'walls': walls_count,
-            'poles': poles_count
-        }
\ No newline at end of file
+            'poles': poles_count,
+            'shortest': shortest,
+            'reachable': reachable
+        }
+        if pruned:
+            __['corridor'] = allowed.bit_count()
+        if self.maze.contest_mode:
+            __['contest'] = int(self.contest_entry(field))
+        return __
+
+    def contest_entry(self, field: array) -> bool:
+        # the end has to be reached and every shortest way in has to come
+        # through the contest entry direction
+        (pos, direction) = self.maze.contest_end
+        end: int = self.maze.cell(pos).index
+        if field[end] <= 0:
+            return False
+        for d in range(4):
+            neighbor: int = self.maze.adjacency[4*end + d]
+            if neighbor >= 0 and field[neighbor] == field[end] - 1 and d != DIR.ALL.index(direction.opposite):
+                return False
+        return True
\ No newline at end of file
@@ -0,0 +1,174 @@
+import os
+import random
+import struct
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from maze import Maze
+
+from direction import DIR, Dir
+from files import LOW, UP, decode, encode
+from maker import MakerSteps
+from observer import Observer
+
+# archive of a test batch (.mzb): the base maze once, every variant as the wall
+# edits the maker made on its copy of the base, little endian
+# - header:  magic, version, length of the base
+# - base:    the .maze encoding of the base maze
+# - records: per variant its hash, the number of edits and the edits
+#            (y, x, direction index, op)
+# - footer:  the record offsets, their count and where they start
+# any variant is the base with its own edits replayed, so reading one costs
+# its edits and not the batch; without the archive a variant is rebuilt from
+# the seed of the base and its number, which is all the catalog keeps of it
+
+MAGIC: bytes = b'MZBA'
+VERSION: int = 1
+HEADER: struct.Struct = struct.Struct('<4sBI')
+RECORD: struct.Struct = struct.Struct('<8sH')
+EDIT: struct.Struct = struct.Struct('<HHBB')
+FOOTER: struct.Struct = struct.Struct('<II')
+
+REMOVE: int = 0
+INSERT: int = 1
+
+
+def stream(seed: int, variant: int) -> random.Random:
+    # the random stream the removed walls of a variant are drawn from
+    return random.Random(f'{seed}.{variant}')
+
+def with_changes(walls: bytes, before: bytes) -> bytes:
+    # the walls with the walls before the last change in the high nibble
+    low: int = int.from_bytes(walls.translate(LOW), 'little')
+    high: int = int.from_bytes(before.translate(UP), 'little')
+    return (low | high).to_bytes(len(walls), 'little')
+
+def make_variant(maze: 'Maze', variant: int, before: bytes | None=None) -> list[tuple[int, int, int, int]]:
+    # draws the removed walls of a variant into a copy of the base in place
+    # and returns its wall edits; given the walls of the variant before, they
+    # go into the high nibble
+    maze.rng = stream(maze.seed, variant)
+    edits: Edits = Edits()
+    maze.observers.append(edits)
+    maze.make(steps=[MakerSteps.MULTIPLE])
+    maze.observers.remove(edits)
+    if before is not None:
+        maze.walls[:] = with_changes(maze.walls, before)
+    return edits.edits
+
+def rebuild(maze: 'Maze', variant: int, changes: bool=True) -> None:
+    # makes the variant in place from the seed of the fresh maze as testbatch
+    # does; with changes the high nibble holds the walls of the variant before
+    maze.make(steps=[MakerSteps.ZONES, MakerSteps.PATH])
+    if variant == 0:
+        return
+
+    before: bytes | None = None
+    if changes:
+        before = bytes(maze.walls)
+        if variant > 1:
+            previous: 'Maze' = maze.copy()
+            make_variant(previous, variant-1)
+            before = bytes(previous.walls)
+    make_variant(maze, variant, before)
+
+
+class Edits(Observer):
+    # collects the wall edits of a maze as (y, x, direction index, op)
+    def __init__(self):
+        self.edits: list[tuple[int, int, int, int]] = []
+
+    def on_wall_removed(self, maze: 'Maze', index: int, direction: Dir) -> None:
+        self.edits.append((*divmod(index, maze.width), DIR.ALL.index(direction), REMOVE))
+
+    def on_wall_inserted(self, maze: 'Maze', index: int, direction: Dir) -> None:
+        self.edits.append((*divmod(index, maze.width), DIR.ALL.index(direction), INSERT))
+
+
+class ArchiveWriter:
+    def __init__(self, path: str, base: 'Maze'):
+        if os.path.dirname(path) and not os.path.exists(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        encoded: bytes = encode(base)
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, len(encoded)) + encoded)
+        self.offsets: list[int] = []
+
+    def add(self, id_hash: str, edits: list[tuple[int, int, int, int]]) -> int:
+        # appends a variant and returns its number, the base is variant 0
+        self.offsets.append(self.file.tell())
+        self.file.write(RECORD.pack(id_hash.encode(), len(edits)) + b''.join([EDIT.pack(*edit) for edit in edits]))
+        return len(self.offsets)
+
+    def close(self) -> None:
+        start: int = self.file.tell()
+        self.file.write(struct.pack(f'<{len(self.offsets)}I', *self.offsets) + FOOTER.pack(len(self.offsets), start))
+        self.file.close()
+
+
+class Archive:
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self.data: bytes = file.read()
+        magic, version, length = HEADER.unpack_from(self.data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} batch archive.")
+        self.base: bytes = self.data[HEADER.size:HEADER.size+length]
+
+        count, start = FOOTER.unpack_from(self.data, len(self.data)-FOOTER.size)
+        self.offsets: tuple[int, ...] = struct.unpack_from(f'<{count}I', self.data, start)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def hash(self, variant: int) -> str:
+        return RECORD.unpack_from(self.data, self.offsets[variant-1])[0].decode()
+
+    def edits(self, variant: int) -> list[tuple[int, int, int, int]]:
+        if variant == 0:
+            return []
+        offset: int = self.offsets[variant-1]
+        _, count = RECORD.unpack_from(self.data, offset)
+        return list(EDIT.iter_unpack(self.data[offset+RECORD.size:offset+RECORD.size+count*EDIT.size]))
+
+    def find(self, id_hash: str) -> int:
+        # the variant with that hash, -1 if there is none
+        for variant in range(1, len(self)+1):
+            if self.hash(variant) == id_hash:
+                return variant
+        return -1
+
+    def load(self, maze: 'Maze', variant: int, changes: bool=True) -> None:
+        # rebuilds the variant in place; with changes the high nibble holds the
+        # walls of the variant before it, as the batch draws its changes
+        decode(maze, self.base)
+        if variant == 0:
+            return
+
+        if changes:
+            before: bytearray = bytearray(maze.walls)
+            for y, x, d, op in self.edits(variant-1):
+                index: int = y*maze.width + x
+                neighbor: int = maze.links[4*index + d]
+                if op == REMOVE:
+                    before[index] &= ~DIR.ALL[d].wall
+                    if neighbor >= 0:
+                        before[neighbor] &= ~DIR.ALL[d].opposite.wall
+                else:
+                    before[index] |= DIR.ALL[d].wall
+                    if neighbor >= 0:
+                        before[neighbor] |= DIR.ALL[d].opposite.wall
+
+        for y, x, d, op in self.edits(variant):
+            if op == REMOVE:
+                maze.make.remove_wall(maze.cell((y, x)), DIR.ALL[d])
+            else:
+                maze.make.insert_wall(maze.cell((y, x)), DIR.ALL[d])
+        maze.make.steps[MakerSteps.MULTIPLE] = True
+        maze.make.steps[MakerSteps.FINAL] = maze.make.steps[MakerSteps.ZONES]
+
+        if changes:
+            maze.walls[:] = with_changes(maze.walls, before)
+
+        maze.hashed = (maze.identity(), self.hash(variant))
+        maze.hash = maze.hashed[1]
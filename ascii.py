@@ -15,4 +15,6 @@ class ASCII:
     cell_path_astar: str = " a "
     cell_path_bfs: str = " b "
     cell_path_dfs: str = " d "
+    cell_path_bibfs: str = " i "
+    cell_path_biastar: str = " s "
     cell_path_general: str = " # "
\ No newline at end of file
@@ -1,51 +1,59 @@
+import heapq
+
+from array import array
+
 from maze import Maze
 from cell import Cell
 from algorithm import Algorithm
+from solver import reconstruct_path
 
 def AStar(maze: Maze, cell: Cell) -> list[Cell]:
-    open_set: set = set([cell])
-    closed_set: set = set()
-    g_costs: dict = {cell: 0}
-    parents: dict[Cell, Cell|None] = {cell: None}
-
-    def heuristic(a: tuple, b: tuple) -> int:
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-    def recursive_a_star(current: Cell) -> list[Cell]:
-        current.visited(Algorithm.AStar)
-        open_set.remove(current)
-        closed_set.add(current)
-
-        maze.visualize(step=True, algorithm=Algorithm.AStar)
-
-        if current.pos == maze.end_pos:
-            return reconstruct_path(current)
-
-        for neighbor, direction in current.neighbors(maze.maze):
-            if neighbor in closed_set or neighbor.forbidden:
+    adjacency: array = maze.adjacency
+    forbidden: bytearray = maze.forbidden
+    width: int = maze.width
+    bit: int = 1 << Algorithm.AStar.value
+    on_visit = maze.observers.on_visit if maze.observers else None
+    end: int = maze.cell(maze.end_pos).index
+    end_y, end_x = maze.end_pos
+
+    g_costs: array = array('i', [-1])*len(maze.walls)
+    parents: array = array('i', [-1])*len(maze.walls)
+    closed: bytearray = bytearray(len(maze.walls))
+    g_costs[cell.index] = 0
+
+    def heuristic(index: int) -> int:
+        y, x = divmod(index, width)
+        return abs(y - end_y) + abs(x - end_x)
+
+    # entries are (f cost, order, index), an improved g cost pushes a new entry
+    # and the outdated one is skipped once it surfaces (lazy decrease-key)
+    order: int = 0
+    open_set: list[tuple[int, int, int]] = [(heuristic(cell.index), order, cell.index)]
+
+    while open_set:
+        _, _, current = heapq.heappop(open_set)
+        if closed[current]:
+            continue
+        closed[current] = 1
+        maze.visited_bits[current] |= bit
+
+        if on_visit:
+            on_visit(maze, current, Algorithm.AStar)
+
+        if current == end:
+            return reconstruct_path(maze, parents, current, Algorithm.AStar)
+
+        for slot in range(4*current, 4*current+4):
+            neighbor: int = adjacency[slot]
+            if neighbor < 0 or forbidden[neighbor] or closed[neighbor]:
                 continue
 
             tentative_g_cost: int = g_costs[current] + 1
 
-            if neighbor.pos not in g_costs or tentative_g_cost < g_costs[neighbor.pos]:
+            if g_costs[neighbor] == -1 or tentative_g_cost < g_costs[neighbor]:
                 g_costs[neighbor] = tentative_g_cost
                 parents[neighbor] = current
+                order += 1
+                heapq.heappush(open_set, (tentative_g_cost + heuristic(neighbor), order, neighbor))
 
-                if not any(node.pos == neighbor.pos for node in open_set):
-                    open_set.add(neighbor)
-
-        if not open_set:
-            return []
-
-        open_list: list[Cell] = list(open_set)
-        open_list.sort(key=lambda n: g_costs[n] + heuristic(n.pos, maze.end_pos))
-        return recursive_a_star(open_list[0])
-        
-    
-    def reconstruct_path(current: Cell|None) -> list[Cell]:
-        if current is None:
-            return []
-        current.path(Algorithm.AStar)
-        return reconstruct_path(parents.get(current)) + [current]
-
-    return recursive_a_star(cell)
\ No newline at end of file
+    return []
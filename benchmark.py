@@ -0,0 +1,39 @@
+import sys
+import time
+
+from maze import Maze
+from algorithm import Algorithm
+
+# scaling of the queue based solvers over the maze area
+# benchmark.py [<max size>]
+# e.g. python benchmark.py 512
+
+def benchmark(sizes: list[int], algorithms: list[Algorithm]) -> str:
+    __: str = ""
+    __ += f"> Solver Benchmark\n\n"
+    __ += f"       size |    cells |"
+    for algorithm in algorithms:
+        __ += f" {algorithm.name:>9} s | us/cell |"
+    __ += "\n"
+    __ += f"  ----------|----------|" + len(algorithms)*"-------------|---------|" + "\n"
+    print(__, end="", flush=True)
+
+    for size in sizes:
+        maze: Maze = Maze(size=(size, size))
+        maze.make()
+
+        line: str = f" {size:>4}x{size:<5} | {size*size:8} |"
+        for algorithm in algorithms:
+            start: float = time.perf_counter()
+            maze.solve(algorithms=[algorithm])
+            elapsed: float = time.perf_counter() - start
+            line += f" {elapsed:11.4f} | {elapsed/(size*size)*1e6:7.3f} |"
+        print(line, flush=True)
+        __ += line + "\n"
+    return __
+
+
+if __name__ == '__main__':
+    max_size: int = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+    sizes: list[int] = [size for size in (16, 32, 64, 128, 256, 512, 1024) if size <= max_size]
+    benchmark(sizes=sizes, algorithms=[Algorithm.BFS, Algorithm.FloodFill])
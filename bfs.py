@@ -1,30 +1,38 @@
+from array import array
+from collections import deque
+
 from maze import Maze
 from cell import Cell
 from algorithm import Algorithm
+from solver import reconstruct_path
 
 def BFS(maze: Maze, cell: Cell) -> list[Cell]:
-    queue: list[Cell] = [cell]
-    parents: dict[Cell, Cell|None] = {cell: None}
+    adjacency: array = maze.adjacency
+    forbidden: bytearray = maze.forbidden
+    bit: int = 1 << Algorithm.BFS.value
+    on_visit = maze.observers.on_visit if maze.observers else None
+    end: int = maze.cell(maze.end_pos).index
+
+    queue: deque[int] = deque([cell.index])
+    parents: array = array('i', [-1])*len(maze.walls)
+    seen: bytearray = bytearray(len(maze.walls))
+    seen[cell.index] = 1
     
     while queue:
-        current: Cell|None = queue.pop(0)
-        current.visited(Algorithm.BFS)
+        current: int = queue.popleft()
+        maze.visited_bits[current] |= bit
         
-        maze.visualize(step=True, algorithm=Algorithm.BFS)
+        if on_visit:
+            on_visit(maze, current, Algorithm.BFS)
         
-        if current.pos == maze.end_pos:
-            path: list[Cell] = []
-            while current is not None:
-                path.append(current)
-                current.path(Algorithm.BFS)
-                current = parents.get(current)
-            path.reverse()
-            return path
+        if current == end:
+            return reconstruct_path(maze, parents, current, Algorithm.BFS)
 
-        for neighbor, direction in current.neighbors(maze.maze):
-            if neighbor.is_visited(Algorithm.BFS) or neighbor.forbidden:
+        for slot in range(4*current, 4*current+4):
+            neighbor: int = adjacency[slot]
+            if neighbor < 0 or forbidden[neighbor] or seen[neighbor]:
                 continue
-            if neighbor not in parents:
-                parents[neighbor] = current
-                queue.append(neighbor)
-    return []
\ No newline at end of file
+            seen[neighbor] = 1
+            parents[neighbor] = current
+            queue.append(neighbor)
+    return []
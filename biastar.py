@@ -0,0 +1,86 @@
+import heapq
+
+from array import array
+
+from maze import Maze
+from cell import Cell
+from algorithm import Algorithm
+from solver import mark_path
+
+def BiAStar(maze: Maze, cell: Cell) -> list[Cell]:
+    # a* from the start towards the end and from the end towards the start,
+    # always one step of the side with the smaller open set; the best meeting
+    # is final once the lowest f cost of either side can't beat it
+    adjacency: array = maze.adjacency
+    forbidden: bytearray = maze.forbidden
+    width: int = maze.width
+    bit: int = 1 << Algorithm.BiAStar.value
+    on_visit = maze.observers.on_visit if maze.observers else None
+    start: int = cell.index
+    end: int = maze.cell(maze.end_pos).index
+    goals: list[tuple[int, int]] = [divmod(end, width), divmod(start, width)]
+
+    g_costs: list[array] = [array('i', [-1])*len(maze.walls) for _ in range(2)]
+    parents: list[array] = [array('i', [-1])*len(maze.walls) for _ in range(2)]
+    closed: list[bytearray] = [bytearray(len(maze.walls)) for _ in range(2)]
+    g_costs[0][start] = 0
+    g_costs[1][end] = 0
+
+    def heuristic(side: int, index: int) -> int:
+        y, x = divmod(index, width)
+        return abs(y - goals[side][0]) + abs(x - goals[side][1])
+
+    # entries are (f cost, order, index) with lazy decrease-key as in AStar
+    order: int = 0
+    open_sets: list[list[tuple[int, int, int]]] = [[(heuristic(0, start), 0, start)], [(heuristic(1, end), 0, end)]]
+
+    # (length, meeting cell), the meeting cell is reached by both sides
+    best: tuple[int, int] | None = (0, start) if start == end else None
+    while True:
+        for open_set, closed_ in zip(open_sets, closed):
+            while open_set and closed_[open_set[0][2]]:
+                heapq.heappop(open_set)
+        if not open_sets[0] or not open_sets[1]:
+            break
+        if best is not None and (open_sets[0][0][0] >= best[0] or open_sets[1][0][0] >= best[0]):
+            break
+
+        side: int = 0 if len(open_sets[0]) <= len(open_sets[1]) else 1
+        own, other = g_costs[side], g_costs[1-side]
+        _, _, current = heapq.heappop(open_sets[side])
+        closed[side][current] = 1
+        maze.visited_bits[current] |= bit
+
+        if on_visit:
+            on_visit(maze, current, Algorithm.BiAStar)
+
+        for slot in range(4*current, 4*current+4):
+            neighbor: int = adjacency[slot]
+            if neighbor < 0 or forbidden[neighbor] or closed[side][neighbor]:
+                continue
+
+            tentative_g_cost: int = own[current] + 1
+
+            if own[neighbor] == -1 or tentative_g_cost < own[neighbor]:
+                own[neighbor] = tentative_g_cost
+                parents[side][neighbor] = current
+                order += 1
+                heapq.heappush(open_sets[side], (tentative_g_cost + heuristic(side, neighbor), order, neighbor))
+                if other[neighbor] >= 0 and (best is None or tentative_g_cost + other[neighbor] < best[0]):
+                    best = (tentative_g_cost + other[neighbor], neighbor)
+
+    if best is None:
+        return []
+
+    _, meeting = best
+    indices: list[int] = []
+    current: int = meeting
+    while current >= 0:
+        indices.append(current)
+        current = parents[0][current]
+    indices.reverse()
+    current = parents[1][meeting]
+    while current >= 0:
+        indices.append(current)
+        current = parents[1][current]
+    return mark_path(maze, indices, Algorithm.BiAStar)
@@ -0,0 +1,66 @@
+from array import array
+
+from maze import Maze
+from cell import Cell
+from algorithm import Algorithm
+from solver import mark_path
+
+def BiBFS(maze: Maze, cell: Cell) -> list[Cell]:
+    # breadth first from the start and from the end at once, always a whole
+    # layer of the smaller frontier; the first layer that touches the other
+    # side holds the meeting with the shortest way through it
+    adjacency: array = maze.adjacency
+    forbidden: bytearray = maze.forbidden
+    bit: int = 1 << Algorithm.BiBFS.value
+    on_visit = maze.observers.on_visit if maze.observers else None
+    start: int = cell.index
+    end: int = maze.cell(maze.end_pos).index
+
+    # per side: steps from its origin (-1 unseen) and the way back to it
+    distances: list[array] = [array('i', [-1])*len(maze.walls) for _ in range(2)]
+    parents: list[array] = [array('i', [-1])*len(maze.walls) for _ in range(2)]
+    frontiers: list[list[int]] = [[start], [end]]
+    distances[0][start] = 0
+    distances[1][end] = 0
+
+    meeting: tuple[int, int, int] | None = None
+    if start == end:
+        meeting = (0, start, -1)
+    while meeting is None and frontiers[0] and frontiers[1]:
+        side: int = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        own, other = distances[side], distances[1-side]
+        layer: list[int] = []
+        for current in frontiers[side]:
+            maze.visited_bits[current] |= bit
+            if on_visit:
+                on_visit(maze, current, Algorithm.BiBFS)
+
+            for slot in range(4*current, 4*current+4):
+                neighbor: int = adjacency[slot]
+                if neighbor < 0 or forbidden[neighbor]:
+                    continue
+                if other[neighbor] >= 0:
+                    length: int = own[current] + 1 + other[neighbor]
+                    if meeting is None or length < meeting[0]:
+                        # (length, last cell on the start side, first on the end side)
+                        meeting = (length, current, neighbor) if side == 0 else (length, neighbor, current)
+                if own[neighbor] >= 0:
+                    continue
+                own[neighbor] = own[current] + 1
+                parents[side][neighbor] = current
+                layer.append(neighbor)
+        frontiers[side] = layer
+
+    if meeting is None:
+        return []
+
+    _, current, after = meeting
+    indices: list[int] = []
+    while current >= 0:
+        indices.append(current)
+        current = parents[0][current]
+    indices.reverse()
+    while after >= 0:
+        indices.append(after)
+        after = parents[1][after]
+    return mark_path(maze, indices, Algorithm.BiBFS)
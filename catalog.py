@@ -0,0 +1,134 @@
+import sqlite3
+import time
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from maze import Maze
+
+from algorithm import Algorithm
+
+# index of all mazes written in the working directory: hash -> file location
+# (or only the seed, a maze can always be rebuilt from it) and the analysis
+# of every algorithm that solved it, so nothing has to rescan the folders
+
+CATALOG: str = 'catalog.sqlite'
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS mazes (
+    hash TEXT PRIMARY KEY,
+    height INTEGER NOT NULL,
+    width INTEGER NOT NULL,
+    contest INTEGER NOT NULL,
+    remove_walls INTEGER NOT NULL,
+    seed INTEGER NOT NULL,
+    folder TEXT,
+    file TEXT,
+    saved REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    hash TEXT NOT NULL REFERENCES mazes(hash),
+    algorithm TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    turns INTEGER NOT NULL,
+    branches INTEGER NOT NULL,
+    visited INTEGER NOT NULL,
+    PRIMARY KEY (hash, algorithm)
+);
+CREATE INDEX IF NOT EXISTS metrics_length ON metrics (algorithm, length);
+CREATE INDEX IF NOT EXISTS mazes_size ON mazes (height, width, contest);
+"""
+
+# seeds are unsigned 64 bit and sqlite integers signed, the upper half is
+# stored as its two's complement
+SIGN: int = 2**63
+
+
+def signed(seed: int) -> int:
+    return seed - 2*SIGN if seed >= SIGN else seed
+
+def unsigned(seed: int) -> int:
+    return seed + 2*SIGN if seed < 0 else seed
+
+
+class Catalog:
+    def __init__(self, path: str=CATALOG):
+        self.connection: sqlite3.Connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def add(self, maze: 'Maze', foldername: str='', filename: str='') -> None:
+        # the maze and the analysis of every algorithm that solved it
+        self.record(
+            id_hash=maze.hash,
+            size=(maze.height, maze.width),
+            contest_mode=maze.contest_mode,
+            remove_walls=maze.remove_walls,
+            seed=maze.seed,
+            foldername=foldername,
+            filename=filename,
+            metrics={algorithm: maze.analyze(algorithm) for algorithm in maze.solved}
+        )
+
+    def record(self, id_hash: str, size: tuple[int, int], contest_mode: bool, remove_walls: int, seed: int,
+               foldername: str='', filename: str='', metrics: dict[Algorithm, dict[str, int]]={}) -> None:
+        # a known location is kept when the maze is recorded again without one,
+        # everything else is replaced, so a stale entry is corrected
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO mazes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (hash) DO UPDATE SET "
+                "height = excluded.height, width = excluded.width, contest = excluded.contest, "
+                "remove_walls = excluded.remove_walls, seed = excluded.seed, "
+                "folder = COALESCE(excluded.folder, folder), file = COALESCE(excluded.file, file), saved = excluded.saved",
+                (id_hash, size[0], size[1], int(contest_mode), remove_walls, signed(seed), foldername or None, filename or None, time.time())
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO metrics VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (id_hash, algorithm.name, analysis['length'], analysis['turns'], analysis['branches'], analysis['visited'])
+                    for algorithm, analysis in metrics.items()
+                ]
+            )
+
+    def find(self, id_hash: str) -> tuple | None:
+        # (height, width, contest, remove_walls, seed, folder, file) of a hash
+        row: tuple | None = self.connection.execute(
+            "SELECT height, width, contest, remove_walls, seed, folder, file FROM mazes WHERE hash = ?",
+            (id_hash,)
+        ).fetchone()
+        return (*row[:4], unsigned(row[4]), *row[5:]) if row is not None else None
+
+    def query(self, size: tuple[int, int] | None=None, contest_mode: bool | None=None, algorithm: Algorithm | None=None,
+              min_length: int | None=None, max_length: int | None=None) -> list[tuple]:
+        # (hash, height, width, contest, seed, folder, file[, length, turns,
+        # branches, visited]) of the matching mazes, with an algorithm the rows
+        # carry its metrics and are sorted by its path length
+        columns: str = "mazes.hash, height, width, contest, seed, folder, file"
+        tables: str = "mazes"
+        conditions: list[str] = []
+        parameters: list = []
+        if size is not None:
+            conditions += ["height = ?", "width = ?"]
+            parameters += [size[0], size[1]]
+        if contest_mode is not None:
+            conditions.append("contest = ?")
+            parameters.append(int(contest_mode))
+        if algorithm is not None:
+            columns += ", length, turns, branches, visited"
+            tables += " JOIN metrics ON metrics.hash = mazes.hash"
+            conditions.append("algorithm = ?")
+            parameters.append(algorithm.name)
+            if min_length is not None:
+                conditions.append("length >= ?")
+                parameters.append(min_length)
+            if max_length is not None:
+                conditions.append("length <= ?")
+                parameters.append(max_length)
+
+        __: str = f"SELECT {columns} FROM {tables}"
+        if conditions:
+            __ += " WHERE " + " AND ".join(conditions)
+        __ += " ORDER BY length" if algorithm is not None else " ORDER BY saved"
+        return [(*row[:4], unsigned(row[4]), *row[5:]) for row in self.connection.execute(__, parameters)]
@@ -1,57 +1,92 @@
-import random
-
 from enum import Enum
 from algorithm import Algorithm
 from direction import DIR, Dir
 
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from maze import Maze
+
+
 class Cell:
-    def __init__(self, pos:tuple[int, int]):
+    # a cell is a light view into the flat planes of its maze,
+    # all state lives in the maze and is indexed by y*width+x
+    __slots__ = ('maze', 'index', 'y', 'x')
+
+    def __init__(self, maze: 'Maze', pos: tuple[int, int]):
+        self.maze: 'Maze' = maze
         self.y: int = pos[0]
         self.x: int = pos[1]
-        self.pos: tuple = pos
-        self.walls: int = 0xFF
-        self.zone: Zone = Zone.NONE
-        self.forbidden: bool = False
-        self._visited: set[Algorithm] = set()
-        self._paths: set[Algorithm] = set()
+        self.index: int = pos[0]*maze.width + pos[1]
+
+    @property
+    def pos(self) -> tuple:
+        return (self.y, self.x)
+
+    @property
+    def walls(self) -> int:
+        return self.maze.walls[self.index]
+
+    @walls.setter
+    def walls(self, walls: int) -> None:
+        self.maze.set_walls(self.index, walls & 0xFF)
+
+    @property
+    def zone(self) -> 'Zone':
+        return ZONES[self.maze.zones[self.index]]
+
+    @zone.setter
+    def zone(self, zone: 'Zone') -> None:
+        self.maze.zones[self.index] = zone.value
+
+    @property
+    def forbidden(self) -> bool:
+        return bool(self.maze.forbidden[self.index])
+
+    @forbidden.setter
+    def forbidden(self, forbidden: bool) -> None:
+        self.maze.forbidden[self.index] = forbidden
 
     def path(self, algorithm:Algorithm):
-        self._paths.add(algorithm)
+        self.maze.path_bits[self.index] |= 1 << algorithm.value
 
     def visited(self, algorithm:Algorithm):
-        self._visited.add(algorithm)
+        self.maze.visited_bits[self.index] |= 1 << algorithm.value
 
     def is_path(self, algorithm:Algorithm|None=None):
         if algorithm:
-            return algorithm in self._paths
-        return bool(self._paths)
-    
+            return bool(self.maze.path_bits[self.index] & 1 << algorithm.value)
+        return bool(self.maze.path_bits[self.index])
+
     def is_visited(self, algorithm:Algorithm|None=None):
         if algorithm:
-            return algorithm in self._visited
-        return bool(self._visited)
+            return bool(self.maze.visited_bits[self.index] & 1 << algorithm.value)
+        return bool(self.maze.visited_bits[self.index])
 
-    def neighbors(self, maze: list[list['Cell']], all: bool=False) -> list[tuple['Cell', Dir]]:
+    def neighbors(self, all: bool=False, shuffle: bool=False) -> list[tuple['Cell', Dir]]:
+        maze: 'Maze' = self.maze
+        table = maze.links if all else maze.adjacency
         neighbors: list[tuple[Cell, Dir]] = []
-        for direction in [DIR.UP, DIR.RIGHT, DIR.DOWN, DIR.LEFT]:
-            if not all and self.walls & direction.wall:
+        for d, direction in enumerate(DIR.ALL):
+            index: int = table[4*self.index + d]
+            if index < 0 or not all and maze.forbidden[index]:
                 continue
-            (y, x) = (self.y + direction.y, self.x + direction.x)
-            (height, width) = (len(maze), len(maze[0]))
-            if 0 <= y < height and 0 <= x < width:
-                neighbor: Cell = maze[y][x]
-                if all or not neighbor.forbidden:
-                    neighbors.append((neighbor, direction))
-        random.shuffle(neighbors)
+            neighbors.append((Cell(maze, divmod(index, maze.width)), direction))
+        if shuffle:
+            maze.rng.shuffle(neighbors)
         return neighbors
-    
-    def neighbor(self, maze: list[list['Cell']], direction: Dir=DIR._EMPTY, all=False) -> tuple['Cell', Dir]:
-        neighbors: list[tuple[Cell, Dir]] = self.neighbors(maze=maze, all=all)
+
+    def neighbor(self, direction: Dir=DIR._EMPTY, all=False, shuffle: bool=False) -> tuple['Cell', Dir]:
         if not direction == DIR._EMPTY:
             y, x = (self.y + direction.y, self.x + direction.x)
-            return (maze[y][x], direction)
+            return (Cell(self.maze, (y, x)), direction)
         else:
-            return neighbors[0]
+            return self.neighbors(all=all, shuffle=shuffle)[0]
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Cell) and self.maze is other.maze and self.index == other.index
+
+    def __hash__(self) -> int:
+        return self.index
 
     def __str__(self):
         return f"({self.y}, {self.x})"
@@ -64,3 +99,5 @@ class Zone(Enum):
     NONE = 0
     START = 1
     END = 2
+
+ZONES: tuple[Zone, ...] = tuple(Zone)
@@ -0,0 +1,19 @@
+from typing import Callable
+
+import pytest
+
+from maze import Maze
+
+# the mazes of the tests come from fixed seeds; 16x16 unless a test needs
+# another size, smaller mazes leave the wall remover no walls to take
+
+
+def make(seed: int, size: tuple[int, int]=(16, 16), remove_walls: int=15, contest_mode: bool=False) -> Maze:
+    maze: Maze = Maze(size=size, remove_walls=remove_walls, contest_mode=contest_mode, seed=seed)
+    maze.make()
+    return maze
+
+
+@pytest.fixture
+def made() -> Callable[..., Maze]:
+    return make
@@ -0,0 +1,34 @@
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from maze import Maze
+
+from wavefront import Wavefront, spread
+
+# dead end filling on the wavefront bitboards: every round seals all cells of
+# the remaining set with at most one open neighbor in it, except the start and
+# the end, at once; what is left when nothing more can be sealed are the cells
+# on some way from the start to the end (loops included), the corridor
+
+
+def fill_dead_ends(maze: 'Maze') -> int:
+    # the corridor as a bitboard, bit i is the cell y*width+x
+    wavefront: Wavefront = Wavefront([maze])
+    width: int = maze.width
+    keep: int = wavefront.board([[maze.start_pos, maze.end_pos]])
+    remaining: int = wavefront.allowed
+    while True:
+        up: int = wavefront.up & remaining << width
+        right: int = wavefront.right & remaining >> 1
+        down: int = wavefront.down & remaining >> width
+        left: int = wavefront.left & remaining << 1
+        # two or more of the four direction boards set
+        passing: int = up & (right | down | left) | right & (down | left) | down & left
+        dead: int = remaining & ~passing & ~keep
+        if not dead:
+            return remaining
+        remaining ^= dead
+
+def corridor(maze: 'Maze') -> bytes:
+    # one byte per cell, 1 where the cell is in the corridor
+    size: int = maze.height*maze.width
+    return spread(fill_dead_ends(maze), size).to_bytes(size, 'little')
@@ -1,28 +1,50 @@
+from array import array
+
 from maze import Maze
 from cell import Cell
 from algorithm import Algorithm
+from solver import mark_path
 
 def DFS(maze: Maze, cell: Cell) -> list[Cell]:
-    path: list[Cell] = []
-
-    def recursive_DFS(cell: Cell) -> list[Cell]:
-        cell.visited(Algorithm.DFS)
-        
-        maze.visualize(step=True, algorithm=Algorithm.DFS)
-
-        if cell.pos == maze.end_pos:
-            cell.path(Algorithm.DFS)
-            return [cell]
-        for neighbor, direction in cell.neighbors(maze.maze):
-            if neighbor.is_visited(Algorithm.DFS) or neighbor.forbidden:
-                continue
-            path = recursive_DFS(neighbor)
-            if path:
-                path.append(cell)
-                cell.path(Algorithm.DFS)
-                return path
-        return []
-    
-    path = recursive_DFS(cell)
-    path.reverse()
-    return path
\ No newline at end of file
+    adjacency: array = maze.adjacency
+    forbidden: bytearray = maze.forbidden
+    bit: int = 1 << Algorithm.DFS.value
+    on_visit = maze.observers.on_visit if maze.observers else None
+    end: int = maze.cell(maze.end_pos).index
+
+    # the stack holds the current branch from the start, so every entry is
+    # the predecessor of the one above it; cursors track the next wall slot
+    stack: array = array('i')
+    cursors: bytearray = bytearray()
+    closed: bytearray = bytearray(len(maze.walls))
+
+    def enter(index: int) -> bool:
+        closed[index] = 1
+        maze.visited_bits[index] |= bit
+        stack.append(index)
+        cursors.append(0)
+
+        if on_visit:
+            on_visit(maze, index, Algorithm.DFS)
+
+        return index == end
+
+    if enter(cell.index):
+        return mark_path(maze, stack, Algorithm.DFS)
+
+    while stack:
+        current: int = stack[-1]
+        cursor: int = cursors[-1]
+        if cursor == 4:
+            stack.pop()
+            cursors.pop()
+            continue
+        cursors[-1] = cursor + 1
+
+        neighbor: int = adjacency[4*current + cursor]
+        if neighbor < 0 or forbidden[neighbor] or closed[neighbor]:
+            continue
+        if enter(neighbor):
+            return mark_path(maze, stack, Algorithm.DFS)
+
+    return []
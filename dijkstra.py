@@ -1,41 +1,51 @@
+import heapq
+
+from array import array
+
 from algorithm import Algorithm
 from cell import Cell
 from maze import Maze
+from solver import reconstruct_path
 
 def Djikstra(maze: Maze, cell: Cell) -> list[Cell]:
-    distances: list[list[int]] = [[-1 for _ in range(maze.width)] for _ in range(maze.height)]
-    distances[cell.y][cell.x] = 0
-    parents: dict[Cell, Cell|None] = {cell: None}
-    queue: list[Cell] = [cell]
+    adjacency: array = maze.adjacency
+    forbidden: bytearray = maze.forbidden
+    bit: int = 1 << Algorithm.Dijkstra.value
+    on_visit = maze.observers.on_visit if maze.observers else None
+    end: int = maze.cell(maze.end_pos).index
+
+    distances: array = array('i', [-1])*len(maze.walls)
+    parents: array = array('i', [-1])*len(maze.walls)
+    closed: bytearray = bytearray(len(maze.walls))
+    distances[cell.index] = 0
 
-    def recursive_djikstra() -> list[Cell]:        
-        current = queue.pop(0)
-        current.visited(Algorithm.Dijkstra)
+    # entries are (distance, order, index), the order keeps ties first in first out;
+    # improved distances are pushed again and stale entries skipped when popped
+    order: int = 0
+    queue: list[tuple[int, int, int]] = [(0, order, cell.index)]
 
-        maze.visualize(step=True, algorithm=Algorithm.Dijkstra)
+    while queue:
+        distance, _, current = heapq.heappop(queue)
+        if closed[current]:
+            continue
+        closed[current] = 1
+        maze.visited_bits[current] |= bit
 
-        if current.pos == maze.end_pos:
-            return [current]
+        if on_visit:
+            on_visit(maze, current, Algorithm.Dijkstra)
 
-        for neighbor, direction in current.neighbors(maze.maze):
-            if neighbor.is_visited(Algorithm.Dijkstra) or neighbor.forbidden:
+        if current == end:
+            return reconstruct_path(maze, parents, current, Algorithm.Dijkstra)
+
+        for slot in range(4*current, 4*current+4):
+            neighbor: int = adjacency[slot]
+            if neighbor < 0 or forbidden[neighbor] or closed[neighbor]:
                 continue
-            tentative_distance: int = distances[current.y][current.x] + 1
-            if distances[neighbor.y][neighbor.x] == -1 or tentative_distance < distances[neighbor.y][neighbor.x]:
-                distances[neighbor.y][neighbor.x] = tentative_distance
+            tentative_distance: int = distance + 1
+            if distances[neighbor] == -1 or tentative_distance < distances[neighbor]:
+                distances[neighbor] = tentative_distance
                 parents[neighbor] = current
-                queue.append(neighbor)
-
-        if not queue:
-            return []
-        return recursive_djikstra()
-    
-    def reconstruct_path(current) -> list[Cell]:
-        if current is None:
-            return []
-        current.path(Algorithm.Dijkstra)
-        return reconstruct_path(parents.get(current)) + [current]
-    
-    current = recursive_djikstra()[0]
-
-    return reconstruct_path(current)
\ No newline at end of file
+                order += 1
+                heapq.heappush(queue, (tentative_distance, order, neighbor))
+
+    return []
@@ -16,6 +16,13 @@ class Dir:
     def __str__(self):
         return self.name
 
+    # the directions are shared constants, copies of a maze keep them
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo: dict):
+        return self
+
 
 class DIR:
     UP: Dir = Dir(move=(-1, 0), wall=0x01, name="UP")
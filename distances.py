@@ -0,0 +1,77 @@
+from array import array
+from functools import cached_property
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from maze import Maze
+
+from wavefront import Wavefront
+
+# one traversal from any number of sources answers every target at once: the
+# distance field comes from the wavefront, and the predecessor of a cell is its
+# first open neighbor (UP, RIGHT, DOWN, LEFT) one step closer to a source, so
+# following the predecessors walks a shortest way back to the nearest source
+
+
+class Distances:
+    def __init__(self, maze: 'Maze', sources: list[tuple[int, int]], opened: list[tuple[int, int]]=[]):
+        self.maze: 'Maze' = maze
+        self.identity: tuple = maze.identity()
+        self.sources: tuple[tuple[int, int], ...] = tuple(sources)
+        # the opened cells can be entered even if they are forbidden
+        forbidden: bytearray = maze.forbidden
+        if opened:
+            maze.forbidden = bytearray(forbidden)
+            for y, x in opened:
+                maze.forbidden[y*maze.width + x] = 0
+        try:
+            # flat array (y*width+x), -1 where unreachable
+            self.field: array = Wavefront([maze])([list(sources)])[0]
+        finally:
+            maze.forbidden = forbidden
+
+    @cached_property
+    def parents(self) -> array:
+        # flat predecessors, -1 for the sources and where unreachable; built
+        # on first use, most users only read the field
+        if self.maze.identity() != self.identity:
+            raise ValueError("The walls of the maze changed since its distances were taken.")
+        field: array = self.field
+        adjacency: array = self.maze.adjacency
+        __: array = array('i', [-1])*len(field)
+        for index, distance in enumerate(field):
+            if distance <= 0:
+                continue
+            for slot in range(4*index, 4*index+4):
+                neighbor: int = adjacency[slot]
+                if neighbor >= 0 and field[neighbor] == distance-1:
+                    __[index] = neighbor
+                    break
+        return __
+
+    def distance(self, target: tuple[int, int]) -> int:
+        # steps from the nearest source, -1 if it can't be reached
+        return self.field[target[0]*self.maze.width + target[1]]
+
+    def nearest(self, targets: list[tuple[int, int]]=[]) -> tuple[int, int] | None:
+        # the closest reachable of the targets (default the end), the first
+        # one given wins ties; forbidden targets are only reachable if they
+        # were opened, and in a made maze the goal cells besides the end are
+        # only open towards the end, so it is the nearest until walls change
+        reachable: list[tuple[int, int]] = [target for target in targets or [self.maze.end_pos] if self.distance(target) >= 0]
+        return min(reachable, key=self.distance) if reachable else None
+
+    def path(self, target: tuple[int, int] | None=None) -> list[int]:
+        # cell indices from a source to the target (default the end), empty if
+        # it can't be reached
+        if target is None:
+            target = self.maze.end_pos
+        if self.distance(target) < 0:
+            return []
+        current: int = target[0]*self.maze.width + target[1]
+        __: list[int] = []
+        while current >= 0:
+            __.append(current)
+            current = self.parents[current]
+        __.reverse()
+        return __
@@ -1,14 +1,85 @@
 import os
-import pickle
+import struct
 
-from maker import Maker
-from visualizer import Visualizer
-from solver import Solver
-from analyzer import Analyzer
+from maker import MakerSteps
+from catalog import Catalog
 
 from direction import DIR
 from ascii import ASCII
 
+# binary maze file (.maze), little endian
+# - header: magic, version, flags, height, width, start y x, end y x,
+#           contest end y x and direction index, maker steps (bit per step),
+#           removed walls, seed, hash
+# - walls:  two cells per byte, cell 2k in the low and 2k+1 in the high nibble;
+#           with FULL set one byte per cell, keeping the high nibble that
+#           holds the walls before the last change (batch mazes)
+MAGIC: bytes = b'MAZE'
+VERSION: int = 1
+HEADER: struct.Struct = struct.Struct('<4sBBHHHHHHHHBBHQ8s')
+CONTEST: int = 1
+FULL: int = 2
+
+# packing: byte -> low nibble, byte -> low nibble moved up
+# unpacking: byte -> low or high nibble as a cell with all high nibble bits set,
+# as in a maze without change history
+LOW: bytes = bytes(value & 0x0F for value in range(256))
+UP: bytes = bytes((value & 0x0F) << 4 for value in range(256))
+CELL_LOW: bytes = bytes(0xF0 | value & 0x0F for value in range(256))
+CELL_HIGH: bytes = bytes(0xF0 | value >> 4 for value in range(256))
+
+
+def pack_walls(walls: bytes) -> bytes:
+    size: int = (len(walls)+1)//2
+    low: int = int.from_bytes(walls[0::2].translate(LOW), 'little')
+    high: int = int.from_bytes(walls[1::2].translate(UP), 'little')
+    return (low | high).to_bytes(size, 'little')
+
+def unpack_walls(data: bytes, size: int) -> bytearray:
+    __: bytearray = bytearray(size)
+    __[0::2] = data.translate(CELL_LOW)[:len(range(0, size, 2))]
+    __[1::2] = data.translate(CELL_HIGH)[:len(range(1, size, 2))]
+    return __
+
+def encode(maze) -> bytes:
+    full: bool = len(maze.walls.translate(None, bytes(range(0xF0, 0x100)))) > 0
+    header: bytes = HEADER.pack(
+        MAGIC, VERSION, (CONTEST if maze.contest_mode else 0) | (FULL if full else 0),
+        maze.height, maze.width, *maze.start_pos, *maze.end_pos,
+        *maze.contest_end[0], DIR.ALL.index(maze.contest_end[1]),
+        sum([1 << step.value for step, done in maze.make.steps.items() if done]),
+        maze.remove_walls, maze.seed, maze.hash.encode()
+    )
+    return header + (bytes(maze.walls) if full else pack_walls(maze.walls))
+
+def decode(maze, data: bytes) -> bool:
+    # rebuilds the maze in place from its encoding, False if it is none or
+    # its length doesn't fit the size in its header
+    if len(data) < HEADER.size or data[:len(MAGIC)] != MAGIC or data[len(MAGIC)] != VERSION:
+        return False
+    (_, _, flags, height, width, start_y, start_x, end_y, end_x,
+        contest_y, contest_x, contest_dir, steps, remove_walls, seed, hash_code) = HEADER.unpack_from(data)
+
+    size: int = height*width
+    offset: int = HEADER.size
+    if len(data) != offset + (size if flags & FULL else (size+1)//2):
+        return False
+    maze.__init__(
+        size=(height, width),
+        verbose=maze.verbose,
+        contest_mode=bool(flags & CONTEST),
+        remove_walls=remove_walls,
+        seed=seed
+    )
+    maze.start_pos = (start_y, start_x)
+    maze.contest_end = ((contest_y, contest_x), DIR.ALL[contest_dir])
+    maze.restore(
+        walls=memoryview(data)[offset:offset+size] if flags & FULL else unpack_walls(data[offset:offset+(size+1)//2], size),
+        end_pos=(end_y, end_x),
+        steps=[step for step in MakerSteps if steps >> step.value & 1],
+        hash_code=hash_code.decode()
+    )
+    return True
 
 def Saver(maze, foldername: str, filename: str, fileext: str="") -> bool:
     def _save_txt() -> bool:
@@ -22,119 +93,156 @@ def Saver(maze, foldername: str, filename: str, fileext: str="") -> bool:
             print(f"File {filename}.txt can't be saved to {foldername}/txt/.")
             return False
 
-    def _save_pickle() -> bool:
-        if not os.path.exists(foldername+'/pkl/'):
-            os.makedirs(foldername+'/pkl/')
+    def _save_binary() -> bool:
+        if not os.path.exists(foldername+'/bin/'):
+            os.makedirs(foldername+'/bin/')
         try:
-            with open(foldername+'/pkl/'+filename+'.pkl', "wb") as file:
-                pickle.dump(maze, file)
-            return True
+            with open(foldername+'/bin/'+filename+'.maze', "wb") as file:
+                file.write(encode(maze))
         except FileNotFoundError:
-            print(f"File {filename}.pkl can't be saved to {foldername}/pkl/.")
+            print(f"File {filename}.maze can't be saved to {foldername}/bin/.")
             return False
+
+        catalog: Catalog = Catalog()
+        catalog.add(maze, foldername, filename)
+        catalog.close()
+        return True
     
     if fileext == 'txt':
         return _save_txt()
-    elif fileext == 'pkl':
-        return _save_pickle()
+    elif fileext == 'maze':
+        return _save_binary()
     else:
-        return _save_txt() and _save_pickle()
+        return _save_txt() and _save_binary()
 
 def Loader(maze, foldername: str, filename: str, fileext: str="", id_hash: str="") -> bool:
     def _load_from_hash() -> bool:
-        import os
+        nonlocal foldername
+        nonlocal filename
+        catalog: Catalog = Catalog()
         try:
-            for root, dirs, files in os.walk('./'):
-                for file in files:
-                    if id_hash+'.pkl' in file:
-                        nonlocal foldername
-                        foldername = root[2:-3]
-                        nonlocal filename
-                        filename = file.split('.')[0]
-                        return _load_pickle()
+            entry: tuple | None = catalog.find(id_hash)
+            if entry is not None:
+                height, width, contest, remove_walls, seed, folder, file = entry
+                if folder is not None and '#' in file:
+                    # a variant in a batch archive: <archive name>#<variant>,
+                    # without the archive rebuilt from the batch seed
+                    from archive import Archive, rebuild
+                    name, variant = file.split('#')
+                    if os.path.exists(folder+'/'+name+'.mzb'):
+                        Archive(folder+'/'+name+'.mzb').load(maze, int(variant))
+                        return True
+                    maze.__init__(
+                        size=(height, width),
+                        verbose=maze.verbose,
+                        contest_mode=bool(contest),
+                        remove_walls=remove_walls,
+                        seed=seed
+                    )
+                    rebuild(maze, int(variant))
+                    if maze.hash == id_hash:
+                        return True
+                elif folder is not None and os.path.exists(folder+'/bin/'+file+'.maze'):
+                    foldername, filename = folder, file
+                    if _load_binary() and maze.hash == id_hash:
+                        return True
+                else:
+                    # never written to a file, the seed rebuilds it
+                    maze.__init__(
+                        size=(height, width),
+                        verbose=maze.verbose,
+                        contest_mode=bool(contest),
+                        remove_walls=remove_walls,
+                        seed=seed
+                    )
+                    maze.make()
+                    if maze.hash == id_hash:
+                        return True
+                # a stale entry, the files are searched and the entry replaced
+                print(f"Catalog entry of id {id_hash} doesn't rebuild it, searching the files.")
+
+            # not in the catalog (yet), binary files first, mazes saved before
+            # them still have their txt; only the file that holds the maze with
+            # that hash goes into the catalog
+            for fileext_, load in (('maze', _load_binary), ('txt', _load_txt)):
+                for root, dirs, files in os.walk('./'):
+                    for file in files:
+                        if id_hash+'.'+fileext_ in file:
+                            foldername = os.path.dirname(root)[2:]
+                            filename = file.split('.')[0]
+                            if not load():
+                                continue
+                            if maze.hash != id_hash:
+                                print(f"File {filename}.{fileext_} in {foldername}/{fileext_.replace('maze', 'bin')}/ holds the maze with id {maze.hash}.")
+                                continue
+                            catalog.add(maze, foldername, filename)
+                            return True
             raise FileNotFoundError
         except FileNotFoundError:
-            print(f"File with id {id_hash} not found in {foldername}/pkl/.")
+            print(f"File with id {id_hash} not found in {foldername}/bin/.")
             return False
+        finally:
+            catalog.close()
 
     def _load_txt() -> bool:
+        # the txt only keeps the walls: the zones follow from the size and the
+        # end is the cell of the end zone with an open wall to the outside
         try:
             with open(foldername+'/txt/'+filename+'.txt', "r") as file:
                 read: list = file.readlines()
-                maze.height = len(read) // 2
-                maze.width = len(read[0]) // 4
-                maze.maze = [[maze.cell((y, x)) for x in range(maze.width)] for y in range(maze.height)]
-                for y in range(1, len(read), 2):
-                    for x in range(2, len(read[y]), 4):
-                        y_pos: int = y//2
-                        x_pos: int = x//4
-                        cell = maze.cell((y_pos, x_pos))
-
-                        if read[y-1][x-1:x+2] != ASCII.wall_h:
-                            cell.walls &= ~DIR.UP.wall
-                        if read[y][x+2] != ASCII.wall_v:
-                            cell.walls &= ~DIR.RIGHT.wall
-                        if read[y+1][x-1:x+2] != ASCII.wall_h:
-                            cell.walls &= ~DIR.DOWN.wall
-                        if read[y][x-2] != ASCII.wall_v:
-                            cell.walls &= ~DIR.LEFT.wall
-                        
-                        maze.maze[y_pos][x_pos] = cell
-                
-                maze.hash = maze.__hash__()
-                maze.make = Maker(maze=maze)
-                maze.visualize = Visualizer(maze=maze)
-                maze.solve = Solver(maze=maze)
-                maze.analyze = Analyzer(maze=maze)
-            return True
         except FileNotFoundError:
-            print(f"File {filename}.txt not found in {foldername}/pkl/.")
+            print(f"File {filename}.txt not found in {foldername}/txt/.")
+            return False
+
+        height: int = len(read) // 2
+        width: int = len(read[0]) // 4 if read else 0
+        if height < 4 or width < 4:
+            print(f"File {filename}.txt in {foldername}/txt/ is not a maze.")
             return False
+        walls: bytearray = bytearray(b'\xFF')*(height*width)
+        for y in range(1, 2*height, 2):
+            for x in range(2, 4*width, 4):
+                index: int = (y//2)*width + x//4
+                if read[y-1][x-1:x+2] != ASCII.wall_h:
+                    walls[index] &= ~DIR.UP.wall
+                if read[y][x+2] != ASCII.wall_v:
+                    walls[index] &= ~DIR.RIGHT.wall
+                if read[y+1][x-1:x+2] != ASCII.wall_h:
+                    walls[index] &= ~DIR.DOWN.wall
+                if read[y][x-2] != ASCII.wall_v:
+                    walls[index] &= ~DIR.LEFT.wall
 
-    def _load_pickle() -> bool:
+        maze.__init__(size=(height, width), verbose=maze.verbose)
+        end_pos: tuple = maze.end_pos
+        for y, x in sorted(maze.end_zone):
+            if any([
+                not walls[y*width + x] & direction.wall and (y+direction.y, x+direction.x) not in maze.end_zone
+                for direction in DIR.ALL
+            ]):
+                end_pos = (y, x)
+                break
+        maze.restore(walls=walls, end_pos=end_pos)
+        return True
+
+    def _load_binary() -> bool:
         try:
-            with open(foldername+'/pkl/'+filename+'.pkl', "rb") as file:
-                loaded_maze = pickle.load(file)
-
-                maze.height = loaded_maze.height
-                maze.width = loaded_maze.width
-                maze.hash = loaded_maze.hash
-                maze.maze = loaded_maze.maze
-                maze.verbose = loaded_maze.verbose
-                maze.remove_walls = loaded_maze.remove_walls
-                maze.make = Maker(maze=maze)
-                maze.make.steps = loaded_maze.make.steps
-                maze.visualize = Visualizer(maze=maze)
-                maze.solve = Solver(maze=maze)
-                maze.analyze = Analyzer(maze=maze)
-                maze.contest_mode = loaded_maze.contest_mode
-                maze.contest_end = loaded_maze.contest_end
-                maze.start_zone = loaded_maze.start_zone
-                maze.start_path = loaded_maze.start_path
-                maze.start_pos = loaded_maze.start_pos
-                maze.end_zone = loaded_maze.end_zone
-                maze.end_pos = loaded_maze.end_pos
-                maze.ziel_marker = loaded_maze.ziel_marker
-                maze.ball_marker = loaded_maze.ball_marker
-                for y in range(maze.height):
-                    for x in range(maze.width):
-                        cell = maze.cell((y, x))
-                        cell._visited = set()
-                        cell._paths = set()
-                # maze.paths = loaded_maze.paths
-                # maze.visited = loaded_maze.visited
-                # maze.solved = loaded_maze.solved
-            return True
+            with open(foldername+'/bin/'+filename+'.maze', "rb") as file:
+                data: bytes = file.read()
         except FileNotFoundError:
-            print(f"File {filename}.pkl not found in {foldername}/pkl/.")
+            print(f"File {filename}.maze not found in {foldername}/bin/.")
             return False
-    
+
+        if not decode(maze, data):
+            print(f"File {filename}.maze in {foldername}/bin/ is not a valid version {VERSION} maze file.")
+            return False
+        return True
+
     if id_hash:
         return _load_from_hash()
 
     if fileext == 'txt':
         return _load_txt()
-    elif fileext == 'pkl':
-        return _load_pickle()
+    elif fileext == 'maze':
+        return _load_binary()
     else:
-        return _load_txt() or _load_pickle()
\ No newline at end of file
+        return _load_binary() or _load_txt()
\ No newline at end of file
@@ -1,40 +1,53 @@
+from array import array
+from collections import deque
+
 from algorithm import Algorithm
 from cell import Cell
-from direction import DIR, Dir
 from maze import Maze
+from solver import mark_path
 
 
 def FloodFill(maze: Maze, cell: Cell) -> list[Cell]:
-    resistance: list[list[int]] = [[-1 for _ in range(maze.width)] for _ in range(maze.height)]
-    turns: list[list[int]] = [[-1 for _ in range(maze.width)] for _ in range(maze.height)]
-    resistance[cell.y][cell.x] = 0
-    turns[cell.y][cell.x] = 0
-    queue: list[tuple[Cell, Dir]] = [(cell, DIR._EMPTY)]
-    path: list[Cell] = []
+    adjacency: array = maze.adjacency
+    forbidden: bytearray = maze.forbidden
+    bit: int = 1 << Algorithm.FloodFill.value
+    on_visit = maze.observers.on_visit if maze.observers else None
+
+    resistance: array = array('i', [-1])*len(maze.walls)
+    turns: array = array('i', [-1])*len(maze.walls)
+    # direction index (0-3) each cell was entered with, 4 for the start
+    entered: bytearray = bytearray(len(maze.walls))
+    resistance[cell.index] = 0
+    turns[cell.index] = 0
+    entered[cell.index] = 4
+    queue: deque[int] = deque([cell.index])
+    path: list[int] = []
 
     while queue:
-        current, move_dir = queue.pop(0)
-        current.visited(Algorithm.FloodFill)
-
-        maze.visualize(step=True, algorithm=Algorithm.FloodFill)
-
-        for neighbor, direction in current.neighbors(maze.maze):
-            if resistance[neighbor.y][neighbor.x] == -1 and not neighbor.forbidden:
-                resistance[neighbor.y][neighbor.x] = resistance[current.y][current.x] + 1
-                if move_dir is DIR._EMPTY:
+        current: int = queue.popleft()
+        move_dir: int = entered[current]
+        maze.visited_bits[current] |= bit
+
+        if on_visit:
+            on_visit(maze, current, Algorithm.FloodFill)
+
+        for direction in range(4):
+            neighbor: int = adjacency[4*current + direction]
+            if neighbor >= 0 and resistance[neighbor] == -1 and not forbidden[neighbor]:
+                resistance[neighbor] = resistance[current] + 1
+                if move_dir == 4:
                     move_dir = direction
-                turns[neighbor.y][neighbor.x] = turns[current.y][current.x] + (1 if direction != move_dir else 0)
-                queue.append((neighbor, direction))
+                turns[neighbor] = turns[current] + (1 if direction != move_dir else 0)
+                entered[neighbor] = direction
+                queue.append(neighbor)
 
-    current: Cell = maze.cell(maze.end_pos)
-    while current.pos != maze.start_pos:
+    current: int = maze.cell(maze.end_pos).index
+    while current != cell.index:
         path.append(current)
-        current.path(Algorithm.FloodFill)
 
-        neighbors: list[Cell] = [n for n, d in current.neighbors(maze.maze)]
-        current = min(neighbors, key=lambda n: (turns[n.y][n.x], resistance[n.y][n.x]))
+        neighbors: list[int] = [n for n in adjacency[4*current:4*current+4] if n >= 0 and not forbidden[n]]
+        current = min(neighbors, key=lambda n: (turns[n], resistance[n]))
     path.append(current)
-    current.path(Algorithm.FloodFill)
 
     path.reverse()
-    return path
\ No newline at end of file
+    return mark_path(maze, path, Algorithm.FloodFill)
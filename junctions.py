@@ -0,0 +1,110 @@
+import heapq
+
+from array import array
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from maze import Maze
+
+# a made maze is mostly corridors, cells with exactly two open neighbors; the
+# junction graph keeps only the other cells (junctions, dead ends) plus the
+# start and the end as nodes and turns every corridor between two of them into
+# one edge, so a search touches the nodes instead of every cell
+# - edges[node]: (node at the other end, steps, turns, corridor cells in order)
+# - turns count the changes of direction inside the corridor, first and last
+#   step included, and not the turn taken at the node itself
+
+
+class JunctionGraph:
+    def __init__(self, maze: 'Maze'):
+        self.maze: 'Maze' = maze
+        self.start: int = maze.cell(maze.start_pos).index
+        self.end: int = maze.cell(maze.end_pos).index
+
+        adjacency: array = maze.adjacency
+        forbidden: bytearray = maze.forbidden
+        # open, allowed neighbor slots of every allowed cell
+        self.open: list[list[int]] = [
+            [] if forbidden[index] else [slot for slot in range(4*index, 4*index+4) if adjacency[slot] >= 0 and not forbidden[adjacency[slot]]]
+            for index in range(len(maze.walls))
+        ]
+        self.nodes: list[int] = [
+            index for index in range(len(maze.walls))
+            if not forbidden[index] and (len(self.open[index]) != 2 or index in (self.start, self.end))
+        ]
+        nodes: set[int] = set(self.nodes)
+        self.edges: dict[int, list[tuple[int, int, int, tuple[int, ...]]]] = {node: [] for node in self.nodes}
+        for node in self.nodes:
+            for slot in self.open[node]:
+                self.edges[node].append(self.corridor(node, slot, nodes))
+
+    def corridor(self, node: int, slot: int, nodes: set[int]) -> tuple[int, int, int, tuple[int, ...]]:
+        # follows the corridor leaving node through slot up to the next node
+        adjacency: array = self.maze.adjacency
+        previous, current, direction = node, adjacency[slot], slot & 3
+        cells: list[int] = []
+        turns: int = 0
+        while current not in nodes:
+            cells.append(current)
+            for slot_ in self.open[current]:
+                if adjacency[slot_] != previous:
+                    break
+            if slot_ & 3 != direction:
+                turns += 1
+            previous, current, direction = current, adjacency[slot_], slot_ & 3
+        return current, len(cells)+1, turns, tuple(cells)
+
+    def path(self, source: int=-1, target: int=-1, astar: bool=False) -> list[int]:
+        # shortest cell indices from source to target (default start and end)
+        # by dijkstra over the nodes, or a* with the manhattan distance which
+        # never overestimates a corridor; empty if target can't be reached
+        source = self.start if source < 0 else source
+        target = self.end if target < 0 else target
+        for name, index in (('source', source), ('target', target)):
+            if index not in self.edges:
+                state: str = 'forbidden' if index < len(self.open) and self.maze.forbidden[index] else 'not a node'
+                raise ValueError(f'The {name} cell {index} of the junction graph is {state}.')
+        width: int = self.maze.width
+        target_y, target_x = divmod(target, width)
+
+        def heuristic(node: int) -> int:
+            if not astar:
+                return 0
+            y, x = divmod(node, width)
+            return abs(y - target_y) + abs(x - target_x)
+
+        # parents[node] = (previous node, cells of the corridor in between)
+        distances: dict[int, int] = {source: 0}
+        parents: dict[int, tuple[int, tuple[int, ...]]] = {}
+        closed: set[int] = set()
+        order: int = 0
+        queue: list[tuple[int, int, int]] = [(heuristic(source), order, source)]
+        # the nodes in the order they were expanded
+        self.visited: list[int] = []
+
+        while queue:
+            _, _, current = heapq.heappop(queue)
+            if current in closed:
+                continue
+            closed.add(current)
+            self.visited.append(current)
+            if current == target:
+                break
+            for neighbor, steps, _, cells in self.edges[current]:
+                distance: int = distances[current] + steps
+                if neighbor not in closed and distance < distances.get(neighbor, distance+1):
+                    distances[neighbor] = distance
+                    parents[neighbor] = (current, cells)
+                    order += 1
+                    heapq.heappush(queue, (distance + heuristic(neighbor), order, neighbor))
+        else:
+            return []
+
+        __: list[int] = [target]
+        current: int = target
+        while current != source:
+            current, cells = parents[current]
+            __ += reversed(cells)
+            __.append(current)
+        __.reverse()
+        return __
@@ -1,8 +1,12 @@
 import sys
 
+from typing import Iterator
+
 from maze import Maze
 from algorithm import Algorithm
-from svg import SVG
+from svg import SVG, export
+from catalog import Catalog
+from pdf import converter
 
 # read the arguments from the command line
 # main.py
@@ -16,7 +20,10 @@ from svg import SVG
 #       -w --wrem <remove_walls>
 #       -c --cont <contest_mode>
 #       -g --grap <graphics>
-# e.g. python main.py -m sim -s 16 16 -r 10 -a f -v 0 -w 15 -c yes -g yes
+#       -j --jobs <jobs>
+#       -p --prng <seed>
+#       -d --defr <defer_pdfs>
+# e.g. python main.py -m sim -s 16 16 -r 10 -a f -v 0 -w 15 -c yes -g yes -j 8
 
 def main():
 
@@ -30,6 +37,9 @@ def main():
     remove_walls: int = 15
     contest_mode: bool = False
     graphics: bool = True
+    jobs: int = 1
+    seed: int | None = None
+    defer_pdfs: bool = False
     modifications: list[str] = []
 
     flag: str = ''
@@ -43,7 +53,7 @@ def main():
                 flag = arg[2]
             else:
                 flag = arg[1]
-            if flag in ('m', 'u', 's', 'r', 'a', 'v', 'w', 'c', 'g', 'i'):
+            if flag in ('m', 'u', 's', 'r', 'a', 'v', 'w', 'c', 'g', 'i', 'j', 'p', 'd'):
                 continue
             else:
                 error()
@@ -95,6 +105,10 @@ def main():
                     algorithms.append(Algorithm.BFS)
                 elif char == 'd':
                     algorithms.append(Algorithm.DFS)
+                elif char == 'i':
+                    algorithms.append(Algorithm.BiBFS)
+                elif char == 's':
+                    algorithms.append(Algorithm.BiAStar)
                 else:
                     error()
         elif flag == 'v':
@@ -125,6 +139,27 @@ def main():
                 graphics = False
             else:
                 error()
+        elif flag == 'j':
+            try:
+                jobs = int(arg)
+                if jobs < 1:
+                    error()
+            except ValueError:
+                error()
+        elif flag == 'p':
+            try:
+                seed = int(arg)
+                if seed < 0 or seed >= 2**64:
+                    error()
+            except ValueError:
+                error()
+        elif flag == 'd':
+            if arg in ('yes', 'y', 'true', 't'):
+                defer_pdfs = True
+            elif arg in ('no', 'n', 'false', 'f'):
+                defer_pdfs = False
+            else:
+                error()
         elif flag == 'u':
             modifications.append(arg)
             
@@ -138,6 +173,9 @@ def main():
     if algorithms == []:
         algorithms = [Algorithm.BFS]
 
+    # the pdfs are converted in the background, or all at the end when deferred
+    converter.defer = defer_pdfs
+
     if mode == 'sim':
         simulate(
             runs=runs,
@@ -147,7 +185,9 @@ def main():
             contest_mode=contest_mode,
             verbose=verbose,
             algorithms=algorithms,
-            graphics=graphics
+            graphics=graphics,
+            jobs=jobs,
+            seed=seed
         )
     elif mode == 'bat':
         testbatch(
@@ -157,14 +197,19 @@ def main():
             contest_mode=contest_mode,
             verbose=verbose,
             algorithms=algorithms,
-            graphics=graphics
+            graphics=graphics,
+            seed=seed
         )
     elif mode == 'load':
         load(
             id_hash=id_hash,
             algorithms=algorithms,
             modifications=modifications,
-            graphics=graphics
+            graphics=graphics,
+            seed=seed,
+            size=size,
+            remove_walls=remove_walls,
+            contest_mode=contest_mode
         )
     else:
         test(
@@ -172,9 +217,12 @@ def main():
             contest_mode=contest_mode,
             verbose=verbose,
             algorithms=algorithms,
-            graphics=graphics
+            graphics=graphics,
+            seed=seed
         )
 
+    converter.finish()
+
 
 def error():
     print()
@@ -184,8 +232,9 @@ def error():
     print(f"         -m --mode  test                     >> default: test")
     print(f"                    sim   (simulation of multiple mazes)")
     print(f"                    bat   (batch of mazes from one maze)")
-    print(f"                    load  (load maze from file with id)")
+    print(f"                    load  (load maze from file with id or rebuild it from seed)")
     print(f"         -i --id    ####  (when loading or modifying a maze)")
+    print(f"         -p --prng  #     (seed, with -s -w -c rebuilds the same maze)")
     print(f"         -u --upwa  y.x.[u(p)|r(ight)|d(own)|l(eft)].[r(emove)|i(nsert)]")
     print(f"         -s --size  8-128 (8-128)            >> default: 16 16")
     print(f"         -r --runs  0-#   (0-# = cutoff)     >> default: 10")
@@ -195,12 +244,16 @@ def error():
     print(f"                    a     (AStar)")
     print(f"                    b     (BFS)")
     print(f"                    d     (DFS)")
+    print(f"                    i     (BiBFS)")
+    print(f"                    s     (BiAStar)")
     print(f"         -v --verb  0     (none)             >> default: 0")
     print(f"                    1     (normal)")
     print(f"                    2     (steps)")
     print(f"         -w --wrem  0-50  (walls to remove)  >> default: 15")
     print(f"         -c --cont  y n                      >> default: n")
     print(f"         -g --grap  y n                      >> default: y")
+    print(f"         -j --jobs  1-#   (worker processes) >> default: 1")
+    print(f"         -d --defr  y n   (pdfs at the end)  >> default: n")
     print()
     print("Example: python main.py -m sim -s 16 -r 10 5 -a fbd -v 0 -w 15")
     print()
@@ -213,13 +266,15 @@ def test(
     contest_mode: bool,
     verbose: int,
     algorithms: list[Algorithm],
-    graphics: bool
+    graphics: bool,
+    seed: int | None=None
 ):
 
     maze: Maze = Maze(
         size=size,
         verbose=verbose,
-        contest_mode=contest_mode
+        contest_mode=contest_mode,
+        seed=seed
     )
     
     maze.make()
@@ -238,9 +293,12 @@ def test(
 
     maze.save()
     if graphics:
-        SVG(maze, foldername=f'graphics', filename=f'maze', paths=False, overview=False)
-        SVG(maze, foldername=f'graphics', filename=f'maze_build', paths=False, overview=False, helpers=True, changes=True)
-        SVG(maze, foldername=f'graphics', filename=f'maze_solution', paths=True, overview=True)
+        export(
+            maze,
+            dict(foldername=f'graphics', filename=f'maze', paths=False, overview=False),
+            dict(foldername=f'graphics', filename=f'maze_build', paths=False, overview=False, helpers=True, changes=True),
+            dict(foldername=f'graphics', filename=f'maze_solution', paths=True, overview=True)
+        )
 
 
 def simulate(
@@ -251,56 +309,130 @@ def simulate(
     contest_mode: bool,
     verbose: int,
     algorithms: list[Algorithm],
-    graphics: bool
+    graphics: bool,
+    jobs: int=1,
+    seed: int | None=None
 ):
+    import heapq
+    import os
+    import random
     import time
 
     if not cutoff or cutoff > runs:
         cutoff = runs
 
-    mazes: list[tuple[Maze, dict]] = []
-
-    for i in range(runs):
-        maze = Maze(
-            size=size,
-            verbose=verbose,
-            remove_walls=remove_walls,
-            contest_mode=contest_mode,
-        )
-
-        maze.make()
-
-        maze.solve(algorithms=algorithms)
+    # every run gets its own seed drawn from the simulation seed, a seed with the
+    # size, removed walls and contest mode is all it takes to rebuild a maze
+    if seed is None:
+        seed = random.randrange(2**64)
+    seeder: random.Random = random.Random(seed)
+    tasks: Iterator[tuple] = (
+        (seeder.getrandbits(64), size, remove_walls, contest_mode, verbose if jobs == 1 else 0, algorithms)
+        for _ in range(runs)
+    )
 
-        mazes.append((maze, maze.analyze(algorithm=algorithms[0])))
+    # keep only the cutoff shortest paths (earlier runs win ties) in a max heap
+    # of (-length, -run, result), everything else is dropped right away
+    best: list[tuple[int, int, tuple]] = []
+    step: int = max(1, runs//100)
+    for done, (run, result) in enumerate(simulate_stream(tasks, jobs), start=1):
+        entry: tuple[int, int, tuple] = (-result[2]['length'], -run, result)
+        if len(best) < cutoff:
+            heapq.heappush(best, entry)
+        elif entry > best[0]:
+            heapq.heapreplace(best, entry)
+        if done % step == 0 or done == runs:
+            threshold: str = f"{-best[0][0]}" if len(best) == cutoff else "-"
+            print(f"\r> {done:{len(str(runs))}}/{runs} runs | keeping length <= {threshold}", end="", flush=True)
+    print()
 
     # sort mazes by the algorithm's analysis path length
-    mazes.sort(key=lambda m: m[1]['length'])
+    results: list[tuple[int, str, dict]] = [result for _, _, result in sorted(best, reverse=True)]
 
     foldername: str = f'simulation_{time.strftime("%Y%m%d-%H%M%S")}'
     
     __: str = ""
     __ += f"\n"
     __ += f"> Maze Simulation with {algorithms[0].name}\n"
-    __ += f"            [{remove_walls} random walls removed]"
+    __ += f"            [{remove_walls} random walls removed | seed {seed}]"
     __ += f"\n\n"
-    __ += f"  maze hash | Length | Turns | Branch\n"
-    __ += f"  ----------|--------|-------|-------\n"
-    for i, (maze, analysis) in enumerate(mazes):
-        __ += f" {maze.hash:>10} |"
+    __ += f"  maze hash |                 seed | Length | Turns | Branch\n"
+    __ += f"  ----------|----------------------|--------|-------|-------\n"
+    # the kept mazes go into the catalog by their seeds, load -i rebuilds them
+    catalog: Catalog = Catalog()
+    for i, (seed_, hash_, analysis) in enumerate(results):
+        __ += f" {hash_:>10} | {seed_:>20} |"
         __ += f" {analysis['length']:6} | {analysis['turns']:5} | {analysis['branches']:6}\n"
-        maze.save(foldername=foldername+'/mazes')
+        catalog.record(hash_, size, contest_mode, remove_walls, seed_, metrics={algorithms[0]: analysis})
         if graphics:
-            SVG(maze, foldername=foldername+'/mazes', filename=f'maze', paths=False, overview=False)
-            SVG(maze, foldername=foldername+'/solutions', filename=f'maze', paths=True, overview=True)
+            # only the kept mazes are rebuilt, from their seeds
+            maze = Maze(
+                size=size,
+                remove_walls=remove_walls,
+                contest_mode=contest_mode,
+                seed=seed_
+            )
+            maze.make()
+            maze.solve(algorithms=algorithms)
+            export(
+                maze,
+                dict(foldername=foldername+'/mazes', filename=f'maze', paths=False, overview=False),
+                dict(foldername=foldername+'/solutions', filename=f'maze', paths=True, overview=True)
+            )
+            catalog.add(maze)
         if i+1 == cutoff:
             break
+    catalog.close()
     print(__)
 
+    os.makedirs(foldername, exist_ok=True)
     with open(f'{foldername}/simulation_summary.txt', 'w') as file:
         file.write(__)
 
 
+def simulate_stream(tasks: Iterator[tuple], jobs: int) -> Iterator[tuple[int, tuple]]:
+    # yields (run, result) as runs finish, with at most a few tasks per worker in flight
+    if jobs == 1:
+        for run, task in enumerate(tasks):
+            yield run, simulate_run(task)
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending: dict = {}
+        for run, task in enumerate(tasks):
+            pending[executor.submit(simulate_run, task)] = run
+            if len(pending) >= 4*jobs:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+
+
+def simulate_run(task: tuple) -> tuple[int, str, dict]:
+    # one simulation run, returns only what the parent needs to rank and rebuild
+    # the maze: (seed, hash, analysis)
+    seed, size, remove_walls, contest_mode, verbose, algorithms = task
+
+    maze = Maze(
+        size=size,
+        verbose=verbose,
+        remove_walls=remove_walls,
+        contest_mode=contest_mode,
+        seed=seed
+    )
+
+    maze.make()
+
+    maze.solve(algorithms=list(algorithms))
+
+    return (seed, maze.hash, maze.analyze(algorithm=algorithms[0]))
+
+
 def testbatch(
     batch_size: int,
     size: tuple[int, int],
@@ -308,15 +440,18 @@ def testbatch(
     contest_mode: bool,
     verbose: int,
     algorithms: list[Algorithm],
-    graphics: bool
+    graphics: bool,
+    seed: int | None=None
 ):
+    from archive import ArchiveWriter, make_variant
     from maker import MakerSteps
 
     maze: Maze = Maze(
         size=size,
         verbose=verbose,
         remove_walls=remove_walls,
-        contest_mode=contest_mode)
+        contest_mode=contest_mode,
+        seed=seed)
     
     maze.make(steps=[
         MakerSteps.ZONES,
@@ -329,47 +464,62 @@ def testbatch(
     maze.save(foldername=foldername)
     SVG(maze, foldername=foldername, filename=f'maze', paths=False, overview=False)
 
-    maze_before = maze.copy().maze
-    mazes: list[Maze] = []
+    # the variants go into one archive as their wall edits on the base maze
+    archive: ArchiveWriter = ArchiveWriter(f'{foldername}/batch.mzb', maze)
+    catalog: Catalog = Catalog()
+
+    walls_before: bytes = bytes(maze.walls)
     
     for i in range(batch_size):
         maze_copy = maze.copy()
-
-        maze_copy.make(steps=[
-            MakerSteps.MULTIPLE
-        ])
-
-        for y in range(len(maze.maze)):
-            for x in range(len(maze.maze[y])):
-                maze_copy.maze[y][x].walls = (maze_copy.maze[y][x].walls & 0x0F) | ((maze_before[y][x].walls & 0x0F) << 4)
-        maze_before = maze_copy.copy().maze
+        # each variant draws its removed walls from its own stream of the batch
+        # seed, the catalog keeps that seed and the variant number to rebuild it
+        edits: list[tuple[int, int, int, int]] = make_variant(maze_copy, i+1, walls_before)
+        variant: int = archive.add(maze_copy.hash, edits)
+        walls_before = bytes(maze_copy.walls)
 
         maze_copy.solve(algorithms=algorithms)
+        catalog.add(maze_copy, foldername, f'batch#{variant}')
 
-        mazes.append(maze_copy)
+        maze_copy.overview()
 
-    for i, maze_ in enumerate(mazes):
-        maze_.overview()
-
-        maze_.save(filename=f'maze_{i+1:02d}')
         if graphics:
-            SVG(maze_, foldername=foldername, filename=f'maze_{i+1:02d}', paths=False, overview=False)
-            SVG(maze_, foldername=foldername, filename=f'maze_{i+1:02d}_build', paths=False, overview=False, helpers=True, changes=True)
-            SVG(maze_, foldername=foldername, filename=f'maze_{i+1:02d}_solution', paths=True, overview=True)
+            export(
+                maze_copy,
+                dict(foldername=foldername, filename=f'maze_{i+1:02d}', paths=False, overview=False),
+                dict(foldername=foldername, filename=f'maze_{i+1:02d}_build', paths=False, overview=False, helpers=True, changes=True),
+                dict(foldername=foldername, filename=f'maze_{i+1:02d}_solution', paths=True, overview=True)
+            )
+
+    archive.close()
+    catalog.close()
 
 def load(
     id_hash: str,
     algorithms: list[Algorithm],
     modifications: list[str],
-    graphics: bool
+    graphics: bool,
+    seed: int | None=None,
+    size: tuple[int, int]=(16, 16),
+    remove_walls: int=15,
+    contest_mode: bool=False
 ):
-    if not id_hash:
-        error()
-    
-    maze: Maze = Maze(size=(0, 0))
+    if seed is not None:
+        maze: Maze = Maze(
+            size=size,
+            remove_walls=remove_walls,
+            contest_mode=contest_mode,
+            seed=seed
+        )
+        maze.make()
+    else:
+        if not id_hash:
+            error()
+
+        maze: Maze = Maze(size=(0, 0))
 
-    if not maze.load(id_hash=id_hash):
-        sys.exit(1)
+        if not maze.load(id_hash=id_hash):
+            sys.exit(1)
     
     if modifications:
         from direction import DIR, Dir
@@ -412,9 +562,12 @@ def load(
 
     if graphics:
         foldername: str = f'graphics_{maze.hash}'
-        SVG(maze, foldername=foldername, filename=f'__maze', paths=False, overview=False)
-        SVG(maze, foldername=foldername, filename=f'__maze_build', paths=False, overview=False, helpers=True, changes=True)
-        SVG(maze, foldername=foldername, filename=f'__maze_solution', paths=True, overview=True)
+        export(
+            maze,
+            dict(foldername=foldername, filename=f'__maze', paths=False, overview=False),
+            dict(foldername=foldername, filename=f'__maze_build', paths=False, overview=False, helpers=True, changes=True),
+            dict(foldername=foldername, filename=f'__maze_solution', paths=True, overview=True)
+        )
 
 if __name__ == '__main__':
     main()
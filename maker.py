@@ -1,7 +1,8 @@
-import random
 import time
 
+from array import array
 from enum import Enum
+from itertools import permutations
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -11,6 +12,10 @@ from cell import Cell, Zone
 from algorithm import Algorithm
 from direction import DIR, Dir
 
+# every order in which the four directions of a cell can be tried
+ORDERS: tuple[tuple[int, ...], ...] = tuple(permutations(range(4)))
+
+
 class MakerSteps(Enum):
     ZONES = 0
     PATH = 1
@@ -43,19 +48,13 @@ class Maker:
 
         self.maze.hash = self.maze.__hash__()
 
-        self.maze.visualize(step=True)
+        if self.maze.observers:
+            self.maze.observers.on_made(self.maze)
 
         return True
     
     def make_zones(self) -> bool:
-        for pos in self.maze.start_zone:
-            self.maze.cell(pos).zone = Zone.START
-            if not pos in self.maze.start_path:
-                self.maze.cell(pos).forbidden = True
-        for pos in self.maze.end_zone:
-            self.maze.cell(pos).zone = Zone.END
-            if pos != self.maze.end_pos:
-                self.maze.cell(pos).forbidden = True
+        self.mark_zones()
 
         self.remove_zone_walls(self.maze.start_zone)
         self.insert_wall(self.maze.cell(self.maze.start_pos), DIR.DOWN)
@@ -66,12 +65,19 @@ class Maker:
 
         return True
     
+    def mark_zones(self) -> None:
+        for pos in self.maze.start_zone:
+            self.maze.cell(pos).zone = Zone.START
+            if not pos in self.maze.start_path:
+                self.maze.cell(pos).forbidden = True
+        for pos in self.maze.end_zone:
+            self.maze.cell(pos).zone = Zone.END
+            if pos != self.maze.end_pos:
+                self.maze.cell(pos).forbidden = True
+    
     def make_single_path(self) -> bool:
-        self.recursive_backtrack(self.maze.cell(self.maze.start_pos))
-        for row in self.maze.maze:
-            for cell in row:
-                cell._visited.clear()
-                cell._paths.clear()
+        self.backtrack(self.maze.cell(self.maze.start_pos))
+        self.maze.clear_marks()
         return True
     
     def make_multiple_paths(self) -> bool:
@@ -79,18 +85,50 @@ class Maker:
         return True
 
 
-    def recursive_backtrack(self, cell: Cell) -> None:
-        cell.visited(Algorithm._NONE)
-        self.maze.visualize(step=True)
-        if cell.zone == Zone.END:
-            return
-        for neighbor, direction in cell.neighbors(self.maze.maze, all=True):
-            if not neighbor.is_visited() and not neighbor.forbidden:
-                if self.maze.contest_mode and neighbor.pos == self.maze.contest_end[0]:
-                    if direction != self.maze.contest_end[1]:
-                        continue
-                self.remove_wall(cell, direction)
-                self.recursive_backtrack(neighbor)
+    def backtrack(self, cell: Cell) -> None:
+        # depth first carving with an explicit stack, one frame per open cell:
+        # the cell index, a random direction order and how far it got in it
+        maze: 'Maze' = self.maze
+        links: array = maze.links
+        visited: bytearray = maze.visited_bits
+        forbidden: bytearray = maze.forbidden
+        contest: int = maze.cell(maze.contest_end[0]).index if maze.contest_mode else -1
+        contest_dir: int = DIR.ALL.index(maze.contest_end[1])
+        on_visit = maze.observers.on_visit if maze.observers else None
+
+        stack: array = array('i')
+        orders: bytearray = bytearray()
+        cursors: bytearray = bytearray()
+
+        def enter(index: int) -> None:
+            visited[index] |= 1 << Algorithm._NONE.value
+            if on_visit:
+                on_visit(maze, index, Algorithm._NONE)
+            if maze.zones[index] == Zone.END.value:
+                return
+            stack.append(index)
+            orders.append(maze.rng.randrange(len(ORDERS)))
+            cursors.append(0)
+
+        enter(cell.index)
+        while stack:
+            index: int = stack[-1]
+            cursor: int = cursors[-1]
+            if cursor == 4:
+                stack.pop()
+                orders.pop()
+                cursors.pop()
+                continue
+            cursors[-1] = cursor + 1
+
+            d: int = ORDERS[orders[-1]][cursor]
+            neighbor: int = links[4*index + d]
+            if neighbor < 0 or visited[neighbor] or forbidden[neighbor]:
+                continue
+            if neighbor == contest and d != contest_dir:
+                continue
+            self.remove_wall(Cell(maze, divmod(index, maze.width)), DIR.ALL[d])
+            enter(neighbor)
 
     def is_pole_empty(self, cell: Cell, direction: Dir) -> bool:
         directions: list[Dir] = [DIR.UP, DIR.RIGHT, DIR.DOWN, DIR.LEFT]
@@ -98,7 +136,7 @@ class Maker:
         pos_index: int = dir_index
         walls: list[bool] = []
         for _ in range(3):
-            cell = cell.neighbor(self.maze.maze, directions[pos_index], all=True)[0]
+            cell = cell.neighbor(directions[pos_index], all=True)[0]
             pos_index: int = (pos_index + 1) % 4
             walls.append(bool(cell.walls & directions[pos_index].wall))
         return not any(walls)
@@ -106,10 +144,10 @@ class Maker:
     def random_wall_remover(self) -> None:
         walls_to_remove: int = self.maze.remove_walls
         while walls_to_remove > 0:
-            y: int = random.randint(1, self.maze.height-2)
-            x: int = random.randint(1, self.maze.width-2)
+            y: int = self.maze.rng.randint(1, self.maze.height-2)
+            x: int = self.maze.rng.randint(1, self.maze.width-2)
             cell: Cell = self.maze.cell((y, x))
-            neighbor, direction = cell.neighbor(self.maze.maze, all=True)
+            neighbor, direction = cell.neighbor(all=True, shuffle=True)
 
             if not cell.zone == Zone.NONE or not neighbor.zone == Zone.NONE:
                 continue
@@ -120,21 +158,24 @@ class Maker:
             
             self.remove_wall(cell, direction)
             walls_to_remove -= 1
-            self.maze.visualize(step=True)
 
     def remove_zone_walls(self, zone: set) -> None:
         for pos in zone:
             cell: Cell = self.maze.cell(pos)
-            for neighbor, direction in cell.neighbors(maze=self.maze.maze, all=True):
+            for neighbor, direction in cell.neighbors(all=True):
                 if neighbor.pos in zone:
                     self.remove_wall(cell, direction)
 
     def remove_wall(self, cell: Cell, direction: Dir) -> None:
         cell.walls &= ~direction.wall
-        neighbor: Cell = cell.neighbor(maze=self.maze.maze, direction=direction, all=True)[0]
+        neighbor: Cell = cell.neighbor(direction=direction, all=True)[0]
         neighbor.walls &= ~direction.opposite.wall
+        if self.maze.observers:
+            self.maze.observers.on_wall_removed(self.maze, cell.index, direction)
 
     def insert_wall(self, cell: Cell, direction: Dir) -> None:
         cell.walls |= direction.wall
-        neighbor: Cell = cell.neighbor(maze=self.maze.maze, direction=direction, all=True)[0]
-        neighbor.walls |= direction.opposite.wall
\ No newline at end of file
+        neighbor: Cell = cell.neighbor(direction=direction, all=True)[0]
+        neighbor.walls |= direction.opposite.wall
+        if self.maze.observers:
+            self.maze.observers.on_wall_inserted(self.maze, cell.index, direction)
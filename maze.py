@@ -1,37 +1,124 @@
 import random
+import sys
 import time
 
+from array import array
+from functools import cached_property, lru_cache
+from typing import Iterator
+
 from algorithm import Algorithm
 from analyzer import Analyzer
 from ascii import ASCII
 from cell import Cell
+from deadends import corridor
 from direction import DIR, Dir
+from distances import Distances
 from files import Loader, Saver
+from junctions import JunctionGraph
 from maker import Maker, MakerSteps
 from solver import Solver
 from visualizer import Visualizer
+from wavefront import OPEN
+from observer import Observers
+
+
+# the geometry and the wall keys are shared by the mazes of the same size,
+# kept for the last few sizes only
+SIZES: int = 4
+
+# wall byte -> 1 if the wall in that direction stands; flag byte -> all bits
+STANDING: list[bytes] = [bytes(walls >> d & 1 for walls in range(256)) for d in range(4)]
+FILL: bytes = bytes([0, 0xFF]) + bytes(254)
+
+
+@lru_cache(maxsize=SIZES)
+def links(height: int, width: int) -> array:
+    # static grid geometry, the neighbor in each direction (UP, RIGHT, DOWN,
+    # LEFT) or -1 at the border, one slice per direction
+    size: int = height*width
+    if not size:
+        return array('i')
+    # offset[width+i] = i, every direction is a slice of it
+    offset: array = array('i', range(-width, size+width))
+    border: array = array('i', [-1])*height
+    __: array = array('i', [-1])*(4*size)
+    __[4*width::4] = offset[width:size]
+    right: array = offset[width+1:width+size+1]
+    right[width-1::width] = border
+    __[1::4] = right
+    __[2:4*(size-width):4] = offset[2*width:size+width]
+    left: array = offset[width-1:width+size-1]
+    left[0::width] = border
+    __[3::4] = left
+    return __
+
+@lru_cache(maxsize=SIZES)
+def zobrist(height: int, width: int) -> tuple[array, int]:
+    # a fixed random 64 bit key per wall bit (4 per cell) and the xor of all of
+    # them, which is the key of a maze with every wall standing
+    rng: random.Random = random.Random(f'zobrist {height}x{width}')
+    keys: array = array('Q')
+    keys.frombytes(rng.randbytes(4*keys.itemsize*height*width))
+    return keys, fold(int.from_bytes(keys, sys.byteorder), len(keys))
+
+def fold(words: int, count: int) -> int:
+    # xor of the count 64 bit words of an int, halving it until one is left
+    while count > 1:
+        half: int = (count+1)//2
+        words = words >> 64*half ^ words & ((1 << 64*half) - 1)
+        count = half
+    return words
+
+def slots(walls: bytes, table: list[bytes]) -> bytearray:
+    # one byte per slot (4 per cell) from a wall byte table per direction
+    __: bytearray = bytearray(4*len(walls))
+    for d in range(4):
+        __[d::4] = walls.translate(table[d])
+    return __
+
+def widen(flags: bytes, itemsize: int) -> int:
+    # flag bytes (0 or 1) -> int with all bits of the item set where flagged
+    filled: bytes = flags.translate(FILL)
+    __: bytearray = bytearray(itemsize*len(flags))
+    for k in range(itemsize):
+        __[k::itemsize] = filled
+    return int.from_bytes(__, sys.byteorder)
 
 
 class Maze:
-    def __init__(self, size: tuple[int, int], verbose: int=0, contest_mode:bool=False, remove_walls: int=15):
+    def __init__(self, size: tuple[int, int], verbose: int=0, contest_mode:bool=False, remove_walls: int=15, seed: int | None=None):
         self.height: int = size[0]
         self.width: int = size[1]
 
+    # - seed, with size, remove_walls and contest_mode it determines the made maze
+        self.seed: int = seed if seed is not None else random.randrange(2**64)
+        self.rng: random.Random = random.Random(self.seed)
+
         self.hash: str = "########"
+    # - zobrist: xor of the keys of all standing walls, updated with every wall
+    #   change; the 8 char hash is the sha1 of the ascii render and is only
+    #   recomputed when the zobrist key (or the zone markers) changed
+        self.zobrist: int = 0
+        self.hashed: tuple[tuple, str] = ((), "")
 
         self.remove_walls: int = remove_walls
 
-        self.maze: list[list[Cell]] = [[Cell((y, x)) for x in range(self.width)] for y in range(self.height)]
+        self.walls: bytearray
+        self.zones: bytearray
+        self.forbidden: bytearray
+        self.visited_bits: bytearray
+        self.path_bits: bytearray
+        self.links: array
+        self.adjacency: array
+        self.allocate()
 
         self.verbose: int = verbose
 
         self.make: Maker = Maker(maze=self)
 
-        self.visualize: Visualizer = Visualizer(maze=self)
-
-        self.solve: Solver = Solver(maze=self)
-
-        self.analyze: Analyzer = Analyzer(maze=self)
+        self.observers: Observers = Observers()
+        if verbose:
+            self.observers.append(self.visualize)
 
         self.contest_mode: bool = contest_mode
         self.contest_end: tuple[tuple[int, int], Dir] = (
@@ -53,7 +140,7 @@ class Maze:
             (self.height//2-1, self.width//2-1), (self.height//2-1, self.width//2),
             (self.height//2, self.width//2-1), (self.height//2, self.width//2)
         }
-        self.end_pos: tuple = random.choice(list(self.end_zone)) if not self.contest_mode else self.contest_end[0]
+        self.end_pos: tuple = self.rng.choice(list(self.end_zone)) if not self.contest_mode else self.contest_end[0]
     # - markers for ascii
         self.ziel_marker: tuple = (self.height//2, self.width//2)
         self.ball_marker: tuple = (2, 2)
@@ -63,8 +150,137 @@ class Maze:
 
         self.solved: set[Algorithm] = set()
 
+    # traversals by their sources and opened targets, kept as long as the
+    # identity is the same
+        self.distances_cache: tuple[tuple, dict[tuple, Distances]] = ((), {})
+    # the junction graph, rebuilt once the identity changed
+        self.junctions_cache: tuple[tuple, JunctionGraph | None] = ((), None)
+    # the dead end filled corridor, rebuilt once the identity changed
+        self.corridor_cache: tuple[tuple, bytes] = ((), b'')
+
+    # the stateless helpers are built on first use, a copy starts without them
+    @cached_property
+    def visualize(self) -> Visualizer:
+        return Visualizer(maze=self)
+
+    @cached_property
+    def solve(self) -> Solver:
+        return Solver(maze=self)
+
+    @cached_property
+    def analyze(self) -> Analyzer:
+        return Analyzer(maze=self)
+
+    def allocate(self) -> None:
+        # flat planes indexed by y*width+x, one byte per cell each
+        size: int = self.height*self.width
+        self.walls = bytearray(b'\xFF')*size
+        self.zones = bytearray(size)
+        self.forbidden = bytearray(size)
+        self.visited_bits = bytearray(size)
+        self.path_bits = bytearray(size)
+    # adjacency: 4 slots per cell (UP, RIGHT, DOWN, LEFT) holding the index of
+    # the neighbor behind an open wall or -1, kept in sync by set_walls
+        self.links = links(self.height, self.width)
+        self.adjacency = array('i', [-1])*(4*size)
+        self.zobrist = zobrist(self.height, self.width)[1]
+
+    def set_walls(self, index: int, walls: int) -> None:
+        changed: int = (self.walls[index] ^ walls) & 0x0F
+        if changed:
+            keys: array = zobrist(self.height, self.width)[0]
+            for d in range(4):
+                if changed >> d & 1:
+                    self.zobrist ^= keys[4*index + d]
+        self.walls[index] = walls
+        adjacency: array = self.adjacency
+        for d in range(4):
+            slot: int = 4*index + d
+            adjacency[slot] = -1 if walls >> d & 1 else self.links[slot]
+
+    def relink(self) -> None:
+        # the adjacency from scratch, after the wall plane was replaced: the
+        # links where the wall is open, all bits set (-1) where it stands
+        self.links = links(self.height, self.width)
+        itemsize: int = self.links.itemsize
+        size: int = itemsize*len(self.links)
+        opened: int = widen(slots(self.walls, OPEN), itemsize)
+        adjacency: int = int.from_bytes(self.links, sys.byteorder) & opened | opened ^ ((1 << 8*size) - 1)
+        self.adjacency = array('i')
+        self.adjacency.frombytes(adjacency.to_bytes(size, sys.byteorder))
+        self.rehash()
+
+    def rehash(self) -> None:
+        # the zobrist key from scratch, the xor of the keys of all standing walls
+        keys: array = zobrist(self.height, self.width)[0]
+        standing: int = widen(slots(self.walls, STANDING), keys.itemsize)
+        self.zobrist = fold(int.from_bytes(keys, sys.byteorder) & standing, len(keys))
+
+    def degree(self, index: int) -> int:
+        adjacency: array = self.adjacency
+        forbidden: bytearray = self.forbidden
+        return sum([1 for slot in range(4*index, 4*index+4) if adjacency[slot] >= 0 and not forbidden[adjacency[slot]]])
+
+    def restore(self, walls: bytes, end_pos: tuple, steps: list[MakerSteps]=list(MakerSteps), hash_code: str="") -> None:
+        # rebuilds a made maze from its wall plane, zones follow from the geometry;
+        # a known hash is taken as is instead of rendering the maze for it
+        self.end_pos = end_pos
+        if MakerSteps.ZONES in steps:
+            self.make.mark_zones()
+        self.walls[:] = walls
+        self.relink()
+        for step in steps:
+            self.make.steps[step] = True
+        self.make.steps[MakerSteps.FINAL] = self.make.steps[MakerSteps.ZONES] and (self.make.steps[MakerSteps.PATH] or self.make.steps[MakerSteps.MULTIPLE])
+        if hash_code:
+            self.hashed = (self.identity(), hash_code)
+        self.hash = self.__hash__()
+
+    def distance_field(self, sources: list[tuple]=[]) -> array:
+        # distances of all cells (y*width+x) from the sources, default the start
+        return self.distances(sources=sources).field
+
+    def distances(self, sources: list[tuple]=[], targets: list[tuple]=[]) -> Distances:
+        # one traversal from the sources (default the start) for any targets,
+        # cached until the walls or the zones change; forbidden targets (the
+        # goal cells besides the end) are opened for it, the other targets
+        # don't change the traversal and aren't part of the key
+        opened: tuple = tuple(sorted({target for target in targets if self.forbidden[target[0]*self.width + target[1]]}))
+        key: tuple = (tuple(sources or [self.start_pos]), opened)
+        if self.distances_cache[0] != self.identity():
+            self.distances_cache = (self.identity(), {})
+        cache: dict[tuple, Distances] = self.distances_cache[1]
+        if key not in cache:
+            cache[key] = Distances(self, sources=list(key[0]), opened=list(opened))
+        return cache[key]
+
+    def junctions(self) -> JunctionGraph:
+        # the corridors contracted to edges between junctions, dead ends, the
+        # start and the end, cached until the walls or the zones change
+        key: tuple = (*self.identity(), self.end_pos)
+        if self.junctions_cache[0] != key:
+            self.junctions_cache = (key, JunctionGraph(self))
+        return self.junctions_cache[1]
+
+    def corridor(self) -> bytes:
+        # 1 per cell on some way from the start to the end once every dead end
+        # is filled, cached until the walls or the zones change
+        key: tuple = (*self.identity(), self.end_pos)
+        if self.corridor_cache[0] != key:
+            self.corridor_cache = (key, corridor(self))
+        return self.corridor_cache[1]
+
     def cell(self, pos: tuple) -> Cell:
-        return self.maze[pos[0]][pos[1]]
+        return Cell(self, pos)
+
+    def cells(self) -> Iterator[Cell]:
+        for y in range(self.height):
+            for x in range(self.width):
+                yield Cell(self, (y, x))
+
+    def clear_marks(self) -> None:
+        self.visited_bits[:] = bytes(len(self.visited_bits))
+        self.path_bits[:] = bytes(len(self.path_bits))
     
     def save(self, foldername: str='mazes', filename: str='maze', fileext: str='') -> bool:
         filename = f'{filename}_{self.hash}'
@@ -77,13 +293,49 @@ class Maze:
         print(self.visualize.analysis_board())
 
     def copy(self) -> 'Maze':
-        from copy import deepcopy
-        return deepcopy(self)
+        # copies the planes and the small state, shares the static geometry
+        # (links, zones and markers) and leaves the helpers to be rebuilt
+        __: Maze = Maze.__new__(Maze)
+        __.__dict__.update(self.__dict__)
+        for helper in ('visualize', 'solve', 'analyze'):
+            __.__dict__.pop(helper, None)
+
+        __.walls = bytearray(self.walls)
+        __.zones = bytearray(self.zones)
+        __.forbidden = bytearray(self.forbidden)
+        __.visited_bits = bytearray(self.visited_bits)
+        __.path_bits = bytearray(self.path_bits)
+        __.adjacency = array('i', self.adjacency)
+
+        __.rng = random.Random()
+        __.rng.setstate(self.rng.getstate())
+
+        __.make = Maker(maze=__)
+        __.make.steps = dict(self.make.steps)
+        # other subscribers are shared, the copy gets a visualizer of its own
+        __.observers = Observers([__.visualize if observer is self.__dict__.get('visualize') else observer for observer in self.observers])
+
+        __.paths = {algorithm: [Cell(__, cell.pos) for cell in path] for algorithm, path in self.paths.items()}
+        __.visited = {}
+        __.solved = set(self.solved)
+        # the caches hold results bound to their maze, the copy starts its own
+        __.distances_cache = ((), {})
+        __.junctions_cache = ((), None)
+        __.corridor_cache = ((), b'')
+        return __
     
+    def identity(self) -> tuple:
+        # everything the ascii render of a maze without marks depends on
+        return (self.height, self.width, self.zobrist, self.make.steps[MakerSteps.ZONES])
+
     def __hash__(self) -> str:
+        key: tuple = self.identity()
+        if self.hashed[0] == key:
+            return self.hashed[1]
         import hashlib
         maze: str = self.__str__(algorithm=Algorithm._NONE, paths=False, visited=False, guide=False)
         hash_code: str = hashlib.sha1(maze.encode()).hexdigest()[:len(self.hash)]
+        self.hashed = (key, hash_code)
         return hash_code
     
     def __str__(self, algorithm: Algorithm=Algorithm._NONE, paths: bool=False, visited: bool=False, guide: bool=False) -> str:
@@ -110,110 +362,127 @@ class Maze:
                     elem.append(3*" ")
             
             for ex in range(2*self.width+1):
-
-            # cell and pole positions
-                cy, cx = (ey-1)//2, (ex-1)//2
-                py, px = ey//2, ex//2
-
-                cell = self.maze[cy][cx]
-            # poles
-                if ey % 2 == 0 and ex % 2 == 0:
-                    if self.make.steps[MakerSteps.ZONES] and (py,px) == self.ball_marker:
-                        elem.append(ASCII.ball)
-                    elif self.make.steps[MakerSteps.ZONES] and py > 0 and px > 0 and (py,px) in self.start_zone-{(1,1)}:
-                        elem.append(ASCII.pole_empty)
-                    elif self.make.steps[MakerSteps.ZONES] and (py,px) == self.ziel_marker:
-                        elem .append(ASCII.end)
-                    else:
-                        elem.append(ASCII.pole)
-            # horizontal walls
-                elif ey % 2 == 0:
-                    if cell.walls & DIR.DOWN.wall:
-                        elem.append(ASCII.wall_h)  
-                    else:
-                        elem.append(ASCII.wall_h_empty)
-            # vertical walls
-                elif ex % 2 == 0:
-                    if cell.walls & DIR.RIGHT.wall:
-                        elem.append(ASCII.wall_v)
-                    else:
-                        elem.append(ASCII.wall_v_empty)
-            # cells
-                else:
-                    if self.make.steps[MakerSteps.ZONES] and cell.pos == self.start_pos:
-                        elem.append(ASCII.start)
-                    elif paths and (cell.is_path() and algorithm is Algorithm._NONE or cell.is_path(algorithm)):
-                        if algorithm is Algorithm._NONE:
-                            if len(cell._paths) > 1:
-                                elem.append(ASCII.cell_path_general)
-                            elif cell.is_path(Algorithm.FloodFill):
-                                elem.append(ASCII.cell_path_floodfill)
-                            elif cell.is_path(Algorithm.Dijkstra):
-                                elem.append(ASCII.cell_path_dijkstra)
-                            elif cell.is_path(Algorithm.AStar):
-                                elem.append(ASCII.cell_path_astar)
-                            elif cell.is_path(Algorithm.BFS):
-                                elem.append(ASCII.cell_path_bfs)
-                            elif cell.is_path(Algorithm.DFS):
-                                elem.append(ASCII.cell_path_dfs)
-                            else:
-                                elem.append(ASCII.cell)
-                        elif algorithm is Algorithm.FloodFill and cell.is_path(Algorithm.FloodFill):
-                            elem.append(ASCII.cell_path_floodfill)
-                        elif algorithm is Algorithm.Dijkstra and cell.is_path(Algorithm.Dijkstra):
-                            elem.append(ASCII.cell_path_dijkstra)
-                        elif algorithm is Algorithm.AStar and cell.is_path(Algorithm.AStar):
-                            elem.append(ASCII.cell_path_astar)
-                        elif algorithm is Algorithm.BFS and cell.is_path(Algorithm.BFS):
-                            elem.append(ASCII.cell_path_bfs)
-                        elif algorithm is Algorithm.DFS and cell.is_path(Algorithm.DFS):
-                            elem.append(ASCII.cell_path_dfs)
-                        else:
-                            elem.append(ASCII.cell)
-                    elif visited and self.make.steps[MakerSteps.FINAL] and (cell.is_visited() and algorithm is Algorithm._NONE or cell.is_visited(algorithm)):
-                        if algorithm is Algorithm._NONE:
-                            elem.append(ASCII.cell_visited)
-                        elif algorithm is Algorithm.FloodFill and cell.is_visited(Algorithm.FloodFill):
-                            elem.append(ASCII.cell_visited)
-                        elif algorithm is Algorithm.Dijkstra and cell.is_visited(Algorithm.Dijkstra):
-                            elem.append(ASCII.cell_visited)
-                        elif algorithm is Algorithm.AStar and cell.is_visited(Algorithm.AStar):
-                            elem.append(ASCII.cell_visited)
-                        elif algorithm is Algorithm.BFS and cell.is_visited(Algorithm.BFS):
-                            elem.append(ASCII.cell_visited)
-                        elif algorithm is Algorithm.DFS and cell.is_visited(Algorithm.DFS):
-                            elem.append(ASCII.cell_visited)
-                        else:
-                            elem.append(ASCII.cell)
-                    else:
-                        elem.append(ASCII.cell)
+                elem.append(self.glyph(ey, ex, algorithm=algorithm, paths=paths, visited=visited))
 
             elem.append("\n")
         __: str = "".join(elem)
         return __
     
+    def glyph(self, ey: int, ex: int, algorithm: Algorithm=Algorithm._NONE, paths: bool=False, visited: bool=False) -> str:
+        # the text at row ey and column ex of the ascii grid: poles and walls
+        # on the even rows and columns, cells on the odd ones
+    # cell and pole positions
+        cy, cx = (ey-1)//2, (ex-1)//2
+        py, px = ey//2, ex//2
+
+        walls: int = self.walls[(cy % self.height)*self.width + cx % self.width]
+    # poles
+        if ey % 2 == 0 and ex % 2 == 0:
+            if self.make.steps[MakerSteps.ZONES] and (py,px) == self.ball_marker:
+                return ASCII.ball
+            elif self.make.steps[MakerSteps.ZONES] and py > 0 and px > 0 and (py,px) in self.start_zone-{(1,1)}:
+                return ASCII.pole_empty
+            elif self.make.steps[MakerSteps.ZONES] and (py,px) == self.ziel_marker:
+                return ASCII.end
+            else:
+                return ASCII.pole
+    # horizontal walls
+        elif ey % 2 == 0:
+            if walls & DIR.DOWN.wall:
+                return ASCII.wall_h
+            else:
+                return ASCII.wall_h_empty
+    # vertical walls
+        elif ex % 2 == 0:
+            if walls & DIR.RIGHT.wall:
+                return ASCII.wall_v
+            else:
+                return ASCII.wall_v_empty
+    # cells
+        else:
+            cell: Cell = Cell(self, (cy, cx))
+            if self.make.steps[MakerSteps.ZONES] and cell.pos == self.start_pos:
+                return ASCII.start
+            elif paths and (cell.is_path() and algorithm is Algorithm._NONE or cell.is_path(algorithm)):
+                if algorithm is Algorithm._NONE:
+                    if self.path_bits[cell.index].bit_count() > 1:
+                        return ASCII.cell_path_general
+                    elif cell.is_path(Algorithm.FloodFill):
+                        return ASCII.cell_path_floodfill
+                    elif cell.is_path(Algorithm.Dijkstra):
+                        return ASCII.cell_path_dijkstra
+                    elif cell.is_path(Algorithm.AStar):
+                        return ASCII.cell_path_astar
+                    elif cell.is_path(Algorithm.BFS):
+                        return ASCII.cell_path_bfs
+                    elif cell.is_path(Algorithm.DFS):
+                        return ASCII.cell_path_dfs
+                    elif cell.is_path(Algorithm.BiBFS):
+                        return ASCII.cell_path_bibfs
+                    elif cell.is_path(Algorithm.BiAStar):
+                        return ASCII.cell_path_biastar
+                    else:
+                        return ASCII.cell
+                elif algorithm is Algorithm.FloodFill and cell.is_path(Algorithm.FloodFill):
+                    return ASCII.cell_path_floodfill
+                elif algorithm is Algorithm.Dijkstra and cell.is_path(Algorithm.Dijkstra):
+                    return ASCII.cell_path_dijkstra
+                elif algorithm is Algorithm.AStar and cell.is_path(Algorithm.AStar):
+                    return ASCII.cell_path_astar
+                elif algorithm is Algorithm.BFS and cell.is_path(Algorithm.BFS):
+                    return ASCII.cell_path_bfs
+                elif algorithm is Algorithm.DFS and cell.is_path(Algorithm.DFS):
+                    return ASCII.cell_path_dfs
+                elif algorithm is Algorithm.BiBFS and cell.is_path(Algorithm.BiBFS):
+                    return ASCII.cell_path_bibfs
+                elif algorithm is Algorithm.BiAStar and cell.is_path(Algorithm.BiAStar):
+                    return ASCII.cell_path_biastar
+                else:
+                    return ASCII.cell
+            elif visited and self.make.steps[MakerSteps.FINAL] and (cell.is_visited() and algorithm is Algorithm._NONE or cell.is_visited(algorithm)):
+                if algorithm is Algorithm._NONE:
+                    return ASCII.cell_visited
+                elif algorithm is Algorithm.FloodFill and cell.is_visited(Algorithm.FloodFill):
+                    return ASCII.cell_visited
+                elif algorithm is Algorithm.Dijkstra and cell.is_visited(Algorithm.Dijkstra):
+                    return ASCII.cell_visited
+                elif algorithm is Algorithm.AStar and cell.is_visited(Algorithm.AStar):
+                    return ASCII.cell_visited
+                elif algorithm is Algorithm.BFS and cell.is_visited(Algorithm.BFS):
+                    return ASCII.cell_visited
+                elif algorithm is Algorithm.DFS and cell.is_visited(Algorithm.DFS):
+                    return ASCII.cell_visited
+                elif algorithm is Algorithm.BiBFS and cell.is_visited(Algorithm.BiBFS):
+                    return ASCII.cell_visited
+                elif algorithm is Algorithm.BiAStar and cell.is_visited(Algorithm.BiAStar):
+                    return ASCII.cell_visited
+                else:
+                    return ASCII.cell
+            else:
+                return ASCII.cell
+
     def __format__(self, format_spec: str='ascii') -> str:
         if format_spec == 'ascii':
             return self.__str__()
         elif format_spec == 'hex':
             __: str = ""
-            for row in self.maze:
-                for cell in row:
-                    __ += f"{cell.walls:02X} "
+            for y in range(self.height):
+                for walls in self.walls[y*self.width:(y+1)*self.width]:
+                    __ += f"{walls:02X} "
                 __ += "\n"
             return __
         elif format_spec == 'bin' or format_spec == 'bin8':
             __: str = ""
-            for row in self.maze:
-                for cell in row:
-                    __ += f"{cell.walls:08b} "
+            for y in range(self.height):
+                for walls in self.walls[y*self.width:(y+1)*self.width]:
+                    __ += f"{walls:08b} "
                 __ += "\n"
             return __
         elif format_spec == 'bin4':
             __: str = ""
-            for row in self.maze:
-                for cell in row:
-                    __ += f"{cell.walls:08b} "[4:]
+            for y in range(self.height):
+                for walls in self.walls[y*self.width:(y+1)*self.width]:
+                    __ += f"{walls:08b} "[4:]
                 __ += "\n"
             return __
         else:
@@ -0,0 +1,129 @@
+import time
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from maze import Maze
+
+from algorithm import Algorithm
+from cell import Cell
+from direction import Dir
+
+# events sent while a maze is made and solved, cells are flat indices (y*width+x)
+# - on_visit:          a cell is entered by the maker (_NONE) or expanded by a solver
+# - on_wall_removed:   the wall of a cell in a direction (and its neighbor's) is removed
+# - on_wall_inserted:  the wall of a cell in a direction (and its neighbor's) is inserted
+# - on_made:           the maker has run its steps
+# - on_path:           a solver has marked its path
+# - on_solved:         a solver has found the end
+# the hot loops look the handler up once and skip it entirely when nobody
+# subscribed, so a maze without observers pays nothing per step
+
+
+class Observer:
+    def on_visit(self, maze: 'Maze', index: int, algorithm: Algorithm) -> None:
+        pass
+
+    def on_wall_removed(self, maze: 'Maze', index: int, direction: Dir) -> None:
+        pass
+
+    def on_wall_inserted(self, maze: 'Maze', index: int, direction: Dir) -> None:
+        pass
+
+    def on_made(self, maze: 'Maze') -> None:
+        pass
+
+    def on_path(self, maze: 'Maze', path: list[Cell], algorithm: Algorithm) -> None:
+        pass
+
+    def on_solved(self, maze: 'Maze', algorithm: Algorithm) -> None:
+        pass
+
+
+class Observers(list):
+    # the subscribers of a maze, empty means falsy, so `if maze.observers`
+    # is all the check a loop needs before it sends anything
+    def on_visit(self, maze: 'Maze', index: int, algorithm: Algorithm) -> None:
+        for observer in self:
+            observer.on_visit(maze, index, algorithm)
+
+    def on_wall_removed(self, maze: 'Maze', index: int, direction: Dir) -> None:
+        for observer in self:
+            observer.on_wall_removed(maze, index, direction)
+
+    def on_wall_inserted(self, maze: 'Maze', index: int, direction: Dir) -> None:
+        for observer in self:
+            observer.on_wall_inserted(maze, index, direction)
+
+    def on_made(self, maze: 'Maze') -> None:
+        for observer in self:
+            observer.on_made(maze)
+
+    def on_path(self, maze: 'Maze', path: list[Cell], algorithm: Algorithm) -> None:
+        for observer in self:
+            observer.on_path(maze, path, algorithm)
+
+    def on_solved(self, maze: 'Maze', algorithm: Algorithm) -> None:
+        for observer in self:
+            observer.on_solved(maze, algorithm)
+
+
+class Metrics(Observer):
+    # counts per algorithm and the time from the first visit to the solution
+    def __init__(self):
+        self.visits: dict[Algorithm, int] = {}
+        self.lengths: dict[Algorithm, int] = {}
+        self.seconds: dict[Algorithm, float] = {}
+        self.walls_removed: int = 0
+        self.walls_inserted: int = 0
+        self.started: dict[Algorithm, float] = {}
+
+    def on_visit(self, maze: 'Maze', index: int, algorithm: Algorithm) -> None:
+        if algorithm not in self.started:
+            self.started[algorithm] = time.perf_counter()
+        self.visits[algorithm] = self.visits.get(algorithm, 0) + 1
+
+    def on_wall_removed(self, maze: 'Maze', index: int, direction: Dir) -> None:
+        self.walls_removed += 1
+
+    def on_wall_inserted(self, maze: 'Maze', index: int, direction: Dir) -> None:
+        self.walls_inserted += 1
+
+    def on_path(self, maze: 'Maze', path: list[Cell], algorithm: Algorithm) -> None:
+        self.lengths[algorithm] = len(path)
+
+    def on_solved(self, maze: 'Maze', algorithm: Algorithm) -> None:
+        if algorithm in self.started:
+            self.seconds[algorithm] = time.perf_counter() - self.started.pop(algorithm)
+
+    def __str__(self) -> str:
+        __: str = f"> Metrics: {self.walls_removed} walls removed | {self.walls_inserted} walls inserted\n"
+        for algorithm, visits in self.visits.items():
+            __ += f"  {algorithm.name:>10} | {visits:8} visits | {self.lengths.get(algorithm, 0):6} path"
+            if algorithm in self.seconds:
+                __ += f" | {self.seconds[algorithm]:.4f} s"
+            __ += "\n"
+        return __
+
+
+class Tracer(Observer):
+    # records every event as a tuple (event, *arguments) without the maze
+    def __init__(self):
+        self.events: list[tuple] = []
+
+    def on_visit(self, maze: 'Maze', index: int, algorithm: Algorithm) -> None:
+        self.events.append(('visit', index, algorithm))
+
+    def on_wall_removed(self, maze: 'Maze', index: int, direction: Dir) -> None:
+        self.events.append(('wall_removed', index, direction))
+
+    def on_wall_inserted(self, maze: 'Maze', index: int, direction: Dir) -> None:
+        self.events.append(('wall_inserted', index, direction))
+
+    def on_made(self, maze: 'Maze') -> None:
+        self.events.append(('made',))
+
+    def on_path(self, maze: 'Maze', path: list[Cell], algorithm: Algorithm) -> None:
+        self.events.append(('path', tuple(cell.index for cell in path), algorithm))
+
+    def on_solved(self, maze: 'Maze', algorithm: Algorithm) -> None:
+        self.events.append(('solved', algorithm))
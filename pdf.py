@@ -0,0 +1,141 @@
+import atexit
+import hashlib
+import os
+import shutil
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from importlib.util import find_spec
+
+# pdf conversion off the main path: the svgs are converted by a pool of worker
+# processes while the run goes on, and every drawing only once - the pdf is kept
+# in a cache folder under the sha1 of the svg bytes and copied to every place
+# it is wanted; deferred, nothing is converted before finish(), which runs at
+# exit at the latest, so no caller loses its last pdfs; finish() also drops
+# the least recently used pdfs once the cache is over its limit
+
+CACHE: str = '.pdf_cache'
+LIMIT: int = 256*2**20
+
+
+def render(svg: bytes, path: str) -> None:
+    # runs in a worker, the pdf appears in the cache only when it is complete
+    from cairosvg import svg2pdf
+    svg2pdf(bytestring=svg, write_to=path+'.tmp')
+    os.replace(path+'.tmp', path)
+
+
+class Converter:
+    def __init__(self, jobs: int | None=None, defer: bool=False, cache: str=CACHE, limit: int=LIMIT):
+        self.jobs: int | None = jobs
+        self.defer: bool = defer
+        self.cache: str = cache
+        self.limit: int = limit
+        self.available: bool | None = None
+        self.executor: ProcessPoolExecutor | None = None
+        # digest -> the svg while it waits for finish(), its conversion and
+        # the pdf files it goes to
+        self.deferred: dict[str, bytes] = {}
+        self.futures: dict[str, Future] = {}
+        self.destinations: dict[str, list[str]] = {}
+
+    def convert(self, svg: str, path: str) -> None:
+        if self.available is None:
+            self.available = find_spec('cairosvg') is not None
+            if not self.available:
+                print("cairosvg is not installed. Please run 'pip install cairosvg' to install it.")
+        if not self.available:
+            return
+
+        data: bytes = svg.encode()
+        digest: str = hashlib.sha1(data).hexdigest()
+        cached: str = os.path.join(self.cache, f'{digest}.pdf')
+        if os.path.exists(cached):
+            # a hit counts as a use, the cache is pruned by the time of the last
+            os.utime(cached)
+            return self.copy(cached, path)
+
+        self.destinations.setdefault(digest, []).append(path)
+        if digest in self.futures or digest in self.deferred:
+            return
+        if self.defer:
+            self.deferred[digest] = data
+        else:
+            self.submit(digest, data)
+        self.collect()
+
+    def submit(self, digest: str, data: bytes) -> None:
+        os.makedirs(self.cache, exist_ok=True)
+        path: str = os.path.join(self.cache, f'{digest}.pdf')
+        try:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.jobs)
+            self.futures[digest] = self.executor.submit(render, data, path)
+        except RuntimeError:
+            # the interpreter is shutting down (finish at exit), no pool takes
+            # work anymore, so it is converted right here
+            future: Future = Future()
+            try:
+                render(data, path)
+                future.set_result(None)
+            except Exception as exception:
+                future.set_exception(exception)
+            self.futures[digest] = future
+
+    def collect(self, wait: bool=False) -> None:
+        # copies the finished conversions to their pdf files
+        for digest in list(self.futures):
+            future: Future = self.futures[digest]
+            if not wait and not future.done():
+                continue
+            del self.futures[digest]
+            destinations: list[str] = self.destinations.pop(digest)
+            try:
+                future.result()
+            except Exception as exception:
+                print(f"{os.path.basename(destinations[0])} can't be converted: {exception}")
+                continue
+            for path in destinations:
+                self.copy(os.path.join(self.cache, f'{digest}.pdf'), path)
+
+    def copy(self, cached: str, path: str) -> None:
+        try:
+            shutil.copyfile(cached, path)
+        except FileNotFoundError:
+            print(f"File {os.path.basename(path)} can't be saved to {os.path.dirname(path)}/.")
+
+    def finish(self) -> None:
+        # converts whatever was deferred and waits for every pdf
+        for digest, data in self.deferred.items():
+            self.submit(digest, data)
+        self.deferred.clear()
+        self.collect(wait=True)
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        self.prune()
+
+    def prune(self) -> None:
+        # keeps the most recently used pdfs up to the limit, drops the rest
+        try:
+            names: list[str] = [name for name in os.listdir(self.cache) if name.endswith('.pdf')]
+        except FileNotFoundError:
+            return
+        entries: list[tuple[float, int, str]] = []
+        for name in names:
+            try:
+                stat: os.stat_result = os.stat(os.path.join(self.cache, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, os.path.join(self.cache, name)))
+        total: int = 0
+        for _, size, path in sorted(entries, reverse=True):
+            total += size
+            if total > self.limit:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+
+converter: Converter = Converter()
+atexit.register(converter.finish)
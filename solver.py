@@ -5,43 +5,106 @@ if TYPE_CHECKING:
 
 from algorithm import Algorithm
 from cell import Cell
+from junctions import JunctionGraph
+
+# corridor byte -> 1 for the sealed cells outside of it
+SEALED: bytes = bytes([1]) + bytes(255)
+
+# the algorithms with a junction graph version and whether it is a*, the
+# others have no meaning on weighted corridors
+CONTRACTED: dict[Algorithm, bool] = {Algorithm.Dijkstra: False, Algorithm.AStar: True}
 
 
 class Solver:
     def __init__(self, maze: 'Maze'):
         self.maze: Maze = maze
 
-    def __call__(self, algorithms: list[Algorithm]=[]) -> bool:
+    def __call__(self, algorithms: list[Algorithm]=[], pruned: bool=False, contracted: bool=False) -> bool:
         if not algorithms:
-            for algorithm in Algorithm:
-                if algorithm == Algorithm._NONE:
-                    continue
-                algorithms.append(algorithm)
-        
+            algorithms = [algorithm for algorithm in (CONTRACTED if contracted else Algorithm) if algorithm != Algorithm._NONE]
+        if contracted and any([algorithm not in CONTRACTED for algorithm in algorithms]):
+            raise ValueError(f"Only {' and '.join([algorithm.name for algorithm in CONTRACTED])} can solve on the junction graph.")
+
+        # pruned, the solvers only see the corridor left by dead end filling
+        forbidden: bytearray = self.maze.forbidden
+        if pruned:
+            sealed: bytes = self.maze.corridor().translate(SEALED)
+            self.maze.forbidden = bytearray((int.from_bytes(forbidden, 'little') | int.from_bytes(sealed, 'little')).to_bytes(len(forbidden), 'little'))
+
         start_cell: Cell = self.maze.cell(self.maze.start_pos)
         solutions = set()
-        for algorithm in algorithms:
-            path: list[Cell] = []
-            if algorithm == Algorithm.FloodFill:
-                from floodfill import FloodFill
-                path = FloodFill(self.maze, start_cell)
-            elif algorithm == Algorithm.Dijkstra:
-                from dijkstra import Djikstra
-                path = Djikstra(self.maze, start_cell)
-            elif algorithm == Algorithm.AStar:
-                from astar import AStar
-                path = AStar(self.maze, start_cell)
-            elif algorithm == Algorithm.BFS:
-                from bfs import BFS
-                path = BFS(self.maze, start_cell)
-            elif algorithm == Algorithm.DFS:
-                from dfs import DFS
-                path = DFS(self.maze, start_cell)
-
-            if path:
-                solutions.add(algorithm)
-                self.maze.paths[algorithm] = path
-                self.maze.solved.add(algorithm)
-                self.maze.visualize(step=True, algorithm=algorithm)
-
-        return bool(solutions)
\ No newline at end of file
+        try:
+            # contracted, dijkstra and a* search the junction graph; a pruned
+            # graph isn't cached, it only holds for the sealed maze
+            graph: JunctionGraph | None = None
+            if contracted:
+                graph = JunctionGraph(self.maze) if pruned else self.maze.junctions()
+            for algorithm in algorithms:
+                path: list[Cell] = []
+                if graph is not None:
+                    path = contracted_path(self.maze, graph, algorithm)
+                elif algorithm == Algorithm.FloodFill:
+                    from floodfill import FloodFill
+                    path = FloodFill(self.maze, start_cell)
+                elif algorithm == Algorithm.Dijkstra:
+                    from dijkstra import Djikstra
+                    path = Djikstra(self.maze, start_cell)
+                elif algorithm == Algorithm.AStar:
+                    from astar import AStar
+                    path = AStar(self.maze, start_cell)
+                elif algorithm == Algorithm.BFS:
+                    from bfs import BFS
+                    path = BFS(self.maze, start_cell)
+                elif algorithm == Algorithm.DFS:
+                    from dfs import DFS
+                    path = DFS(self.maze, start_cell)
+                elif algorithm == Algorithm.BiBFS:
+                    from bibfs import BiBFS
+                    path = BiBFS(self.maze, start_cell)
+                elif algorithm == Algorithm.BiAStar:
+                    from biastar import BiAStar
+                    path = BiAStar(self.maze, start_cell)
+
+                if path:
+                    solutions.add(algorithm)
+                    self.maze.paths[algorithm] = path
+                    self.maze.solved.add(algorithm)
+                    if self.maze.observers:
+                        self.maze.observers.on_solved(self.maze, algorithm)
+        finally:
+            self.maze.forbidden = forbidden
+
+        return bool(solutions)
+
+
+def reconstruct_path(maze: 'Maze', parents: Any, current: int, algorithm: Algorithm) -> list[Cell]:
+    # walks the flat predecessor array back to the start (-1) and marks the path
+    indices: list[int] = []
+    while current >= 0:
+        indices.append(current)
+        current = parents[current]
+    indices.reverse()
+    return mark_path(maze, indices, algorithm)
+
+
+def mark_path(maze: 'Maze', indices: Any, algorithm: Algorithm) -> list[Cell]:
+    bit: int = 1 << algorithm.value
+    path: list[Cell] = []
+    for index in indices:
+        maze.path_bits[index] |= bit
+        path.append(Cell(maze, divmod(index, maze.width)))
+    if maze.observers:
+        maze.observers.on_path(maze, path, algorithm)
+    return path
+
+
+def contracted_path(maze: 'Maze', graph: JunctionGraph, algorithm: Algorithm) -> list[Cell]:
+    # the expanded nodes are the visited cells, the path is expanded to cells
+    indices: list[int] = graph.path(astar=CONTRACTED[algorithm])
+    bit: int = 1 << algorithm.value
+    on_visit = maze.observers.on_visit if maze.observers else None
+    for index in graph.visited:
+        maze.visited_bits[index] |= bit
+        if on_visit:
+            on_visit(maze, index, algorithm)
+    return mark_path(maze, indices, algorithm) if indices else []
@@ -3,16 +3,22 @@ import os
 from algorithm import Algorithm
 from ascii import ASCII
 from direction import DIR
+from pdf import converter
 
+# what an edge of the lattice carries: a wall, a removed or an inserted one
+WALL: int = 1
+OUT: int = 2
+IN: int = 4
 
 class SVG:
-    def __init__(self, maze, foldername: str, filename: str, to_pdf: bool=True, paths: bool=True, zones: bool=True, markers: bool=True, helpers: bool=False, changes: bool=False, overview: bool=True) -> None:
+    def __init__(self, maze, foldername: str, filename: str, to_pdf: bool=True, paths: bool=True, zones: bool=True, markers: bool=True, helpers: bool=False, changes: bool=False, overview: bool=True, merged: bool=True, fragments: dict | None=None) -> None:
         self.paths: bool = paths
         self.zones: bool = zones
         self.markers: bool = markers
         self.helpers: bool = helpers
         self.changes: bool = changes
         self.overview: bool = overview
+        self.merged: bool = merged
 
         file_name: str = f'{filename}_{maze.hash}'
         svg_name: str = f'{file_name}.svg'
@@ -21,25 +27,26 @@ class SVG:
         if not os.path.exists(foldername+'/svg/'):
             os.makedirs(foldername+'/svg/')
 
+        svg: str = self.svg(maze, fragments)
         try:
             with open(foldername+'/svg/'+svg_name, 'w') as f:
-                f.write(self.svg(maze))
+                f.write(svg)
         except FileNotFoundError:
             return print(f"File {svg_name} can't be saved {foldername}/svg/.")
         
         if to_pdf:
+            # converted in the background, main waits for it with converter.finish()
             if not os.path.exists(foldername+'/pdf/'):
                 os.makedirs(foldername+'/pdf/')
-            try:
-                from cairosvg import svg2pdf
-                svg2pdf(url=foldername+'/svg/'+svg_name, write_to=foldername+'/pdf/'+pdf_name)
-            except ImportError:
-                return print("cairosvg is not installed. Please run 'pip install cairosvg' to install it.")
-            except FileNotFoundError:
-                return print(f"File {pdf_name} can't be saved to {foldername}/pdf/.")
+            converter.convert(svg, foldername+'/pdf/'+pdf_name)
     
 
-    def svg(self, maze) -> str:
+    def svg(self, maze, fragments: dict | None=None) -> str:
+        # fragments caches the layers by name, drawings of the same maze that
+        # share it build every common layer once
+        if fragments is None:
+            fragments = {}
+
         factor: int = 2
 
         cell_size: int = 180
@@ -70,10 +77,17 @@ class SVG:
         astar_color: str = "#0000FF"
         bfs_color: str = "#FF00FF"
         dfs_color: str = "#00FFFF"
+        bibfs_color: str = "#FF8000"
+        biastar_color: str = "#8000FF"
 
         fonz_size: int = cell_size//3
         spacer_height: int = fonz_size if self.overview else 0
-        text_height: int = fonz_size*15 if self.overview else 0
+        text_height: int = fonz_size*17 if self.overview else 0
+
+        def layer(name: str, build):
+            if name not in fragments:
+                fragments[name] = build()
+            return fragments[name]
 
         def frame() -> str:
             return f'<rect x="0" y="0" width="{maze.width*cell_size+frame_size*2}" height="{maze.height*cell_size+frame_size*2}" fill="{bg_color}" />\n'
@@ -92,65 +106,148 @@ class SVG:
                 __ += f'<rect transform="rotate({i*90}, {(maze.width*cell_size+frame_size*2)/2}, {(maze.height*cell_size+frame_size*2)/2})" x="{frame_size+border_size+(4*cell_size)+translate}" y="{frame_size-border_size}" width="{2*cell_size-2*border_size}" height="{4*cell_size+2*border_size}" fill="{helper_bg_color}" stroke="{helper_line_color}" stroke-width="{line_width}" />\n'
             return  __
         
+        def edges() -> tuple[list[tuple[int, int, int]], list[tuple[int, int, int]], bytearray]:
+            # every wall edge once: (py, px, flags) for the horizontal edge from
+            # lattice point (py, px) to the right and the vertical one down from
+            # it, flags WALL, OUT (removed) and IN (inserted) from both cells'
+            # bits; per lattice point the pole sides its walls end on
+            planes: bytearray = maze.walls
+            height, width = maze.height, maze.width
+
+            def flags(sides: list[tuple[int, int]]) -> int:
+                __: int = 0
+                for index, wall in sides:
+                    walls: int = planes[index]
+                    if walls & wall:
+                        __ |= WALL
+                    if walls & 0xF0 != 0xF0:
+                        if walls >> 4 & wall and not walls & wall:
+                            __ |= OUT
+                        if not walls >> 4 & wall and walls & wall:
+                            __ |= IN
+                return __
+
+            poles: bytearray = bytearray((height+1)*(width+1))
+            horizontal: list[tuple[int, int, int]] = []
+            for py in range(height+1):
+                for px in range(width):
+                    sides: list[tuple[int, int]] = []
+                    if py < height:
+                        sides.append((py*width+px, DIR.UP.wall))
+                    if py > 0:
+                        sides.append(((py-1)*width+px, DIR.DOWN.wall))
+                    flags_: int = flags(sides)
+                    if flags_:
+                        horizontal.append((py, px, flags_))
+                    if flags_ & WALL:
+                        poles[py*(width+1)+px] |= DIR.LEFT.wall
+                        poles[py*(width+1)+px+1] |= DIR.RIGHT.wall
+            vertical: list[tuple[int, int, int]] = []
+            for py in range(height):
+                for px in range(width+1):
+                    sides: list[tuple[int, int]] = []
+                    if px < width:
+                        sides.append((py*width+px, DIR.LEFT.wall))
+                    if px > 0:
+                        sides.append((py*width+px-1, DIR.RIGHT.wall))
+                    flags_: int = flags(sides)
+                    if flags_:
+                        vertical.append((py, px, flags_))
+                    if flags_ & WALL:
+                        poles[py*(width+1)+px] |= DIR.UP.wall
+                        poles[(py+1)*(width+1)+px] |= DIR.DOWN.wall
+            return horizontal, vertical, poles
+
         def walls() -> str:
-            __: str = ""
-            for ey, row in enumerate(maze.maze):
-                for ex, cell in enumerate(row):
-                    y, x = ey*cell_size+frame_size, ex*cell_size+frame_size
-                    wall_as_lines: bool = True
-                    if wall_as_lines:
-                        __ += holes(x, y)
-                        if cell.walls & DIR.UP.wall:
-                            __ += pole(x, y, DIR.LEFT) + wall_line(x, y, DIR.UP) + pole(x+cell_size, y, DIR.RIGHT)
-                        if cell.walls & DIR.RIGHT.wall:
-                            __ += pole(x+cell_size, y, DIR.UP) + wall_line(x, y, DIR.RIGHT) + pole(x+cell_size, y+cell_size, DIR.DOWN)
-                        if cell.walls & DIR.DOWN.wall:
-                            __ += pole(x, y+cell_size, DIR.LEFT) + wall_line(x, y, DIR.DOWN) + pole(x+cell_size, y+cell_size, DIR.RIGHT)
-                        if cell.walls & DIR.LEFT.wall:
-                            __ += pole(x, y, DIR.UP) + wall_line(x, y, DIR.LEFT) + pole(x, y+cell_size, DIR.DOWN)
-                    else:
-                        if cell.walls & DIR.UP.wall:
-                            __ += wall_rect(x, y, DIR.UP)
-                        if cell.walls & DIR.RIGHT.wall:
-                            __ += wall_rect(x, y, DIR.RIGHT)
-                        if cell.walls & DIR.DOWN.wall:
-                            __ += wall_rect(x, y, DIR.DOWN)
-                        if cell.walls & DIR.LEFT.wall:
-                            __ += wall_rect(x, y, DIR.LEFT)
-
-                    if self.changes:
-                        if cell.walls & 0xF0 != 0xF0:
-                            # changes out
-                            changes_mode: str = "out"
-                            if cell.walls >> 4 & DIR.UP.wall and not cell.walls & DIR.UP.wall:
-                                __ += wall_line(x, y, DIR.UP, changes=changes_mode)
-                            if cell.walls >> 4 & DIR.RIGHT.wall and not cell.walls & DIR.RIGHT.wall:
-                                __ += wall_line(x, y, DIR.RIGHT, changes=changes_mode)
-                            if cell.walls >> 4 & DIR.DOWN.wall and not cell.walls & DIR.DOWN.wall:
-                                __ += wall_line(x, y, DIR.DOWN, changes=changes_mode)
-                            if cell.walls >> 4 & DIR.LEFT.wall and not cell.walls & DIR.LEFT.wall:
-                                __ += wall_line(x, y, DIR.LEFT, changes=changes_mode)
-
-                            # changes in
-                            changes_mode: str = "in"
-
-                            if not cell.walls >> 4 & DIR.UP.wall and cell.walls & DIR.UP.wall:
-                                __ += pole(x, y, DIR.LEFT) + wall_line(x, y, DIR.UP, changes=changes_mode) + pole(x+cell_size, y, DIR.RIGHT)
-                            if not cell.walls >> 4 & DIR.RIGHT.wall and cell.walls & DIR.RIGHT.wall:
-                                __ += pole(x+cell_size, y, DIR.UP) + wall_line(x, y, DIR.RIGHT, changes=changes_mode) + pole(x+cell_size, y+cell_size, DIR.DOWN)
-                            if not cell.walls >> 4 & DIR.DOWN.wall and cell.walls & DIR.DOWN.wall:
-                                __ += pole(x, y+cell_size, DIR.LEFT) + wall_line(x, y, DIR.DOWN, changes=changes_mode) + pole(x+cell_size, y+cell_size, DIR.RIGHT)
-                            if not cell.walls >> 4 & DIR.LEFT.wall and cell.walls & DIR.LEFT.wall:
-                                __ += pole(x, y, DIR.UP) + wall_line(x, y, DIR.LEFT, changes=changes_mode) + pole(x, y+cell_size, DIR.DOWN)
+            # removed walls lie under the holes and walls, inserted ones on
+            # top of the walls and all poles on top of everything; merged, every
+            # layer is a single element
+            mode: str = 'merged' if self.merged else 'lines'
+            __: list[str] = []
+            if self.changes:
+                __.append(layer(f'{mode} out', lambda: strokes(OUT)))
+            __.append(layer(f'{mode} holes', holes))
+            __.append(layer(f'{mode} walls', lambda: strokes(WALL)))
+            if self.changes:
+                __.append(layer(f'{mode} in', lambda: strokes(IN)))
+            __.append(layer(f'{mode} poles', poles))
+            return "".join(__)
+
+        def runs(edges: list[tuple[int, int]]) -> list[tuple[int, int, int]]:
+            # (line, first, last) of the consecutive positions on each line
+            __: list[tuple[int, int, int]] = []
+            for line, position in sorted(edges):
+                if __ and __[-1][0] == line and __[-1][2] == position-1:
+                    __[-1] = (line, __[-1][1], position)
+                else:
+                    __.append((line, position, position))
             return __
-        
-        def holes(x: int, y: int) -> str:
-            __: str = ""
-            for iy in range(2):
-                for ix in range(2):
-                    __ += f'<circle cx="{x+(ix*cell_size)}" cy="{y+(iy*cell_size)}" r="{hole_radius}" fill="{hole_color}" />\n'
+
+        def strokes(kind: int) -> str:
+            # the edges of one kind, merged as runs of adjacent edges in one path
+            horizontal, vertical, _ = layer('edges', edges)
+            changes: str | None = {OUT: "out", IN: "in"}.get(kind)
+            if not self.merged:
+                __: list[str] = []
+                for py, px, flags_ in horizontal:
+                    if flags_ & kind:
+                        __.append(wall_line(px*cell_size+frame_size, py*cell_size+frame_size, DIR.UP, changes=changes))
+                for py, px, flags_ in vertical:
+                    if flags_ & kind:
+                        __.append(wall_line(px*cell_size+frame_size, py*cell_size+frame_size, DIR.LEFT, changes=changes))
+                return "".join(__)
+
+            d: list[str] = []
+            for py, first, last in runs([(py, px) for py, px, flags_ in horizontal if flags_ & kind]):
+                d.append(f'M {first*cell_size+frame_size+pole_size/2} {py*cell_size+frame_size} H {(last+1)*cell_size+frame_size+pole_size/2}')
+            for px, first, last in runs([(px, py) for py, px, flags_ in vertical if flags_ & kind]):
+                d.append(f'M {px*cell_size+frame_size} {first*cell_size+frame_size+pole_size/2} V {(last+1)*cell_size+frame_size+pole_size/2}')
+            if not d:
+                return ""
+            color: str = wall_color if not changes else (wall_out_color if changes == "out" else wall_in_color)
+            return f'<path d="{" ".join(d)}" fill="none" stroke="{color}" stroke-width="{pole_size}" />\n'
+
+        def holes() -> str:
+            # one hole per lattice point, merged a pattern tile filling one rect
+            if not self.merged:
+                return "".join([
+                    f'<circle cx="{frame_size+px*cell_size}" cy="{frame_size+py*cell_size}" r="{hole_radius}" fill="{hole_color}" />\n'
+                    for py in range(maze.height+1) for px in range(maze.width+1)
+                ])
+            __: str = f'<defs><pattern id="holes" x="{frame_size-cell_size/2}" y="{frame_size-cell_size/2}" width="{cell_size}" height="{cell_size}" patternUnits="userSpaceOnUse"><circle cx="{cell_size/2}" cy="{cell_size/2}" r="{hole_radius}" fill="{hole_color}" /></pattern></defs>\n'
+            __ += f'<rect x="{frame_size-cell_size/2}" y="{frame_size-cell_size/2}" width="{(maze.width+1)*cell_size}" height="{(maze.height+1)*cell_size}" fill="url(#holes)" />\n'
             return __
 
+        def poles() -> str:
+            # every pole once, merged all outlines in one path
+            _, _, sides = layer('edges', edges)
+            points: list[tuple[int, int, int]] = [
+                (px*cell_size+frame_size, py*cell_size+frame_size, sides[py*(maze.width+1)+px])
+                for py in range(maze.height+1) for px in range(maze.width+1) if sides[py*(maze.width+1)+px]
+            ]
+            if not self.merged:
+                return "".join([pole(x, y, directions) for x, y, directions in points])
+            if not points:
+                return ""
+            return f'<path d="{" ".join([outline(x, y, directions) for x, y, directions in points])}" fill="{pole_color}" />\n'
+
+        def outline(x, y, directions: int) -> str:
+            # the rounded square with the corners squared that a wall covers
+            left, top, right, bottom, r = x-pole_size/2, y-pole_size/2, x+pole_size/2, y+pole_size/2, pole_size/4
+            top_left: int = directions & (DIR.DOWN.wall | DIR.RIGHT.wall)
+            top_right: int = directions & (DIR.DOWN.wall | DIR.LEFT.wall)
+            bottom_right: int = directions & (DIR.UP.wall | DIR.LEFT.wall)
+            bottom_left: int = directions & (DIR.UP.wall | DIR.RIGHT.wall)
+            __: str = f'M {left if top_left else left+r} {top} H {right if top_right else right-r} '
+            __ += '' if top_right else f'A {r} {r} 0 0 1 {right} {top+r} '
+            __ += f'V {bottom if bottom_right else bottom-r} '
+            __ += '' if bottom_right else f'A {r} {r} 0 0 1 {right-r} {bottom} '
+            __ += f'H {left if bottom_left else left+r} '
+            __ += '' if bottom_left else f'A {r} {r} 0 0 1 {left} {bottom-r} '
+            __ += f'V {top if top_left else top+r} '
+            __ += '' if top_left else f'A {r} {r} 0 0 1 {left+r} {top} '
+            return __ + 'Z'
+
         def zones() -> str:
             __: str = ""
             for pos in maze.start_zone:
@@ -177,40 +274,20 @@ class SVG:
             y, x = frame_size+maze.ball_marker[0]*cell_size, frame_size+maze.ball_marker[1]*cell_size
             return f'<circle cx="{x}" cy="{y}" r="{ball_radius}" fill="{color}" stroke="{stroke}" stroke-width="{stroke_width}" />\n'
 
-        def pole(x, y, direction) -> str:
-            __: str = ""
+        def pole(x, y, directions: int) -> str:
+            # a rounded square, squared off on the side of every wall it ends
             x_pole, y_pole = x-pole_size/2, y-pole_size/2
-            __ += f'<rect x="{x_pole}" y="{y_pole}" width="{pole_size}" height="{pole_size}" rx="{pole_size/4}" ry="{pole_size/4}" fill="{pole_color}" />\n'
-            if direction == DIR.UP:
-                x, y, width, height = x_pole, y, pole_size, pole_size/2
-            elif direction == DIR.RIGHT:
-                x, y, width, height = x_pole, y_pole, pole_size/2, pole_size
-            elif direction == DIR.DOWN:
-                x, y, width, height = x_pole, y_pole, pole_size, pole_size/2
-            elif direction == DIR.LEFT:
-                x, y, width, height = x, y_pole, pole_size/2, pole_size
-            else:
-                return ""
-            __ += f'<rect x="{x}" y="{y}" width="{width}" height="{height}" fill="{pole_color}" />\n'
+            __: str = f'<rect x="{x_pole}" y="{y_pole}" width="{pole_size}" height="{pole_size}" rx="{pole_size/4}" ry="{pole_size/4}" fill="{pole_color}" />\n'
+            if directions & DIR.UP.wall:
+                __ += f'<rect x="{x_pole}" y="{y}" width="{pole_size}" height="{pole_size/2}" fill="{pole_color}" />\n'
+            if directions & DIR.RIGHT.wall:
+                __ += f'<rect x="{x_pole}" y="{y_pole}" width="{pole_size/2}" height="{pole_size}" fill="{pole_color}" />\n'
+            if directions & DIR.DOWN.wall:
+                __ += f'<rect x="{x_pole}" y="{y_pole}" width="{pole_size}" height="{pole_size/2}" fill="{pole_color}" />\n'
+            if directions & DIR.LEFT.wall:
+                __ += f'<rect x="{x}" y="{y_pole}" width="{pole_size/2}" height="{pole_size}" fill="{pole_color}" />\n'
             return __
         
-        def wall_rect(x, y, direction, changes=None) -> str:
-            x, y = x-pole_size/2, y-pole_size/2
-            wall_length: int = cell_size + pole_size
-            wall_thickness: int = pole_size
-            if direction == DIR.UP:
-                x, y, h, w = x, y, wall_thickness, wall_length
-            elif direction == DIR.RIGHT:
-                x, y, h, w = x+cell_size, y, wall_length, wall_thickness
-            elif direction == DIR.DOWN:
-                x, y, h, w = x, y+cell_size, wall_thickness, wall_length
-            elif direction == DIR.LEFT:
-                x, y, h, w = x, y, wall_length, wall_thickness
-            else:
-                return ""
-            color = wall_color if not changes else (wall_out_color if changes == "out" else wall_in_color)
-            return f'<rect x="{x}" y="{y}" width="{w}" height="{h}" fill="{color}" />\n'
-        
         def wall_line(x, y, direction, changes=None) -> str:
             x_pole, y_pole = x+pole_size/2, y+pole_size/2
             wall_length: int = cell_size
@@ -227,30 +304,31 @@ class SVG:
             color = wall_color if not changes else (wall_out_color if changes == "out" else wall_in_color)
             return f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="{color}" stroke-width="{pole_size}" />\n'
         
+        def style(algorithm: Algorithm) -> tuple[str, int]:
+            # color and offset from the cell center of an algorithm's path
+            if algorithm is Algorithm.FloodFill:
+                return floodfill_color, -2
+            elif algorithm is Algorithm.Dijkstra:
+                return djikstra_color, -1
+            elif algorithm is Algorithm.AStar:
+                return astar_color, 0
+            elif algorithm is Algorithm.BFS:
+                return bfs_color, 1
+            elif algorithm is Algorithm.DFS:
+                return dfs_color, 2
+            elif algorithm is Algorithm.BiBFS:
+                return bibfs_color, -3
+            elif algorithm is Algorithm.BiAStar:
+                return biastar_color, 3
+            else:
+                return "", 0
+
         def paths() -> str:
             __: str = ""
             for algorithm in Algorithm:
                 if algorithm == Algorithm._NONE:
                     continue
-                color: str = ""
-                offset: int = 0
-                if algorithm is Algorithm.FloodFill:
-                    color = floodfill_color
-                    offset = -2
-                elif algorithm is Algorithm.Dijkstra:
-                    color = djikstra_color
-                    offset = -1
-                elif algorithm is Algorithm.AStar:
-                    color = astar_color
-                    offset = 0
-                elif algorithm is Algorithm.BFS:
-                    color = bfs_color
-                    offset = 1
-                elif algorithm is Algorithm.DFS:
-                    color = dfs_color
-                    offset = 2
-                else:
-                    continue
+                color, offset = style(algorithm)
                 path = maze.paths.get(algorithm)
 
                 if not path:
@@ -280,33 +358,38 @@ class SVG:
             __: str = ""
             __ += f'<rect x="{frame_size}" y="{maze.height*cell_size+frame_size+fonz_size}" width="{maze.width*cell_size}" height="{text_height}" stroke="#676767" stroke-width="{path_line_width}" stroke-linejoin="round" fill="#DDDDDD" />\n'
 
+            # the rows of the path analysis are the solved algorithms in order
             start_alg: int = 9
+            solved: list[Algorithm] = [algorithm for algorithm in Algorithm if algorithm in maze.solved]
 
             for i, line in enumerate(analysis_maze.split('\n')):
                 y = maze.height*cell_size+frame_size+fonz_size*(i+1)+spacer_height
 
                 text_color = "#000000"
-                if i == start_alg+0: text_color = floodfill_color
-                if i == start_alg+1: text_color = djikstra_color
-                if i == start_alg+2: text_color = astar_color
-                if i == start_alg+3: text_color = bfs_color
-                if i == start_alg+4: text_color = dfs_color
+                if 0 <= i-start_alg < len(solved): text_color = style(solved[i-start_alg])[0]
 
                 __ += f'<text x="{frame_size+cell_size}" y="{y}" font-size="{fonz_size}" font-family="monospace" text-anchor="start" alignment-baseline="central" fill="{text_color}" font-weight="bold" xml:space="preserve">{line}</text>\n'
             return __
 
-        __: str = f'<svg width="{maze.width*cell_size+frame_size*2}" height="{maze.height*cell_size+frame_size*2+spacer_height+text_height}" xmlns="http://www.w3.org/2000/svg">\n'
+        __: list[str] = [f'<svg width="{maze.width*cell_size+frame_size*2}" height="{maze.height*cell_size+frame_size*2+spacer_height+text_height}" xmlns="http://www.w3.org/2000/svg">\n']
 
-        __ += frame()
-        __ += helpers() if self.helpers else ""
-        __ += zones() if self.zones else ""
-        __ += walls()
-        __ += ball()
-        __ += paths() if self.paths else ""
-        __ += markers() if self.markers else ""
-        __ += overview() if self.overview else ""
+        __.append(layer('frame', frame))
+        __.append(layer('helpers', helpers) if self.helpers else "")
+        __.append(layer('zones', zones) if self.zones else "")
+        __.append(walls())
+        __.append(layer('ball', ball))
+        __.append(layer('paths', paths) if self.paths else "")
+        __.append(layer('markers', markers) if self.markers else "")
+        __.append(layer('overview', overview) if self.overview else "")
         
-        __ += "</svg>"
+        __.append("</svg>")
+
+        return "".join(__)
+
 
-        return __
-    
\ No newline at end of file
+def export(maze, *variants: dict) -> None:
+    # writes several drawings of one maze, each variant the arguments of an SVG
+    # (foldername, filename, paths, ...), and builds their shared layers once
+    fragments: dict = {}
+    for variant in variants:
+        SVG(maze, fragments=fragments, **variant)
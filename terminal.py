@@ -0,0 +1,95 @@
+import sys
+import time
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from maze import Maze
+
+from algorithm import Algorithm
+from direction import DIR, Dir
+from maker import MakerSteps
+
+# incremental ansi renderer for the step animation: the maze is painted once per
+# view (algorithm, paths, visited) and afterwards only the glyphs of the changed
+# cells and walls are written with cursor addressing, at most fps times a second
+
+CLEAR: str = "\033[H\033[2J"
+
+
+class Terminal:
+    def __init__(self, maze: 'Maze', fps: int=30):
+        self.maze: 'Maze' = maze
+        self.interval: float = 1/fps
+        self.last: float = 0.0
+        self.view: tuple[Algorithm, bool, bool, bool] | None = None
+        self.visits: int = 0
+        # dirty (ey, ex) positions of the ascii grid
+        self.dirty: set[tuple[int, int]] = set()
+
+    def show(self, algorithm: Algorithm, paths: bool, visited: bool) -> None:
+        # switches the view, a new view repaints the whole maze; the markers
+        # appear once the zones are made, so that is part of the view as well
+        view: tuple[Algorithm, bool, bool, bool] = (algorithm, paths, visited, self.maze.make.steps[MakerSteps.ZONES])
+        if self.view != view:
+            self.view = view
+            self.visits = sum([1 for bits in self.maze.visited_bits if bits & 1 << algorithm.value])
+            self.paint()
+
+    def paint(self) -> None:
+        algorithm, paths, visited, _ = self.view
+        sys.stdout.write(CLEAR + self.maze.__str__(algorithm=algorithm, paths=paths, visited=visited))
+        self.dirty.clear()
+        self.flush()
+
+    def clear(self) -> None:
+        sys.stdout.write(CLEAR)
+        sys.stdout.flush()
+        self.view = None
+        self.dirty.clear()
+
+    def visit(self, index: int) -> None:
+        y, x = divmod(index, self.maze.width)
+        self.visits += 1
+        self.dirty.add((2*y+1, 2*x+1))
+
+    def cell(self, index: int) -> None:
+        y, x = divmod(index, self.maze.width)
+        self.dirty.add((2*y+1, 2*x+1))
+
+    def wall(self, index: int, direction: Dir) -> None:
+        # the grid draws the wall between two cells once, as DOWN or RIGHT of
+        # the upper or left cell; the outer rows and columns wrap around
+        y, x = divmod(index, self.maze.width)
+        if direction is DIR.UP:
+            self.dirty.add((2*y, 2*x+1))
+        elif direction is DIR.DOWN:
+            self.dirty.add((2*y+2, 2*x+1))
+        elif direction is DIR.LEFT:
+            self.dirty.add((2*y+1, 2*x))
+        elif direction is DIR.RIGHT:
+            self.dirty.add((2*y+1, 2*x+2))
+
+    def tick(self, force: bool=False) -> None:
+        now: float = time.perf_counter()
+        if force or now - self.last >= self.interval:
+            self.flush()
+            self.last = now
+
+    def flush(self) -> None:
+        if self.view is None:
+            return
+        algorithm, paths, visited, _ = self.view
+        maze: 'Maze' = self.maze
+        height: int = 2*maze.height+1
+
+        __: list[str] = []
+        for ey, ex in self.dirty:
+            # wrapped outer walls are drawn on both sides of the grid
+            for ey_ in {ey % (height-1), ey} if ey % 2 == 0 else {ey}:
+                for ex_ in {ex % (2*maze.width), ex} if ex % 2 == 0 else {ex}:
+                    __.append(f"\033[{ey_+1};{4*(ex_//2) + ex_%2 + 1}H")
+                    __.append(maze.glyph(ey_, ex_, algorithm=algorithm, paths=paths, visited=visited))
+        self.dirty.clear()
+        __.append(f"\033[{height+1};1H\033[2K{self.maze.visualize.maze_info(algorithm, visited=self.visits)}\n")
+        sys.stdout.write("".join(__))
+        sys.stdout.flush()
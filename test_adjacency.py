@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from direction import DIR
+from maze import Maze
+
+
+def reference(maze: Maze) -> list[int]:
+    # the open neighbor of every slot from the walls and the geometry alone
+    __: list[int] = []
+    for y in range(maze.height):
+        for x in range(maze.width):
+            for direction in DIR.ALL:
+                ny, nx = y + direction.y, x + direction.x
+                inside: bool = 0 <= ny < maze.height and 0 <= nx < maze.width
+                __.append(ny*maze.width + nx if inside and not maze.walls[y*maze.width + x] & direction.wall else -1)
+    return __
+
+
+@pytest.mark.parametrize('seed', range(4))
+@pytest.mark.parametrize('size', [(16, 16), (12, 20)])
+def test_adjacency(made, seed, size):
+    maze: Maze = made(seed, size=size, contest_mode=seed % 2 == 1)
+    assert list(maze.adjacency) == reference(maze)
+    for index in range(len(maze.walls)):
+        neighbors = maze.cell(divmod(index, maze.width)).neighbors()
+        assert [(cell.index, direction) for cell, direction in neighbors] == [
+            (maze.adjacency[4*index + d], direction) for d, direction in enumerate(DIR.ALL)
+            if maze.adjacency[4*index + d] >= 0 and not maze.forbidden[maze.adjacency[4*index + d]]
+        ]
+
+
+def test_links():
+    maze: Maze = Maze(size=(7, 9))
+    for index in range(len(maze.walls)):
+        for d, direction in enumerate(DIR.ALL):
+            neighbor: int = maze.links[4*index + d]
+            if neighbor >= 0:
+                assert maze.links[4*neighbor + DIR.ALL.index(direction.opposite)] == index
+    # the geometry is the adjacency of a maze without walls
+    maze.walls[:] = bytes(len(maze.walls))
+    assert list(maze.links) == reference(maze)
+
+
+def test_wall_edits(made):
+    # removing and inserting walls keeps the table in step
+    maze: Maze = made(2)
+    rng: random.Random = random.Random(2)
+    for _ in range(200):
+        y, x = rng.randrange(1, maze.height-1), rng.randrange(1, maze.width-1)
+        direction = rng.choice(DIR.ALL)
+        if rng.randrange(2):
+            maze.make.remove_wall(maze.cell((y, x)), direction)
+        else:
+            maze.make.insert_wall(maze.cell((y, x)), direction)
+        assert list(maze.adjacency) == reference(maze)
+
+
+def test_shuffle_is_opt_in(made):
+    maze: Maze = made(3)
+    state = maze.rng.getstate()
+    for cell in maze.cells():
+        cell.neighbors()
+        cell.neighbors(all=True)
+    assert maze.rng.getstate() == state
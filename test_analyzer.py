@@ -0,0 +1,50 @@
+import pytest
+
+from algorithm import Algorithm
+from ascii import ASCII
+from direction import DIR
+from maze import Maze
+
+
+def counted(maze: Maze) -> dict[str, int]:
+    # the counts as the analyzer took them from the ascii render and the cells
+    render: str = str(maze)
+    return {
+        'valid': sum([1 for cell in maze.cells() if not cell.forbidden]),
+        'branches': sum([1 for cell in maze.cells() if len(cell.neighbors()) > 2]),
+        'walls': render.count(ASCII.wall_v) + render.count(ASCII.wall_h),
+        'poles': render.count(ASCII.pole)
+    }
+
+
+@pytest.mark.parametrize('seed', range(6))
+@pytest.mark.parametrize('size, remove_walls', [((16, 16), 15), ((12, 20), 40), ((10, 10), 0)])
+def test_counts(made, seed, size, remove_walls):
+    maze: Maze = made(seed, size=size, remove_walls=remove_walls, contest_mode=seed % 2 == 1)
+    analysis: dict[str, int] = maze.analyze()
+    assert {key: analysis[key] for key in ('valid', 'branches', 'walls', 'poles')} == counted(maze)
+    assert analysis['shortest'] == maze.distances().distance(maze.end_pos) + 1
+
+
+def test_invalidated_by_walls(made):
+    maze: Maze = made(1)
+    before: dict[str, int] = maze.analyze()
+    cell = next(cell for cell in maze.cells() if 0 < cell.y < maze.height-1 and 0 < cell.x < maze.width-2 and cell.walls & DIR.RIGHT.wall)
+    maze.make.remove_wall(cell, DIR.RIGHT)
+    after: dict[str, int] = maze.analyze()
+    assert after['walls'] == before['walls'] - 1
+    assert {key: after[key] for key in ('valid', 'branches', 'walls', 'poles')} == counted(maze)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_paths(made, seed):
+    maze: Maze = made(seed)
+    maze.solve(algorithms=[Algorithm.BFS, Algorithm.DFS])
+    for algorithm in (Algorithm.BFS, Algorithm.DFS):
+        path = maze.paths[algorithm]
+        analysis: dict[str, int] = maze.analyze(algorithm)
+        assert analysis['length'] == len(path)
+        assert analysis['turns'] == sum([1 for a, c in zip(path, path[2:]) if a.y != c.y and a.x != c.x])
+        assert analysis['branches'] == sum([1 for cell in path if len(cell.neighbors()) > 2])
+        assert analysis['visited'] == sum([1 for cell in maze.cells() if cell.is_visited(algorithm)])
+        assert maze.analyze(algorithm) == analysis
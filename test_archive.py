@@ -0,0 +1,83 @@
+import pytest
+
+import main
+
+from algorithm import Algorithm
+from archive import Archive, ArchiveWriter, make_variant, rebuild, with_changes
+from maker import MakerSteps
+from maze import Maze
+
+VARIANTS: int = 4
+
+
+def batch(path: str, seed: int, contest_mode: bool=False) -> list[Maze]:
+    # the base and its variants with their changes, written as testbatch does
+    maze: Maze = Maze(size=(16, 16), contest_mode=contest_mode, seed=seed)
+    maze.make(steps=[MakerSteps.ZONES, MakerSteps.PATH])
+    archive: ArchiveWriter = ArchiveWriter(path, maze)
+    mazes: list[Maze] = [maze]
+    for i in range(VARIANTS):
+        maze_copy: Maze = maze.copy()
+        edits: list[tuple[int, int, int, int]] = make_variant(maze_copy, i+1, bytes(mazes[-1].walls))
+        assert archive.add(maze_copy.hash, edits) == i+1
+        mazes.append(maze_copy)
+    archive.close()
+    return mazes
+
+
+def test_with_changes():
+    walls: bytes = bytes(range(256))
+    before: bytes = bytes(reversed(range(256)))
+    assert with_changes(walls, before) == bytes((wall & 0x0F) | (old & 0x0F) << 4 for wall, old in zip(walls, before))
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_load(tmp_path, seed):
+    mazes: list[Maze] = batch(str(tmp_path/'batch.mzb'), seed, contest_mode=seed == 1)
+    archive: Archive = Archive(str(tmp_path/'batch.mzb'))
+    assert len(archive) == VARIANTS
+    for variant, maze in enumerate(mazes):
+        other: Maze = Maze(size=(10, 10))
+        archive.load(other, variant)
+        assert other.hash == maze.hash
+        assert other.walls == maze.walls
+        assert other.end_pos == maze.end_pos
+        if variant:
+            assert archive.hash(variant) == maze.hash
+            assert archive.find(maze.hash) == variant
+    assert archive.find('0'*len(mazes[0].hash)) == -1
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_rebuild_without_archive(tmp_path, seed):
+    mazes: list[Maze] = batch(str(tmp_path/'batch.mzb'), seed)
+    for variant, maze in enumerate(mazes):
+        other: Maze = Maze(size=(16, 16), seed=seed)
+        rebuild(other, variant)
+        assert other.hash == maze.hash
+        assert other.walls == maze.walls
+        without: Maze = Maze(size=(16, 16), seed=seed)
+        rebuild(without, variant, changes=False)
+        assert without.walls == bytes(wall | 0xF0 for wall in maze.walls)
+
+
+def test_rejects_other_files(tmp_path):
+    (tmp_path/'batch.mzb').write_bytes(b'MAZE' + bytes(16))
+    with pytest.raises(ValueError):
+        Archive(str(tmp_path/'batch.mzb'))
+
+
+def test_testbatch(tmp_path, monkeypatch):
+    # the archive testbatch writes holds the variants rebuilt from its seed
+    monkeypatch.chdir(tmp_path)
+    main.testbatch(batch_size=3, size=(16, 16), remove_walls=15, contest_mode=False, verbose=0, algorithms=[Algorithm.BFS], graphics=False, seed=5)
+    [path] = tmp_path.glob('batch_*/batch.mzb')
+    archive: Archive = Archive(str(path))
+    assert len(archive) == 3
+    for variant in range(4):
+        maze: Maze = Maze(size=(10, 10))
+        archive.load(maze, variant)
+        other: Maze = Maze(size=(16, 16), seed=5)
+        rebuild(other, variant)
+        assert other.hash == maze.hash
+        assert other.walls == maze.walls
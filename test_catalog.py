@@ -0,0 +1,67 @@
+from algorithm import Algorithm
+from catalog import Catalog
+from maze import Maze
+
+
+def solved(maze: Maze) -> Maze:
+    maze.solve(algorithms=[Algorithm.BFS, Algorithm.DFS])
+    return maze
+
+
+def test_add_find(made, tmp_path):
+    catalog: Catalog = Catalog(str(tmp_path/'catalog.sqlite'))
+    maze: Maze = solved(made(1, contest_mode=True))
+    catalog.add(maze, 'mazes', f'maze_{maze.hash}')
+    assert catalog.find(maze.hash) == (16, 16, 1, maze.remove_walls, maze.seed, 'mazes', f'maze_{maze.hash}')
+    assert catalog.find('0'*len(maze.hash)) is None
+    catalog.close()
+
+    # kept on disk, a new connection finds it
+    catalog = Catalog(str(tmp_path/'catalog.sqlite'))
+    assert catalog.find(maze.hash) is not None
+    catalog.close()
+
+
+def test_record_again(made, tmp_path):
+    catalog: Catalog = Catalog(str(tmp_path/'catalog.sqlite'))
+    maze: Maze = solved(made(2))
+    catalog.add(maze, 'mazes', 'maze')
+    # without a location the known one is kept
+    catalog.add(maze)
+    assert catalog.find(maze.hash)[5:] == ('mazes', 'maze')
+    # a stale entry is replaced as a whole
+    catalog.record(maze.hash, (20, 20), True, 0, 7)
+    catalog.add(maze, 'batch', 'batch#1')
+    assert catalog.find(maze.hash) == (16, 16, 0, maze.remove_walls, maze.seed, 'batch', 'batch#1')
+    catalog.close()
+
+
+def test_query(made, tmp_path):
+    catalog: Catalog = Catalog(str(tmp_path/'catalog.sqlite'))
+    mazes: list[Maze] = [solved(made(seed, size=(16, 16) if seed < 4 else (12, 20), contest_mode=seed % 2 == 1)) for seed in range(6)]
+    for maze in mazes:
+        catalog.add(maze)
+
+    assert {row[0] for row in catalog.query(size=(16, 16))} == {maze.hash for maze in mazes[:4]}
+    assert {row[0] for row in catalog.query(contest_mode=True)} == {maze.hash for maze in mazes if maze.contest_mode}
+
+    rows: list[tuple] = catalog.query(algorithm=Algorithm.BFS)
+    lengths: dict[str, int] = {maze.hash: maze.analyze(Algorithm.BFS)['length'] for maze in mazes}
+    assert [row[7] for row in rows] == sorted(lengths.values())
+    assert all(lengths[row[0]] == row[7] for row in rows)
+    middle: int = sorted(lengths.values())[3]
+    assert all(row[7] >= middle for row in catalog.query(algorithm=Algorithm.BFS, min_length=middle))
+    assert all(row[7] <= middle for row in catalog.query(algorithm=Algorithm.BFS, max_length=middle))
+    assert catalog.query(algorithm=Algorithm.AStar) == []
+    catalog.close()
+
+
+def test_64_bit_seeds(made, tmp_path):
+    # sqlite integers are signed, the seed comes back as it went in
+    catalog: Catalog = Catalog(str(tmp_path/'catalog.sqlite'))
+    for seed in (0, 2**63-1, 2**63, 2**64-1):
+        maze: Maze = made(seed)
+        catalog.add(maze)
+        assert catalog.find(maze.hash)[4] == seed
+        assert [row[4] for row in catalog.query() if row[0] == maze.hash] == [seed]
+    catalog.close()
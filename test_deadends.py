@@ -0,0 +1,59 @@
+import pytest
+
+from algorithm import Algorithm
+from deadends import corridor, fill_dead_ends
+from maze import Maze
+
+ALGORITHMS: list[Algorithm] = [algorithm for algorithm in Algorithm if algorithm != Algorithm._NONE]
+CASES: list[tuple[int, tuple[int, int], int, bool]] = [
+    (seed, size, remove_walls, seed % 2 == 0)
+    for seed in range(4)
+    for size, remove_walls in (((16, 16), 15), ((24, 24), 30), ((10, 10), 0))
+]
+
+
+
+@pytest.mark.parametrize('seed, size, remove_walls, contest_mode', CASES)
+def test_corridor(made, seed, size, remove_walls, contest_mode):
+    maze: Maze = made(seed, size=size, remove_walls=remove_walls, contest_mode=contest_mode)
+    cells: bytes = corridor(maze)
+    assert cells == maze.corridor()
+    assert sum(cells) == bin(fill_dead_ends(maze)).count('1')
+    start: int = maze.cell(maze.start_pos).index
+    end: int = maze.cell(maze.end_pos).index
+    assert cells[start] and cells[end]
+    for index, kept in enumerate(cells):
+        if not kept:
+            continue
+        assert not maze.forbidden[index]
+        # no dead end is left but the start and the end
+        if index not in (start, end):
+            assert sum(1 for neighbor in maze.adjacency[4*index:4*index+4] if neighbor >= 0 and cells[neighbor]) >= 2
+
+    # every shortest path stays in the corridor
+    maze.solve(algorithms=[Algorithm.BFS, Algorithm.AStar])
+    assert all(cells[cell.index] for cell in maze.paths[Algorithm.BFS] + maze.paths[Algorithm.AStar])
+
+
+@pytest.mark.parametrize('seed, size, remove_walls, contest_mode', CASES)
+def test_pruned_solve(made, seed, size, remove_walls, contest_mode):
+    maze: Maze = made(seed, size=size, remove_walls=remove_walls, contest_mode=contest_mode)
+    pruned: Maze = maze.copy()
+    assert maze.solve(algorithms=list(ALGORITHMS))
+    assert pruned.solve(algorithms=list(ALGORITHMS), pruned=True)
+    # the sealed cells are only kept out while solving
+    assert pruned.forbidden == maze.forbidden
+    for algorithm in ALGORITHMS:
+        assert all(maze.corridor()[cell.index] for cell in pruned.paths[algorithm])
+        if algorithm != Algorithm.DFS:
+            assert len(pruned.paths[algorithm]) == len(maze.paths[algorithm]), algorithm
+
+
+@pytest.mark.parametrize('seed, size, remove_walls, contest_mode', CASES[:4])
+def test_pruned_analysis(made, seed, size, remove_walls, contest_mode):
+    maze: Maze = made(seed, size=size, remove_walls=remove_walls, contest_mode=contest_mode)
+    analysis: dict[str, int] = maze.analyze()
+    pruned: dict[str, int] = maze.analyze(pruned=True)
+    assert pruned['shortest'] == analysis['shortest']
+    assert pruned['branches'] <= analysis['branches']
+    assert pruned['corridor'] == sum(maze.corridor())
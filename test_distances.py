@@ -0,0 +1,78 @@
+import pytest
+
+from direction import DIR
+from maze import Maze
+from wavefront import Wavefront
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_paths(made, seed):
+    maze: Maze = made(seed, contest_mode=seed % 2 == 1)
+    distances = maze.distances()
+    assert distances is maze.distances(sources=[maze.start_pos])
+    assert distances is maze.distances(targets=[maze.end_pos])
+    assert list(distances.field) == list(Wavefront([maze])()[0])
+    # the predecessors are only built for a path
+    assert 'parents' not in distances.__dict__
+
+    path: list[int] = distances.path()
+    assert path[0] == maze.cell(maze.start_pos).index and path[-1] == maze.cell(maze.end_pos).index
+    assert len(path) == distances.distance(maze.end_pos) + 1
+    for current, following in zip(path, path[1:]):
+        assert following in maze.adjacency[4*current:4*current+4]
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_goal_cells(made, seed):
+    maze: Maze = made(seed, contest_mode=seed % 2 == 1)
+    goals: list[tuple[int, int]] = sorted(maze.end_zone)
+    # forbidden, the other goal cells can't be reached unless opened
+    assert [maze.distances().distance(goal) >= 0 for goal in goals] == [goal == maze.end_pos for goal in goals]
+    distances = maze.distances(targets=goals)
+    assert all(distances.distance(goal) >= 0 for goal in goals)
+    assert distances.nearest(goals) == maze.end_pos
+
+    # opened from the outside, another goal cell can be the nearest
+    goal: tuple[int, int] = next(goal for goal in goals if goal != maze.end_pos)
+    direction = DIR.UP if goal[0] < maze.height//2 else DIR.DOWN
+    maze.make.remove_wall(maze.cell(goal), direction)
+    distances = maze.distances(targets=goals)
+    outside: tuple[int, int] = (goal[0]+direction.y, goal[1]+direction.x)
+    assert 0 <= distances.distance(goal) <= distances.distance(outside)+1
+    assert distances.distance(distances.nearest(goals)) == min(distances.distance(target) for target in goals)
+    assert maze.forbidden[maze.cell(goal).index]
+
+
+def test_follow_the_walls(made):
+    maze: Maze = made(1)
+    distances = maze.distances()
+    index: int = next(
+        index for index in range(len(maze.walls))
+        if maze.links[4*index+1] >= 0 and maze.adjacency[4*index+1] < 0
+        and not maze.forbidden[index] and not maze.forbidden[index+1]
+    )
+    maze.make.remove_wall(maze.cell(divmod(index, maze.width)), DIR.RIGHT)
+    assert maze.distances() is not distances
+    assert list(maze.distances().field) == list(Wavefront([maze])()[0])
+    # taken before the change, they can't walk the new walls
+    with pytest.raises(ValueError):
+        distances.path()
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_copies_keep_their_own(made, seed):
+    maze: Maze = made(seed)
+    maze.distances()
+    maze.junctions()
+    maze.corridor()
+    copy: Maze = maze.copy()
+    distances = copy.distances(sources=[maze.end_pos])
+    assert distances.maze is copy
+    for index in range(len(copy.walls)):
+        if copy.links[4*index+1] >= 0 and copy.adjacency[4*index+1] < 0 and not copy.forbidden[index] and not copy.forbidden[index+1]:
+            copy.make.remove_wall(copy.cell(divmod(index, copy.width)), DIR.RIGHT)
+    path: list[int] = maze.distances(sources=[maze.end_pos]).path(maze.start_pos)
+    assert path and path[-1] == maze.cell(maze.start_pos).index
+    for current, following in zip(path, path[1:]):
+        assert following in maze.adjacency[4*current:4*current+4]
+    assert maze.junctions().maze is maze and copy.junctions().maze is copy
@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+from files import HEADER, decode, encode, pack_walls, unpack_walls
+from maze import Maze
+
+SIZES: list[tuple[int, int]] = [(16, 16), (11, 13)]
+
+
+def same(maze: Maze, other: Maze) -> None:
+    assert other.hash == maze.hash
+    assert other.walls == maze.walls
+    assert other.forbidden == maze.forbidden
+    assert (other.start_pos, other.end_pos, other.contest_end) == (maze.start_pos, maze.end_pos, maze.contest_end)
+    assert other.make.steps == maze.make.steps
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_pack_walls_round_trip(made, size):
+    maze: Maze = made(1, size=size)
+    cells: int = size[0]*size[1]
+    packed: bytes = pack_walls(maze.walls)
+    assert len(packed) == (cells+1)//2
+    assert unpack_walls(packed, cells) == maze.walls
+
+
+@pytest.mark.parametrize('seed', range(4))
+@pytest.mark.parametrize('size', SIZES)
+def test_encode_decode(made, seed, size):
+    maze: Maze = made(seed, size=size, contest_mode=seed % 2 == 1)
+    other: Maze = Maze(size=(10, 10))
+    assert decode(other, encode(maze))
+    same(maze, other)
+    assert (other.seed, other.contest_mode, other.remove_walls) == (maze.seed, maze.contest_mode, maze.remove_walls)
+
+
+def test_encode_decode_keeps_changes(made):
+    maze: Maze = made(2)
+    maze.walls[5] = maze.walls[5] & 0x0F | 0x30
+    data: bytes = encode(maze)
+    assert len(data) == HEADER.size + len(maze.walls)
+    other: Maze = Maze(size=(10, 10))
+    assert decode(other, data)
+    assert other.walls == maze.walls
+
+
+def test_decode_rejects_bad_data(made):
+    data: bytes = encode(made(3))
+    other: Maze = Maze(size=(10, 10))
+    assert not decode(other, data[:HEADER.size-1])
+    assert not decode(other, data[:-1])
+    assert not decode(other, data + b'\x00')
+    assert not decode(other, b'XXXX' + data[4:])
+
+
+@pytest.mark.parametrize('fileext', ['txt', 'maze'])
+def test_save_load(made, tmp_path, monkeypatch, fileext):
+    monkeypatch.chdir(tmp_path)
+    for seed in range(3):
+        maze: Maze = made(seed, contest_mode=seed == 1)
+        assert maze.save(foldername='mazes', filename='maze', fileext=fileext)
+        other: Maze = Maze(size=(10, 10))
+        assert other.load(foldername='mazes', filename=f'maze_{maze.hash}', fileext=fileext)
+        same(maze, other)
+
+
+def test_load_from_hash(made, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    maze: Maze = made(4)
+    maze.save(foldername='mazes', filename='maze', fileext='maze')
+    other: Maze = Maze(size=(10, 10))
+    assert other.load(id_hash=maze.hash)
+    same(maze, other)
+
+    # a txt only save is found by scanning the files
+    maze = made(5)
+    maze.save(foldername='mazes', filename='maze', fileext='txt')
+    other = Maze(size=(10, 10))
+    assert other.load(id_hash=maze.hash)
+    same(maze, other)
+    assert not Maze(size=(10, 10)).load(id_hash='0'*len(maze.hash))
+
+
+def test_load_txt_of_another_maze(made, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # a file named after one hash but holding another maze isn't taken
+    maze: Maze = made(6)
+    maze.save(foldername='mazes', filename='maze', fileext='txt')
+    other: str = made(7).hash
+    os.rename(f'mazes/txt/maze_{maze.hash}.txt', f'mazes/txt/maze_{other}.txt')
+    assert not Maze(size=(10, 10)).load(id_hash=other)
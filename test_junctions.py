@@ -0,0 +1,65 @@
+import pytest
+
+from algorithm import Algorithm
+from junctions import JunctionGraph
+from maze import Maze
+from solver import CONTRACTED
+
+CASES: list[tuple[int, tuple[int, int], int, bool]] = [
+    (seed, size, remove_walls, seed % 2 == 1)
+    for seed in range(4)
+    for size, remove_walls in (((16, 16), 15), ((12, 20), 40), ((10, 10), 0))
+]
+
+
+@pytest.mark.parametrize('seed, size, remove_walls, contest_mode', CASES)
+def test_graph(made, seed, size, remove_walls, contest_mode):
+    maze: Maze = made(seed, size=size, remove_walls=remove_walls, contest_mode=contest_mode)
+    graph: JunctionGraph = maze.junctions()
+    # every corridor is one edge each way, as long as the cells it stands for
+    for node, edges in graph.edges.items():
+        for target, steps, _, cells in edges:
+            assert steps == len(cells) + 1
+            assert any([back == node and back_cells == cells[::-1] for back, _, _, back_cells in graph.edges[target]])
+            for cell in cells:
+                assert cell not in graph.edges and maze.degree(cell) == 2
+
+
+@pytest.mark.parametrize('seed, size, remove_walls, contest_mode', CASES)
+def test_contracted(made, seed, size, remove_walls, contest_mode):
+    reference: Maze = made(seed, size=size, remove_walls=remove_walls, contest_mode=contest_mode)
+    shortest: int = reference.distances().distance(reference.end_pos) + 1
+    for pruned in (False, True):
+        maze: Maze = made(seed, size=size, remove_walls=remove_walls, contest_mode=contest_mode)
+        assert maze.solve(pruned=pruned, contracted=True)
+        assert maze.solved == set(CONTRACTED)
+        for algorithm in CONTRACTED:
+            path: list[int] = [cell.index for cell in maze.paths[algorithm]]
+            assert len(path) == shortest
+            for current, following in zip(path, path[1:]):
+                assert following in maze.adjacency[4*current:4*current+4]
+            # the expanded nodes are what it explored
+            assert maze.analyze(algorithm)['visited'] > 0
+        maze.visualize.analysis_board()
+
+
+def test_contracted_takes_only_graph_algorithms(made):
+    maze: Maze = made(1)
+    with pytest.raises(ValueError):
+        maze.solve(algorithms=[Algorithm.DFS], contracted=True)
+    assert not maze.solved and maze.forbidden == made(1).forbidden
+
+
+def test_endpoints(made):
+    maze: Maze = made(1)
+    graph: JunctionGraph = maze.junctions()
+    assert len(graph.path()) == maze.distances().distance(maze.end_pos) + 1
+    corridor: int = next(index for index in range(len(maze.walls)) if index not in graph.edges and not maze.forbidden[index])
+    with pytest.raises(ValueError):
+        graph.path(source=corridor)
+    with pytest.raises(ValueError):
+        graph.path(target=corridor)
+
+    maze = made(1, contest_mode=True)
+    with pytest.raises(ValueError):
+        maze.junctions().path(target=maze.forbidden.index(1))
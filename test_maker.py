@@ -0,0 +1,70 @@
+import sys
+
+import pytest
+
+from cell import Zone
+from direction import DIR
+from maker import ORDERS, MakerSteps
+from maze import Maze
+
+
+def carve(maze: Maze) -> None:
+    # the recursive backtracker the explicit stack replaced, drawing the same
+    # direction order per entered cell from the maze rng
+    visited: set[int] = set()
+    contest: int = maze.cell(maze.contest_end[0]).index if maze.contest_mode else -1
+    contest_dir: int = DIR.ALL.index(maze.contest_end[1])
+
+    def enter(index: int) -> None:
+        visited.add(index)
+        if maze.zones[index] == Zone.END.value:
+            return
+        for d in ORDERS[maze.rng.randrange(len(ORDERS))]:
+            neighbor: int = maze.links[4*index + d]
+            if neighbor < 0 or neighbor in visited or maze.forbidden[neighbor]:
+                continue
+            if neighbor == contest and d != contest_dir:
+                continue
+            maze.make.remove_wall(maze.cell(divmod(index, maze.width)), DIR.ALL[d])
+            enter(neighbor)
+
+    enter(maze.cell(maze.start_pos).index)
+
+
+@pytest.mark.parametrize('seed', range(6))
+@pytest.mark.parametrize('size', [(16, 16), (12, 20)])
+def test_same_as_recursive(seed, size):
+    maze: Maze = Maze(size=size, contest_mode=seed % 2 == 1, seed=seed)
+    maze.make(steps=[MakerSteps.ZONES, MakerSteps.PATH])
+    reference: Maze = Maze(size=size, contest_mode=seed % 2 == 1, seed=seed)
+    reference.make(steps=[MakerSteps.ZONES])
+    carve(reference)
+    assert maze.walls == reference.walls
+
+
+@pytest.mark.parametrize('seed, contest_mode, hash_code', [(1, False, 'cb96553b'), (2, True, 'b0e187d9'), (3, False, 'd330a67a')])
+def test_fixed_seed(seed, contest_mode, hash_code):
+    maze: Maze = Maze(size=(16, 16), contest_mode=contest_mode, seed=seed)
+    maze.make(steps=[MakerSteps.ZONES, MakerSteps.PATH])
+    assert maze.hash == hash_code
+
+
+def test_contest_entry():
+    for seed in range(10):
+        maze: Maze = Maze(size=(16, 16), contest_mode=True, seed=seed)
+        maze.make(steps=[MakerSteps.ZONES, MakerSteps.PATH])
+        (pos, direction) = maze.contest_end
+        field = maze.distances().field
+        end: int = maze.cell(pos).index
+        # the single path reaches the end only through the contest direction
+        assert field[end] > 0
+        assert [
+            d for d in range(4) if maze.adjacency[4*end + d] >= 0 and field[maze.adjacency[4*end + d]] == field[end] - 1
+        ] == [DIR.ALL.index(direction.opposite)]
+
+
+def test_past_the_recursion_limit():
+    # the longest carved branch of a 128x128 maze is far deeper than the limit
+    maze: Maze = Maze(size=(128, 128), seed=1)
+    maze.make(steps=[MakerSteps.ZONES, MakerSteps.PATH])
+    assert max(maze.distances().field) > sys.getrecursionlimit()
@@ -0,0 +1,45 @@
+import pytest
+
+from algorithm import Algorithm
+from cell import Cell, Zone
+from direction import DIR
+from maze import Maze
+
+
+def test_planes():
+    maze: Maze = Maze(size=(12, 20))
+    for plane in (maze.walls, maze.zones, maze.forbidden, maze.visited_bits, maze.path_bits):
+        assert isinstance(plane, bytearray) and len(plane) == 12*20
+    assert maze.walls == bytearray(b'\xFF')*(12*20)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_cell_view(made, seed):
+    maze: Maze = made(seed, size=(12, 20), contest_mode=seed == 1)
+    for index in range(len(maze.walls)):
+        cell: Cell = maze.cell(divmod(index, maze.width))
+        assert cell.index == index and cell.pos == (cell.y, cell.x)
+        assert cell.walls == maze.walls[index]
+        assert cell.zone == Zone(maze.zones[index])
+        assert cell.forbidden == bool(maze.forbidden[index])
+    assert {cell.pos for cell in maze.cells() if cell.zone == Zone.END} == maze.end_zone
+    assert all(maze.cell(pos).zone == Zone.START for pos in maze.start_zone)
+
+
+def test_cell_writes_the_planes(made):
+    maze: Maze = made(1)
+    cell: Cell = maze.cell((5, 6))
+    cell.walls = 0xF0 | DIR.UP.wall
+    assert maze.walls[cell.index] == 0xF0 | DIR.UP.wall
+    cell.forbidden = True
+    assert maze.forbidden[cell.index] == 1
+    cell.visited(Algorithm.BFS)
+    cell.path(Algorithm.DFS)
+    assert cell.is_visited(Algorithm.BFS) and not cell.is_visited(Algorithm.DFS)
+    assert cell.is_path(Algorithm.DFS) and cell.is_path()
+    maze.clear_marks()
+    assert not cell.is_visited() and not cell.is_path()
+
+    # views are equal by their place, not by their object
+    assert maze.cell((5, 6)) == cell and hash(maze.cell((5, 6))) == hash(cell)
+    assert maze.cell((5, 6)) != made(1).cell((5, 6))
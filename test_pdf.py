@@ -0,0 +1,19 @@
+import os
+
+from pdf import Converter
+
+
+def test_prune(tmp_path):
+    # the most recently used pdfs are kept up to the limit
+    converter: Converter = Converter(cache=str(tmp_path), limit=250)
+    for i in range(5):
+        (tmp_path/f'{i}.pdf').write_bytes(bytes(100))
+        os.utime(tmp_path/f'{i}.pdf', (1000+i, 1000+i))
+    (tmp_path/'other.txt').write_bytes(bytes(1000))
+    converter.prune()
+    assert sorted(os.listdir(tmp_path)) == ['3.pdf', '4.pdf', 'other.txt']
+
+
+def test_prune_without_cache(tmp_path):
+    Converter(cache=str(tmp_path/'missing')).prune()
+    assert not (tmp_path/'missing').exists()
@@ -0,0 +1,36 @@
+import pytest
+
+from algorithm import Algorithm
+from maze import Maze
+
+ALGORITHMS: list[Algorithm] = [algorithm for algorithm in Algorithm if algorithm != Algorithm._NONE]
+# every algorithm but dfs finds a shortest path
+SHORTEST: list[Algorithm] = [algorithm for algorithm in ALGORITHMS if algorithm != Algorithm.DFS]
+CASES: list[tuple[int, tuple[int, int], int, bool]] = [
+    (seed, size, remove_walls, seed % 2 == 1)
+    for seed in range(4)
+    for size, remove_walls in (((16, 16), 15), ((12, 20), 40), ((10, 10), 0))
+]
+
+
+def check(maze: Maze, algorithm: Algorithm) -> list[int]:
+    path: list[int] = [cell.index for cell in maze.paths[algorithm]]
+    assert path[0] == maze.cell(maze.start_pos).index and path[-1] == maze.cell(maze.end_pos).index
+    for current, following in zip(path, path[1:]):
+        assert following in maze.adjacency[4*current:4*current+4]
+        assert not maze.forbidden[following]
+    return path
+
+
+@pytest.mark.parametrize('seed, size, remove_walls, contest_mode', CASES)
+def test_equal_lengths(made, seed, size, remove_walls, contest_mode):
+    maze: Maze = made(seed, size=size, remove_walls=remove_walls, contest_mode=contest_mode)
+    assert maze.solve(algorithms=list(ALGORITHMS))
+    shortest: int = maze.distances().distance(maze.end_pos) + 1
+    for algorithm in ALGORITHMS:
+        path: list[int] = check(maze, algorithm)
+        if algorithm in SHORTEST:
+            assert len(path) == shortest, algorithm
+        else:
+            assert len(path) >= shortest
+
@@ -0,0 +1,51 @@
+import random
+
+from array import array
+from collections import deque
+
+import pytest
+
+from maze import Maze
+from wavefront import Wavefront, pack, spread
+
+
+def bfs(maze: Maze, sources: list[tuple[int, int]]) -> list[int]:
+    # cell by cell over the adjacency, as the reference
+    field: list[int] = [-1]*len(maze.walls)
+    queue: deque[int] = deque()
+    for y, x in sources:
+        index: int = y*maze.width + x
+        if not maze.forbidden[index] and field[index] < 0:
+            field[index] = 0
+            queue.append(index)
+    while queue:
+        current: int = queue.popleft()
+        for neighbor in maze.adjacency[4*current:4*current+4]:
+            if neighbor >= 0 and not maze.forbidden[neighbor] and field[neighbor] < 0:
+                field[neighbor] = field[current] + 1
+                queue.append(neighbor)
+    return field
+
+
+def test_pack_spread():
+    rng: random.Random = random.Random(0)
+    for size in (1, 7, 8, 9, 256, 301):
+        flags: bytes = bytes(rng.randrange(2) for _ in range(size))
+        board: int = pack(flags)
+        assert board == sum(1 << index for index, flag in enumerate(flags) if flag)
+        assert spread(board, size).to_bytes(size, 'little') == flags
+
+
+@pytest.mark.parametrize('seed', range(6))
+@pytest.mark.parametrize('size', [(16, 16), (12, 20)])
+def test_distances(made, seed, size):
+    maze: Maze = made(seed, size=size, contest_mode=seed % 2 == 1)
+    assert list(Wavefront([maze])()[0]) == bfs(maze, [maze.start_pos])
+    sources: list[tuple[int, int]] = [maze.start_pos, maze.end_pos, (size[0]//2, 1)]
+    assert list(Wavefront([maze])([sources])[0]) == bfs(maze, sources)
+
+
+def test_stacked_mazes(made):
+    mazes: list[Maze] = [made(seed, contest_mode=seed % 2 == 1) for seed in range(5)]
+    fields: list[array] = Wavefront(mazes)()
+    assert [list(field) for field in fields] == [bfs(maze, [maze.start_pos]) for maze in mazes]
@@ -0,0 +1,64 @@
+import random
+
+from array import array
+
+import pytest
+
+from direction import DIR
+from maze import SIZES, Maze, fold, links, zobrist
+
+
+def reference(maze: Maze) -> int:
+    # the xor of the keys of all standing walls, slot by slot
+    keys: array = zobrist(maze.height, maze.width)[0]
+    __: int = 0
+    for slot in range(len(keys)):
+        if maze.walls[slot >> 2] >> (slot & 3) & 1:
+            __ ^= keys[slot]
+    return __
+
+
+def test_fold():
+    rng: random.Random = random.Random(0)
+    for count in (1, 2, 3, 7, 64, 1000):
+        words: list[int] = [rng.getrandbits(64) for _ in range(count)]
+        xored: int = 0
+        for word in words:
+            xored ^= word
+        assert fold(sum(word << 64*i for i, word in enumerate(words)), count) == xored
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_incremental(made, seed):
+    maze: Maze = made(seed, size=(12, 20), contest_mode=seed % 2 == 1)
+    assert maze.zobrist == reference(maze)
+    rng: random.Random = random.Random(seed)
+    for _ in range(100):
+        y, x = rng.randrange(1, maze.height-1), rng.randrange(1, maze.width-1)
+        if rng.randrange(2):
+            maze.make.remove_wall(maze.cell((y, x)), rng.choice(DIR.ALL))
+        else:
+            maze.make.insert_wall(maze.cell((y, x)), rng.choice(DIR.ALL))
+        assert maze.zobrist == reference(maze)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_relink(made, seed):
+    maze: Maze = made(seed)
+    zobrist_: int = maze.zobrist
+    adjacency: array = array('i', maze.adjacency)
+    maze.adjacency = array('i', [-1])*len(adjacency)
+    maze.zobrist = 0
+    maze.relink()
+    assert maze.adjacency == adjacency
+    assert maze.zobrist == zobrist_
+    # a maze with every wall standing has the key of all of them
+    maze.walls[:] = bytes([0xFF])*len(maze.walls)
+    maze.relink()
+    assert maze.zobrist == zobrist(maze.height, maze.width)[1] and maze.adjacency.count(-1) == len(maze.adjacency)
+
+
+def test_bounded_caches():
+    for height in range(10, 10+2*SIZES):
+        Maze(size=(height, 12))
+    assert links.cache_info().currsize <= SIZES and zobrist.cache_info().currsize <= SIZES
@@ -5,61 +5,87 @@ if TYPE_CHECKING:
     from maze import Maze
 
 from algorithm import Algorithm
+from cell import Cell
+from direction import Dir
 from maker import MakerSteps
+from observer import Observer
+from terminal import Terminal
 
 
-class Visualizer:
+class Visualizer(Observer):
+    # prints the maze, subscribed to the maze's observers when verbose is set
     def __init__(self, maze: 'Maze'):
         self.maze: Maze = maze
+        self.terminal: Terminal = Terminal(maze=maze)
 
-    def __call__(self, paths: bool=True, visited: bool=False, guide: bool=False, step: bool=False, algorithm: Algorithm=Algorithm._NONE) -> None:
+    def __call__(self, paths: bool=True, visited: bool=False, guide: bool=False) -> None:
         if not self.maze: return
 
-        if step:
-            if self.maze.verbose == 2:
-                print("\033c")
-                if not self.maze.make.steps[MakerSteps.FINAL]:
-                    print(self.maze.__str__(paths=False, visited=False, guide=guide))
-                    print(self.maze_info(algorithm))
-                elif algorithm is not Algorithm._NONE:
-                    print(self.maze.__str__(algorithm=algorithm, paths=True, visited=True, guide=guide))
-                    print(self.maze_info(algorithm))
-                if algorithm in self.maze.solved:
-                    time.sleep(1)
-                else:
-                    time.sleep(0.01)
-                print("\033c")
-            elif self.maze.verbose == 1:
-                print("\033c")
-                if self.maze.make.steps[MakerSteps.FINAL] and algorithm is Algorithm._NONE and not self.maze.solved:
-                    print(self.maze.__str__(paths=False, visited=True, guide=guide))
-                    print(self.maze_info(algorithm))
-                    time.sleep(1)
-                elif algorithm in self.maze.solved:
-                    print(self.maze.__str__(algorithm=algorithm, paths=True, visited=True, guide=guide))
-                    print(self.maze_info(algorithm))
-                    time.sleep(1)
-                print("\033c")
+        print(self.maze.__str__(paths=paths, visited=visited, guide=guide))
 
+    def frame(self, algorithm: Algorithm, paths: bool, visited: bool, pause: float) -> None:
+        print("\033c")
+        print(self.maze.__str__(algorithm=algorithm, paths=paths, visited=visited))
+        print(self.maze_info(algorithm))
+        time.sleep(pause)
+        print("\033c")
+
+    # verbose 2 animates through the terminal renderer, which only rewrites the
+    # glyphs that changed and draws at a capped frame rate instead of sleeping
+
+    def on_visit(self, maze: 'Maze', index: int, algorithm: Algorithm) -> None:
+        if self.maze.verbose != 2:
+            return
+        if not self.maze.make.steps[MakerSteps.FINAL]:
+            self.terminal.show(algorithm, paths=False, visited=False)
+        elif algorithm is not Algorithm._NONE:
+            self.terminal.show(algorithm, paths=True, visited=True)
         else:
-            print(self.maze.__str__(paths=paths, visited=visited, guide=guide))
+            return
+        self.terminal.visit(index)
+        self.terminal.tick()
+
+    def on_wall_removed(self, maze: 'Maze', index: int, direction: Dir) -> None:
+        if self.maze.verbose == 2 and not self.maze.make.steps[MakerSteps.FINAL]:
+            self.terminal.show(Algorithm._NONE, paths=False, visited=False)
+            self.terminal.wall(index, direction)
+            self.terminal.tick()
+
+    def on_wall_inserted(self, maze: 'Maze', index: int, direction: Dir) -> None:
+        self.on_wall_removed(maze, index, direction)
+
+    def on_made(self, maze: 'Maze') -> None:
+        if self.maze.verbose == 2:
+            self.terminal.tick(force=True)
+            self.terminal.clear()
+        elif self.maze.verbose == 1 and self.maze.make.steps[MakerSteps.FINAL] and not self.maze.solved:
+            self.frame(Algorithm._NONE, paths=False, visited=True, pause=1)
+
+    def on_path(self, maze: 'Maze', path: list[Cell], algorithm: Algorithm) -> None:
+        if self.maze.verbose == 2:
+            self.terminal.show(algorithm, paths=True, visited=True)
+            for cell in path:
+                self.terminal.cell(cell.index)
+
+    def on_solved(self, maze: 'Maze', algorithm: Algorithm) -> None:
+        if self.maze.verbose == 2:
+            self.terminal.show(algorithm, paths=True, visited=True)
+            self.terminal.tick(force=True)
+            time.sleep(1)
+            self.terminal.clear()
+        else:
+            self.frame(algorithm, paths=True, visited=True, pause=1)
 
     
-    def maze_info(self, algorithm: Algorithm) -> str:
+    def maze_info(self, algorithm: Algorithm, visited: int=-1) -> str:
         if not self.maze: return ""
         
         ticks: int = 3
         tick: int = int(time.time()*2) % (ticks+1)
 
-        visited: int = 0
-        valid: int = 0
-
-        for row in self.maze.maze:
-            for cell in row:
-                if cell.is_visited(algorithm):
-                    visited += 1
-                if not cell.forbidden:
-                    valid += 1
+        if visited < 0:
+            visited = sum([1 for bits in self.maze.visited_bits if bits & 1 << algorithm.value])
+        valid: int = self.maze.forbidden.count(0)
 
         __: str = f"> "
         if not self.maze.make.steps[MakerSteps.FINAL]:
@@ -85,7 +111,7 @@ class Visualizer:
         analysis_maze: dict[str, int] = self.maze.analyze()
 
         __: str = f"> Maze Analysis"
-        __ += f"{(44-len(self.maze.hash))*' '} hash {self.maze.hash}"
+        __ += f"{(38-len(self.maze.hash)-len(str(self.maze.seed)))*' '} seed {self.maze.seed} hash {self.maze.hash}"
         __ += f"\n\n"
         __ += f"  > Maze Generator:  {self.maze.height}x{self.maze.width} || {self.maze.height*self.maze.width} [={analysis_maze['valid']:3}] cells | {self.maze.remove_walls:2} walls removed\n"
         __ += f"                     count || walls {analysis_maze['walls']:3} | poles {analysis_maze['poles']:3} | branches {analysis_maze['branches']:2}\n"
@@ -106,7 +132,9 @@ class Visualizer:
                 __ += f"     path not found      ||"
             else:
                 __ += f" {analysis['length']:6} | {analysis['turns']:5} | {analysis['branches']:6} ||"
-            __ += f" {analysis['visited']:8} | {analysis['length']/analysis['visited']*100:5.1f} | {analysis['visited']/analysis_maze['valid']*100:5.1f}\n"
+            path_share: float = analysis['length']/analysis['visited']*100 if analysis['visited'] else 0.0
+            maze_share: float = analysis['visited']/analysis_maze['valid']*100 if analysis_maze['valid'] else 0.0
+            __ += f" {analysis['visited']:8} | {path_share:5.1f} | {maze_share:5.1f}\n"
         return __
 
 
@@ -0,0 +1,129 @@
+import sys
+
+from array import array
+from functools import lru_cache
+
+from typing import TYPE_CHECKING, Iterator
+if TYPE_CHECKING:
+    from maze import Maze
+
+from direction import DIR
+
+# cell sets are python ints used as bitboards, bit i is the cell y*width+x,
+# so a whole frontier moves with a handful of shifts and masks per step;
+# mazes of the same size are stacked one after the other into one board
+
+LANES: int = array('i').itemsize
+
+# wall byte -> 1 if the wall in that direction is open
+OPEN: list[bytes] = [bytes(0 if walls & direction.wall else 1 for walls in range(256)) for direction in DIR.ALL]
+ALLOWED: bytes = bytes(0 if forbidden else 1 for forbidden in range(256))
+
+
+def pack(flags: bytes) -> int:
+    # one flag byte (0 or 1) per cell -> bitboard; flags[t::8] are the cells
+    # 8j+t, read as an int their flags land on bit 8j and are shifted by t
+    __: int = 0
+    for t in range(8):
+        __ |= int.from_bytes(flags[t::8], 'little') << t
+    return __
+
+def spread(board: int, size: int) -> int:
+    # bitboard -> int with one byte (0 or 1) per cell, the inverse of pack
+    length: int = (size+7)//8
+    ones: int = int.from_bytes(b'\x01'*length, 'little')
+    flags: bytearray = bytearray(size)
+    for t in range(8):
+        flags[t::8] = ((board >> t) & ones).to_bytes(length, 'little')[:len(range(t, size, 8))]
+    return int.from_bytes(flags, 'little')
+
+@lru_cache(maxsize=None)
+def inside(height: int, width: int) -> list[bytes]:
+    # per direction 1 where the neighbor is on the grid, keeps stacked mazes apart
+    return [
+        bytes(1 if 0 <= y+direction.y < height and 0 <= x+direction.x < width else 0 for y in range(height) for x in range(width))
+        for direction in DIR.ALL
+    ]
+
+
+class Wavefront:
+    def __init__(self, mazes: list['Maze']):
+        self.mazes: list['Maze'] = mazes
+        self.width: int = mazes[0].width
+        self.cells: int = mazes[0].height*mazes[0].width
+        self.size: int = len(mazes)*self.cells
+
+        walls: bytes = b''.join(maze.walls for maze in mazes)
+        forbidden: bytes = b''.join(maze.forbidden for maze in mazes)
+        geometry: list[bytes] = inside(mazes[0].height, mazes[0].width)
+
+        self.allowed: int = pack(forbidden.translate(ALLOWED))
+        self.up, self.right, self.down, self.left = [
+            pack(walls.translate(OPEN[d])) & pack(geometry[d]*len(mazes)) for d in range(4)
+        ]
+
+    def board(self, sources: list[list[tuple[int, int]]]) -> int:
+        __: int = 0
+        for offset, positions in enumerate(sources):
+            for y, x in positions:
+                __ |= 1 << (offset*self.cells + y*self.width + x)
+        return __
+
+    def expand(self, frontier: int) -> int:
+        width: int = self.width
+        return (
+            (frontier & self.up) >> width |
+            (frontier & self.right) << 1 |
+            (frontier & self.down) << width |
+            (frontier & self.left) >> 1
+        )
+
+    def layers(self, sources: list[list[tuple[int, int]]]) -> Iterator[tuple[int, int]]:
+        # yields (layer, unseen): the cells at distance 0, 1, 2, ... from the
+        # sources together with the allowed cells not reached so far
+        frontier: int = self.board(sources) & self.allowed
+        unseen: int = self.allowed ^ frontier
+        while frontier:
+            yield frontier, unseen
+            frontier = self.expand(frontier) & unseen
+            unseen ^= frontier
+
+    def __call__(self, sources: list[list[tuple[int, int]]]=[]) -> list[array]:
+        # one flat distance array (y*width+x) per maze, -1 where unreachable,
+        # sources default to the start of each maze
+        if not sources:
+            sources = [[maze.start_pos] for maze in self.mazes]
+
+        # bit plane b holds the cells whose distance has bit b set; those are
+        # runs of 2**b consecutive layers, so each run is the difference of
+        # two unseen snapshots: one xor when it opens and one when it closes
+        planes: list[int] = []
+        marks: dict[int, int] = {}
+        unseen: int = self.allowed
+        for distance, (layer, unseen_) in enumerate(self.layers(sources)):
+            if distance:
+                marks[(distance & -distance).bit_length()-1] = unseen
+            unseen = unseen_
+            bit: int = 0
+            while (distance+1) >> bit & 1 == 0 and bit in marks:
+                planes += [0]*(bit+1-len(planes))
+                planes[bit] |= marks.pop(bit) ^ unseen
+                bit += 1
+        for bit, mark in marks.items():
+            planes += [0]*(bit+1-len(planes))
+            planes[bit] |= mark ^ unseen
+
+        # assemble the int lanes one byte column at a time, unreached cells
+        # get all bits set which reads back as -1
+        unreached: int = spread(((1 << self.size) - 1) & ~self.allowed | unseen, self.size) * 0xFF
+        lanes: bytearray = bytearray(self.size*LANES)
+        for column in range(LANES):
+            __: int = unreached
+            for bit, plane in enumerate(planes[8*column:8*column+8]):
+                __ |= spread(plane, self.size) << bit
+            offset: int = column if sys.byteorder == 'little' else LANES-1-column
+            lanes[offset::LANES] = __.to_bytes(self.size, 'little')
+
+        field: array = array('i')
+        field.frombytes(lanes)
+        return [field[offset*self.cells:(offset+1)*self.cells] for offset in range(len(self.mazes))]